@@ -0,0 +1,138 @@
+"""
+Compare the sqlite connection profiles from `lib.models.DB_PROFILES`
+
+For each profile a fresh database is populated and then:
+
+* autosave - one scene is updated and committed `--saves` times, the way
+  the editor's debounced autosave does, and the commit latency recorded.
+* reads - chapter trees are fetched for `--duration` seconds by a reader
+  thread while the autosave loop keeps writing.
+
+    python -m benchmarks.db_profile --scenes 40 --saves 200
+"""
+import pathlib
+import statistics
+import tempfile
+import threading
+import time
+import typing as T
+
+from tap import Tap
+
+from lib import models
+
+
+class BenchArgs(Tap):
+    """
+    SQLite profile benchmark
+    """
+
+    chapters: int = 20  # Chapters in the generated book
+    scenes: int = 20  # Scenes per chapter
+    saves: int = 200  # Autosave commits to time
+    duration: float = 3.0  # Seconds to run the concurrent read test
+    profiles: T.List[str] = list(models.DB_PROFILES)  # Profiles to compare
+
+
+def populate(session, chapters: int, scenes: int) -> models.Book:
+    book = models.Book(title="Benchmark")
+    paragraph = "All work and no play makes a dull scene. " * 40
+    for chapter_idx in range(chapters):
+        chapter = models.Chapter(title=f"Chapter {chapter_idx}")
+        for scene_idx in range(scenes):
+            chapter.scenes.append(
+                models.Scene(title=f"Scene {scene_idx}", content=paragraph)
+            )
+        book.chapters.append(chapter)
+
+    session.add(book)
+    session.commit()
+    return book
+
+
+def autosave(Session, scene_uid: str, saves: int) -> list[float]:
+    latencies = []
+    session = Session()
+    for idx in range(saves):
+        scene = models.Scene.Fetch_by_uid(session, scene_uid)
+        scene.update(dict(content=f"Revision {idx} " * 200))
+
+        started = time.perf_counter()
+        session.commit()
+        latencies.append(time.perf_counter() - started)
+
+    session.close()
+    return latencies
+
+
+def reader(Session, chapter_uids: list[str], stop: threading.Event) -> int:
+    reads = 0
+    session = Session()
+    while stop.is_set() is False:
+        chapter_uid = chapter_uids[reads % len(chapter_uids)]
+        models.Chapter.Fetch_by_uid(session, chapter_uid, plan="tree").asdict(True)
+        session.rollback()
+        reads += 1
+
+    session.close()
+    return reads
+
+
+def run_profile(args: BenchArgs, profile: str, workdir: pathlib.Path) -> dict:
+    engine, Session = models.connect(workdir / f"{profile}.sqlite3", profile=profile)
+    session = Session()
+    book = populate(session, args.chapters, args.scenes)
+    scene_uid = book.chapters[0].scenes[0].uid
+    chapter_uids = [chapter.uid for chapter in book.chapters]
+    session.close()
+
+    latencies = autosave(Session, scene_uid, args.saves)
+
+    # Reads racing the writer, each thread has its own session
+    stop = threading.Event()
+    reads = []
+    read_thread = threading.Thread(
+        target=lambda: reads.append(reader(Session, chapter_uids, stop))
+    )
+    read_thread.start()
+    write_thread = threading.Thread(
+        target=autosave, args=(Session, scene_uid, args.saves)
+    )
+    write_thread.start()
+    time.sleep(args.duration)
+    stop.set()
+    read_thread.join()
+    write_thread.join()
+
+    Session.remove()
+    engine.dispose()
+
+    return dict(
+        profile=profile,
+        commit_median_ms=statistics.median(latencies) * 1000,
+        commit_p95_ms=statistics.quantiles(latencies, n=20)[-1] * 1000,
+        reads_per_sec=reads[0] / args.duration,
+    )
+
+
+def main():
+    args = BenchArgs().parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        results = [
+            run_profile(args, profile, pathlib.Path(workdir))
+            for profile in args.profiles
+        ]
+
+    print(f"{'profile':<12} {'commit p50':>12} {'commit p95':>12} {'reads/s':>10}")
+    for result in results:
+        print(
+            f"{result['profile']:<12} "
+            f"{result['commit_median_ms']:>10.2f}ms "
+            f"{result['commit_p95_ms']:>10.2f}ms "
+            f"{result['reads_per_sec']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
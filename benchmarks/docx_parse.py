@@ -0,0 +1,107 @@
+"""
+Compare paragraph extraction in `lib.importer.docx`
+
+`find` is the find/findall walk DocxParagraph.Load used to do, with a
+normalize call per text run.  `xpath` is the current DocxParagraph.Load on
+precompiled XPath expressions.  Both run over the body paragraphs of every
+document given, already parsed so only the extraction is timed.
+
+    python -m benchmarks.docx_parse --rounds 200 tests/data/*.docx
+"""
+import pathlib
+import time
+import typing as T
+import unicodedata
+from zipfile import ZipFile
+
+from lxml.etree import fromstring, _Element
+from tap import Tap
+
+from lib.importer.docx import DocxParagraph, DocxProperty
+from lib.importer.tags_and_ns import TAGS
+
+HERE = pathlib.Path(__file__).parent
+
+
+class BenchArgs(Tap):
+    """
+    DOCX paragraph extraction benchmark
+    """
+
+    documents: T.List[pathlib.Path] = sorted(
+        (HERE.parent / "tests" / "data").glob("*.docx")
+    )
+    rounds: int = 100  # Times every document's paragraphs are extracted
+
+    def configure(self):
+        self.add_argument("documents", nargs="*")
+
+
+def find_load(src_elm: _Element) -> DocxParagraph:
+    property_xml = src_elm.find(TAGS.ParaStyle.value)
+    property = (
+        DocxProperty.Load(property_xml)
+        if property_xml is not None
+        else DocxProperty.Default()
+    )
+
+    body = []
+    hard_break = False
+    for run_elm in src_elm.findall(TAGS.Run.value):
+        if run_elm.find(TAGS.PageBreak.value) is not None:
+            hard_break = True
+
+        for text_elm in run_elm.findall(TAGS.Text.value):
+            body.append(unicodedata.normalize("NFKD", text_elm.text))
+
+    paraId = src_elm.attrib[TAGS.paraId.value]
+    return DocxParagraph(body, property, paraId, hard_break=hard_break)
+
+
+def fields(paragraph: DocxParagraph):
+    return (
+        paragraph.body,
+        paragraph.properties.style_name,
+        paragraph.properties.orientation,
+        paragraph.paraId,
+        paragraph.hard_break,
+    )
+
+
+def time_loader(
+    loader: T.Callable[[_Element], DocxParagraph], elements: list[_Element], rounds
+):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for element in elements:
+            loader(element)
+
+    return time.perf_counter() - started
+
+
+def main():
+    args = BenchArgs().parse_args()
+
+    elements = []
+    for document in args.documents:
+        body = fromstring(ZipFile(document).read("word/document.xml"))[0]
+        elements.extend(body.findall(TAGS.ParaType.value))
+
+    for element in elements:
+        assert fields(find_load(element)) == fields(DocxParagraph.Load(element))
+
+    count = len(elements) * args.rounds
+    print(f"{len(elements)} paragraphs from {len(args.documents)} documents")
+    results = {}
+    for name, loader in (("find", find_load), ("xpath", DocxParagraph.Load)):
+        results[name] = time_loader(loader, elements, args.rounds)
+        print(
+            f"{name:>6}: {results[name]:.3f}s"
+            f" {count / results[name]:,.0f} paragraphs/s"
+        )
+
+    print(f"speedup: {results['find'] / results['xpath']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Compare the one row lookups behind `Fetch_by_uid` and friends
+
+`select` builds the statement on every call, like the Fetch_by_* methods
+used to.  `lambda` is the same lookup through `lambda_stmt`.  `cached` is
+`models.fetch_by` on a session that doesn't hold the row, so it runs the
+prebuilt `lookup_stmt`.  `loaded` is `models.fetch_by` once the session
+already holds the row and answers from the identity map.
+
+    python -m benchmarks.lookups --rows 2000 --rounds 5000
+"""
+import pathlib
+import random
+import tempfile
+import time
+import typing as T
+
+from sqlalchemy import lambda_stmt, select
+from tap import Tap
+
+from lib import models
+
+
+class BenchArgs(Tap):
+    """
+    Lookup by uid benchmark
+    """
+
+    rows: int = 1000  # Scenes in the database
+    rounds: int = 2000  # Lookups timed per approach
+
+
+def select_lookup(session, uid):
+    stmt = select(models.Scene).where(models.Scene.uid == uid)
+    return session.scalars(stmt).one()
+
+
+def lambda_lookup(session, uid):
+    stmt = lambda_stmt(lambda: select(models.Scene).where(models.Scene.uid == uid))
+    return session.scalars(stmt).one()
+
+
+def cached_lookup(session, uid):
+    return models.fetch_by(session, models.Scene, "uid", uid)
+
+
+def time_lookups(session, lookup: T.Callable, uids: T.List[str], held: bool) -> float:
+    # Warm up SQLAlchemy's compiled cache and the lambda analysis
+    for uid in uids[:50]:
+        lookup(session, uid)
+    session.expunge_all()
+
+    # The identity map only holds weak references
+    rows = session.scalars(select(models.Scene)).all() if held is True else []
+
+    started = time.perf_counter()
+    for uid in uids:
+        lookup(session, uid)
+        if held is False:
+            session.expunge_all()
+    elapsed = time.perf_counter() - started
+
+    del rows
+    session.expunge_all()
+    return elapsed
+
+
+def main():
+    args = BenchArgs().parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, Session = models.connect(pathlib.Path(tmp) / "lookups.sqlite3")
+        session = Session()
+
+        book = models.Book(title="Lookups")
+        chapter = models.Chapter(title="Chapter 1")
+        chapter.scenes.extend(
+            models.Scene(title=f"Scene {idx}") for idx in range(args.rows)
+        )
+        book.chapters.append(chapter)
+        session.add(book)
+        session.commit()
+
+        uids = [scene.uid for scene in chapter.scenes]
+        session.expunge_all()
+        picks = [random.choice(uids) for _ in range(args.rounds)]
+
+        results = {}
+        for name, lookup, held in (
+            ("select", select_lookup, False),
+            ("lambda", lambda_lookup, False),
+            ("cached", cached_lookup, False),
+            ("loaded", cached_lookup, True),
+        ):
+            results[name] = time_lookups(session, lookup, picks, held)
+            print(
+                f"{name:>6}: {results[name]:.3f}s"
+                f" {results[name] / args.rounds * 1e6:,.1f}us per lookup"
+            )
+
+        for name in ("lambda", "cached", "loaded"):
+            print(f"{name} speedup: {results['select'] / results[name]:.2f}x")
+
+        session.close()
+        Session.remove()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
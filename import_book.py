@@ -1,5 +1,32 @@
-import tap
+"""
+Headless directory importer
+
+Imports every document in a directory as a new book through the same job
+pipeline the import dialog uses, without starting pywebview, so manuscripts
+can be loaded from scripts and cron.  Progress goes to stderr and a JSON
+summary with per stage timings goes to stdout.
+
+    python import_book.py --database book.sqlite3 --jobs 4 ~/manuscripts/novel
+"""
+import json
 import pathlib
+import re
+import sys
+import time
+import typing as T
+from zipfile import BadZipFile
+
+import tap
+from lxml.etree import XMLSyntaxError
+
+from lib import models
+from lib.api import BCAPI
+from lib.app_types import DocumentFile, InitialSettings
+from lib.application import BCApplication
+from lib.importer.preview import preview_document
+
+HERE = pathlib.Path(__file__).parent
+FINISHED = ("done", "failed", "cancelled")
 
 
 class MainArgs(tap.Tap):
@@ -8,6 +35,13 @@ class MainArgs(tap.Tap):
     """
 
     target_dir: pathlib.Path  # Target book directory
+    database: pathlib.Path = pathlib.Path("test.sqlite3")  # Database to import into
+    title: T.Optional[str] = None  # Book title, defaults to the directory's name
+    jobs: T.Optional[int] = None  # Parse processes, 0 for one per CPU
+    status: T.Optional[str] = None  # Default scene status for the imported scenes
+    status_color: str = "blue"  # Color of the default scene status
+    dry_run: bool = False  # List and count the documents without importing
+    quiet: bool = False  # No progress bar
 
     def configure(self) -> None:
         self.add_argument(
@@ -15,31 +49,154 @@ class MainArgs(tap.Tap):
         )
 
 
-def main():
-    args = MainArgs().parse_args()
+def natural_key(name: str) -> T.List[T.Union[int, str]]:
+    """Orders "Chapter 2" before "Chapter 10" """
+    return [
+        int(part) if part.isdigit() else part
+        for part in re.split(r"(\d+)", name.lower())
+    ]
+
+
+def progress_bar(done: int, total: int, message: str, width=30) -> str:
+    fraction = done / total if total > 0 else 1.0
+    filled = int(width * fraction)
+    return f"\r[{'#' * filled}{'.' * (width - filled)}] {fraction:6.1%} {message}"
+
 
-    print(f"Will import from {args.target_dir} with title `{args.target_dir.name}`")
+def list_documents(api: BCAPI, target_dir: pathlib.Path) -> T.List[DocumentFile]:
+    documents = api.importer_list_files(str(target_dir))["documents"]
+    return sorted(documents, key=lambda document: natural_key(document["name"]))
 
-    targets = []
 
-    for element in args.target_dir.iterdir():
-        if any(
-            [
-                element.is_file() is False,
-                element.name.startswith("~"),
-                element.name.startswith("_"),
-                element.suffix != ".docx",
-            ]
-        ):
+def dry_run(args: MainArgs, timings: T.Dict[str, float]) -> dict:
+    started = time.perf_counter()
+    # importer_list_files never touches the database
+    documents = list_documents(BCAPI(None), args.target_dir)
+    timings["list"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    files, unreadable = [], []
+    for document in documents:
+        path = pathlib.Path(document["path"]) / document["name"]
+        try:
+            words = preview_document(path)["words"]
+        except (OSError, BadZipFile, KeyError, XMLSyntaxError) as exc:
+            # Same as the preview job, one bad document doesn't end the run
+            if args.quiet is False:
+                print(f"Could not read {document['name']}: {exc}", file=sys.stderr)
+            unreadable.append(document["name"])
             continue
 
-        print(f"Would import {element.name}")
-        targets.append(element)
+        files.append(dict(name=document["name"], size=document["size"], words=words))
+        if args.quiet is False:
+            print(f"Would import {document['name']}", file=sys.stderr)
+    timings["preview"] = time.perf_counter() - started
+
+    return dict(
+        dry_run=True,
+        documents=len(documents),
+        bytes=sum(file["size"] for file in files),
+        words=sum(file["words"] for file in files),
+        files=files,
+        unreadable=unreadable,
+    )
+
+
+def run_import(args: MainArgs, timings: T.Dict[str, float]) -> dict:
+    started = time.perf_counter()
+    app = BCApplication(args.database, here=HERE)
+    timings["open"] = time.perf_counter() - started
+    try:
+        if args.jobs is not None:
+            app.import_jobs = args.jobs
+
+        api = BCAPI(app)
+
+        started = time.perf_counter()
+        documents = list_documents(api, args.target_dir)
+        timings["list"] = time.perf_counter() - started
+
+        api.importer_reset_batch()
+        api.importer_add2_batch("documents", documents)
+        api.importer_add2_batch("book_path", str(args.target_dir))
+        api.importer_add2_batch(
+            "name_and_status",
+            InitialSettings(
+                book_name=args.title or args.target_dir.name,
+                have_default_status=args.status is not None,
+                default_status=args.status or "",
+                status_color=args.status_color,
+            ),
+        )
+
+        started = time.perf_counter()
+        # Reporters only matter with a window, see BCApplication.callback
+        job_uid = api.importer_process_batch("headless")
+        job = api.job_status(job_uid)
+        while job["status"] not in FINISHED:
+            if args.quiet is False:
+                print(
+                    progress_bar(job["bytes_done"], job["bytes_total"], job["message"]),
+                    end="",
+                    file=sys.stderr,
+                )
+            time.sleep(0.1)
+            job = api.job_status(job_uid)
+        timings["import"] = time.perf_counter() - started
+
+        if args.quiet is False:
+            print(
+                progress_bar(job["bytes_done"], job["bytes_total"], job["status"]),
+                file=sys.stderr,
+            )
+
+        with app.get_db() as session:
+            checkpoint = models.Job.Fetch_by_uid(session, job_uid).checkpoint
+            timings.update(checkpoint.get("timings", {}))
+
+            summary = dict(
+                dry_run=False,
+                database=str(args.database),
+                job_id=job_uid,
+                status=job["status"],
+                error=job["error"],
+                documents=len(documents),
+                bytes=job["bytes_total"],
+            )
+            if job["status"] == "done":
+                book = models.Book.Fetch_by_UID(session, job["result"])
+                summary.update(
+                    book_id=book.uid,
+                    chapters=len(book.chapters),
+                    scenes=sum(len(chapter.scenes) for chapter in book.chapters),
+                    words=sum(chapter.words for chapter in book.chapters),
+                )
+
+        return summary
+    finally:
+        app.shutdown()
+
+
+def main():
+    args = MainArgs(underscores_to_dashes=True).parse_args()
+    if args.target_dir.is_dir() is False:
+        sys.exit(f"{args.target_dir} is not a directory")
+
+    timings = dict()
+    started = time.perf_counter()
+    if args.dry_run is True:
+        summary = dry_run(args, timings)
+    else:
+        summary = run_import(args, timings)
+    timings["total"] = time.perf_counter() - started
 
-    reordered = sorted(targets, key=lambda elm: elm.name.lower())
+    summary["timings"] = {
+        stage: round(seconds, 4) for stage, seconds in timings.items()
+    }
+    print(json.dumps(summary, indent=2))
 
-    for target in reordered:
-        print(target)
+    if summary.get("status", "done") != "done":
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+import os
 import pathlib
 import typing as T
 import logging
@@ -10,9 +11,9 @@ import webview  # type: ignore
 from sqlalchemy.exc import IntegrityError
 
 from .book2disk import Book2Disk
-from .app_types import BatchSettings, ImportMessage, ImportChapter
+from .app_types import BatchSettings
 from .scene_processor import SceneProcessor2 as SceneProcessor
-from .application import BCApplication
+from .application import BCApplication, writes
 from . import models
 from .log_helper import getLogger
 from .app_types import (
@@ -21,6 +22,14 @@ from .app_types import (
     BookTypes,
     DocumentFile,
     ImportedBook,
+    OrderType,
+    Delta,
+    JobStatus,
+    JobType,
+    SyncReport,
+    CacheStats,
+    NotModified,
+    BookReferences,
 )
 from .app_types import (
     SettingType as Setting,
@@ -31,7 +40,33 @@ from .app_types import (
     SceneStatusType as SceneStatus,
 )
 
-from lib.importer.chapter_importer import ChapterImporter
+from lib.importer import batch as import_batch
+from lib.importer.sync import is_document
+from lib.response_cache import Tag
+
+
+def fields_key(fields: T.Optional[list[str]]) -> T.Optional[T.Tuple[str, ...]]:
+    return None if fields is None else tuple(fields)
+
+
+def book_tags(session, book: models.Book) -> T.List[Tag]:
+    """A book tree shows every chapter and scene plus the scene statuses"""
+    chapter_ids = session.execute(
+        models.select(models.Chapter.id).where(models.Chapter.book_id == book.id)
+    ).scalars()
+    return [("Book", book.id), ("Statuses", book.id)] + [
+        ("Chapter", chapter_id) for chapter_id in chapter_ids
+    ]
+
+
+def chapter_tags(chapter: models.Chapter) -> T.List[Tag]:
+    """("Chapters", book id) covers bulk statements over every chapter"""
+    return [
+        ("Chapter", chapter.id),
+        ("Chapters", chapter.book_id),
+        ("Statuses", chapter.book_id),
+        ("Characters", chapter.book_id),
+    ]
 
 
 class BCAPI:
@@ -46,6 +81,7 @@ class BCAPI:
         self.app = app
         self.data_store = dict()
         self.log = getLogger(__name__)
+        self.writer = Book2Disk()
 
     def info(self, message: str):
         self.log.info("Frontend says `{}`", message)
@@ -53,53 +89,91 @@ class BCAPI:
     def alert(self, message: str):
         return self.app.main_window.create_confirmation_dialog("Problem", message)
 
-    def list_books(self, stripped: bool = True) -> list[Book]:
+    def list_books(
+        self, stripped: bool = True, fields: T.Optional[list[str]] = None
+    ) -> list[Book]:
         with self.app.get_db() as session:
             return [
-                book.asdict(stripped=stripped)
-                for book in models.Book.Fetch_All(session)
+                book.asdict(stripped=stripped, fields=fields)
+                for book in models.Book.Fetch_All(
+                    session,
+                    plan="tree" if stripped else "chapter_editor",
+                    fields=fields,
+                )
             ]
 
-    def get_current_book(self, stripped: bool = True) -> T.Optional[models.Book]:
-        if self.app.has_active_book:
-            with self.app.get_db() as session:
-                book = self.app.get_book(session)
-                return book.asdict(stripped=stripped) if book is not None else None
+    def get_current_book(
+        self,
+        stripped: bool = True,
+        fields: T.Optional[list[str]] = None,
+        version: T.Optional[str] = None,
+    ) -> T.Optional[T.Union[models.Book, NotModified]]:
+        """Answers NotModified when `version` is still the book's version"""
+        if self.app.has_active_book is False:
+            return None
+
+        def build(session):
+            book = self.app.get_book(
+                session,
+                plan="tree" if stripped else "chapter_editor",
+                fields=fields,
+            )
+            data = book.asdict(stripped=stripped, fields=fields)
+            return data, book_tags(session, book)
+
+        # pysqlite issues no BEGIN for SELECTs, each statement sees the latest
+        # commit, so the version can change between the check and the build.
+        # That's harmless: the payload carries the version it was built at and
+        # the cache key the version checked, which later checks move past.
+        with self.app.get_db() as session:
+            current = models.fetch_version(
+                session, models.Book, models.Book.id == self.app.book_id
+            )
+            if version == current:
+                return NotModified(type="not_modified", version=current)
 
-        return None
+            # The version in the key keeps a lagging entry from being served
+            key = ("get_current_book", current, stripped, fields_key(fields))
+            return self.app.responses.fetch(self.app, key, build)
 
     def set_current_book(self, book_uid: UniqueId) -> Book:
         with self.app.get_db() as session:
-            book = models.Book.Fetch_by_UID(session, book_uid)
+            book = models.Book.Fetch_by_UID(session, book_uid, plan="tree")
             self.app.book_id = book.id
             return book.asdict()
 
-    def update_book(self, changed_book: Book) -> Book:
-        with self.app.get_db() as session:
-            book = models.Book.Fetch_by_UID(session, changed_book["id"])  # type: ignore
-            book.update(changed_book)
-            self.writer.CheckBook(session, changed_book["id"])
-            session.commit()
-            return book.asdict(True)
+    @writes
+    def update_book(
+        self, changed_book: Book, delta: bool = False
+    ) -> T.Union[Book, Delta]:
+        return self.book_update(changed_book["id"], changed_book, delta)
 
-    def book_update(self, book_uid: UniqueId, changeset: Book) -> Book:
+    @writes
+    def book_update(
+        self, book_uid: UniqueId, changeset: Book, delta: bool = False
+    ) -> T.Union[Book, Delta]:
         with self.app.get_db() as session:
             book = models.Book.Fetch_by_UID(session, book_uid)
             book.update(changeset)
             self.writer.CheckBook(session, book_uid)
             session.commit()
-            return book.asdict(True)
 
-    def book_change_title(self, book_uid: UniqueId, new_title: str) -> Book:
-        return self.update_book_title(book_uid, new_title)
+            if delta is True:
+                return Delta(book=book.asdelta())
 
-    def update_book_title(self, book_uid: UniqueId, new_title: str) -> Book:
-        with self.app.get_db() as session:
-            book = models.Book.Fetch_by_UID(session, book_uid)
-            book.title = new_title
-            self.writer.CheckBook(session, book_uid)
-            session.commit()
-            return book.asdict(True)
+            return models.Book.Fetch_by_Id(session, book.id, plan="tree").asdict(True)
+
+    @writes
+    def book_change_title(
+        self, book_uid: UniqueId, new_title: str, delta: bool = False
+    ) -> T.Union[Book, Delta]:
+        return self.update_book_title(book_uid, new_title, delta)
+
+    @writes
+    def update_book_title(
+        self, book_uid: UniqueId, new_title: str, delta: bool = False
+    ) -> T.Union[Book, Delta]:
+        return self.book_update(book_uid, dict(title=new_title), delta)
 
     def book_simple_fetch(self, book_uid: UniqueId) -> Book:
         return self.fetch_book_simple(book_uid)
@@ -114,6 +188,7 @@ class BCAPI:
     def book_create_managed(self, book_name: str) -> Book:
         return self.create_managed_book(book_name)
 
+    @writes
     def create_managed_book(self, book_name: str) -> Book:
         warnings.warn("To deprecate", DeprecationWarning)
         with self.app.get_db() as session:
@@ -123,6 +198,7 @@ class BCAPI:
             session.commit()
             return book.asdict()
 
+    @writes
     def book_delete(self, book_uid: UniqueId) -> bool:
         with self.app.get_db() as session:
             models.Book.Delete(session, book_uid)
@@ -149,7 +225,9 @@ class BCAPI:
         with self.app.get_db() as session:
             return [
                 chapter.asdict()
-                for chapter in models.Book.Fetch_by_UID(book_id).chapters
+                for chapter in models.Book.Fetch_by_UID(
+                    session, book_id, plan="chapter_editor"
+                ).chapters
             ]
 
     def fetch_chapters(self) -> list[Chapter]:
@@ -162,9 +240,33 @@ class BCAPI:
 
         return []
 
-    def chapter_fetch(self, chapter_uid: UniqueId, stripped: bool = False) -> Chapter:
+    def chapter_fetch(
+        self,
+        chapter_uid: UniqueId,
+        stripped: bool = False,
+        fields: T.Optional[list[str]] = None,
+        version: T.Optional[str] = None,
+    ) -> T.Union[Chapter, NotModified]:
+        """Answers NotModified when `version` is still the chapter's version"""
+
+        def build(session):
+            chapter = models.Chapter.Fetch_by_uid(
+                session,
+                chapter_uid,
+                plan="tree" if stripped else "chapter_editor",
+                fields=fields,
+            )
+            return chapter.asdict(stripped, fields=fields), chapter_tags(chapter)
+
         with self.app.get_db() as session:
-            return models.Chapter.Fetch_by_uid(session, chapter_uid).asdict(stripped)
+            current = models.fetch_version(
+                session, models.Chapter, models.Chapter.uid == chapter_uid
+            )
+            if version == current:
+                return NotModified(type="not_modified", version=current)
+
+            key = ("chapter_fetch", current, stripped, fields_key(fields))
+            return self.app.responses.fetch(self.app, key, build)
 
     def chapter_fetch_index(self, chapter_uid: UniqueId) -> Chapter:
         return self.chapter_fetch(chapter_uid, True)
@@ -172,37 +274,65 @@ class BCAPI:
     def fetch_chapter(self, chapter_id: UniqueId, stripped: bool = False) -> Chapter:
         warnings.warn("To deprecate", DeprecationWarning)
         with self.app.get_db() as session:
-            return models.Chapter.Fetch_by_uid(session, chapter_id).asdict(stripped)
+            return models.Chapter.Fetch_by_uid(
+                session, chapter_id, plan="tree" if stripped else "chapter_editor"
+            ).asdict(stripped)
 
     def fetch_chapter_index(self, chapter_id: UniqueId):
         return self.fetch_chapter(chapter_id, stripped=True)
 
-    def update_chapter(self, chapter_id: UniqueId, chapter_data: Chapter) -> Chapter:
+    @writes
+    def update_chapter(
+        self, chapter_id: UniqueId, chapter_data: Chapter, delta: bool = False
+    ) -> T.Union[Chapter, Delta]:
         with self.app.get_db() as session:
             chapter = models.Chapter.Fetch_by_uid(session, chapter_id)
             chapter.update(chapter_data)
             self.writer.CheckChapter(session, chapter.book_id, chapter.id)
             session.commit()
-            return chapter.asdict()
 
-    def reorder_chapter(self, book_uid: UniqueId, from_pos: int, to_pos: int) -> bool:
+            if delta is True:
+                return Delta(chapter=models.Chapter.Fetch_delta(session, chapter.id))
+
+            return models.Chapter.Fetch_by_Id(
+                session, chapter.id, plan="chapter_editor"
+            ).asdict()
+
+    @writes
+    def reorder_chapter(
+        self, book_uid: UniqueId, from_pos: int, to_pos: int
+    ) -> list[OrderType]:
         if self.app.has_active_book:
             with self.app.get_db() as session:
-                book = models.Book.Fetch_by_UID(session, book_uid)
-                floating = book.chapters.pop(from_pos)
-                book.chapters.insert(to_pos, floating)
-                book.chapters.reorder()
-                self.writer.CheckBook(session, book.id)
+                changed = models.Chapter.Move(session, book_uid, from_pos, to_pos)
                 session.commit()
-                return True
+                return changed
 
-        return False
+        return []
+
+    def fetch_stripped_chapters(
+        self, book_uid: UniqueId, fields: T.Optional[list[str]] = None
+    ) -> list[Chapter]:
+        if fields is not None:
+            fields = [*fields, "chapters"]
 
-    def fetch_stripped_chapters(self, book_uid: UniqueId) -> list[Chapter]:
         if self.app.has_active_book:
-            with self.app.get_db() as session:
-                book = models.Book.Fetch_by_UID(session, book_uid)
-                return [chapter.asdict(stripped=True) for chapter in book.chapters]
+
+            def build(session):
+                book = models.Book.Fetch_by_UID(
+                    session, book_uid, plan="tree", fields=fields
+                )
+                chapters = [
+                    chapter.asdict(stripped=True, fields=fields)
+                    for chapter in book.chapters
+                ]
+                return chapters, book_tags(session, book)
+
+            return self.app.responses.fetch(
+                self.app,
+                ("fetch_stripped_chapters", book_uid, fields_key(fields)),
+                build,
+            )
 
         return []
 
@@ -211,12 +341,13 @@ class BCAPI:
     ) -> T.Optional[Chapter]:
         return self.create_chapter(book_uid, new_chapter)
 
+    @writes
     def create_chapter(
         self, book_id: UniqueId, new_chapter: Chapter
     ) -> T.Optional[Chapter]:
         with self.app.get_db() as session:
             chapter = models.Chapter(
-                title=new_chapter["title"], uid=models.generate_id(12)
+                title=new_chapter["title"], uid=models.generate_id()
             )
             book = models.Book.Fetch_by_UID(session, book_id)
             if book is not None:
@@ -234,10 +365,24 @@ class BCAPI:
     #     with self.app.get_db() as session:
     #         return models.Chapter.Reorder(session, chapters)
 
-    def fetch_scene(self, scene_uid: UniqueId) -> Scene:
-        with self.app.get_db() as session:
-            scene = models.Scene.Fetch_by_uid(session, scene_uid)
-            return scene.asdict()
+    def fetch_scene(
+        self,
+        scene_uid: UniqueId,
+        fields: T.Optional[list[str]] = None,
+        version: T.Optional[str] = None,
+    ) -> T.Union[Scene, NotModified]:
+        """Answers NotModified when `version` is still the scene's version"""
+        with self.app.get_db() as session:
+            current = models.fetch_version(
+                session, models.Scene, models.Scene.uid == scene_uid
+            )
+            if version == current:
+                return NotModified(type="not_modified", version=current)
+
+            scene = models.Scene.Fetch_by_uid(
+                session, scene_uid, plan="scene_editor", fields=fields
+            )
+            return scene.asdict(fields=fields)
 
     def fetch_scene_markedup(self, scene_uid: UniqueId) -> str:
         with self.app.get_db() as session:
@@ -276,22 +421,38 @@ class BCAPI:
         if response["status"] == "split":
             scene = models.Scene(title=response["title"], content=response["content"])
 
+    @writes
     def update_scene(
-        self, scene_uid: UniqueId, new_data: Scene
-    ) -> T.Tuple[Scene, Chapter]:
+        self, scene_uid: UniqueId, new_data: Scene, delta: bool = False
+    ) -> T.Union[T.Tuple[Scene, Chapter], Delta]:
         with self.app.get_db() as session:
             scene = models.Scene.Fetch_by_uid(session, scene_uid)
             scene.update(new_data)
+            models.Chapter.Touch(session, scene.chapter_id)
             session.commit()
 
+            if delta is True:
+                return Delta(
+                    scene=scene.asdelta(),
+                    chapter=models.Chapter.Fetch_delta(session, scene.chapter_id),
+                )
+
+            chapter = models.Chapter.Fetch_by_Id(
+                session, scene.chapter_id, plan="chapter_editor"
+            )
             return (
                 scene.asdict(),
-                scene.chapter.asdict(),
+                chapter.asdict(),
             )
 
+    @writes
     def create_scene(
-        self, chapter_id: UniqueId, title: str, position: int = -1
-    ) -> T.Tuple[Scene, Chapter]:
+        self,
+        chapter_id: UniqueId,
+        title: str,
+        position: int = -1,
+        delta: bool = False,
+    ) -> T.Union[T.Tuple[Scene, Chapter], Delta]:
         with self.app.get_db() as session:
             chapter = models.Chapter.Fetch_by_uid(session, chapter_id)
             scene = models.Scene(title=title)
@@ -301,10 +462,10 @@ class BCAPI:
             else:
                 chapter.scenes.append(scene)
 
-            statusValue: str = models.Setting.Get(session, "defaultSceneStatus")
-            if statusValue != "-1":
+            statusValue = self.app.settings.get("defaultSceneStatus")
+            if statusValue not in (None, "-1"):
                 try:
-                    status = models.SceneStatus.Fetch_by_Uid(session, statusValue)
+                    scene.status = models.SceneStatus.Fetch_by_Uid(session, statusValue)
                 except Exception as exc:
                     self.log.error(
                         "Failed to attach default "
@@ -312,14 +473,28 @@ class BCAPI:
                     )
 
             session.add(scene)
+            chapter.touch()
             session.commit()
 
+            if delta is True:
+                return Delta(
+                    scene=scene.asdict(),
+                    chapter=models.Chapter.Fetch_delta(session, chapter.id),
+                    orders=models.Chapter.Fetch_scene_order(session, chapter.id),
+                )
+
+            chapter = models.Chapter.Fetch_by_Id(
+                session, chapter.id, plan="chapter_editor"
+            )
             return (
                 scene.asdict(),
                 chapter.asdict(),
             )
 
-    def delete_scene(self, chapter_uid: UniqueId, scene_uid: UniqueId) -> bool:
+    @writes
+    def delete_scene(
+        self, chapter_uid: UniqueId, scene_uid: UniqueId, delta: bool = False
+    ) -> T.Union[bool, Delta]:
         try:
             with self.app.get_db() as session:
                 scene = models.Scene.Fetch_by_uid(session, scene_uid)
@@ -329,43 +504,62 @@ class BCAPI:
                 parent.scenes.reorder()  # type: ignore
                 parent.touch()
                 session.commit()
+
+                if delta is True:
+                    return Delta(
+                        chapter=models.Chapter.Fetch_delta(session, parent.id),
+                        orders=models.Chapter.Fetch_scene_order(session, parent.id),
+                    )
+
                 return True
         except models.NoResultFound:
             raise ValueError("Scene was already deleted")
 
-    def reorder_scene(self, chapterId: str, from_pos: int, to_pos: int):
+    @writes
+    def reorder_scene(
+        self, chapterId: str, from_pos: int, to_pos: int
+    ) -> list[OrderType]:
         with self.app.get_db() as session:
-            chapter = models.Chapter.Fetch_by_uid(session, chapterId)
-            floating = chapter.scenes.pop(from_pos)
-            chapter.scenes.insert(to_pos, floating)
+            changed = models.Scene.Move(session, chapterId, from_pos, to_pos)
             session.commit()
+            return changed
+
+    @writes
+    def reorder_scenes(self, new_order: list[Scene]) -> list[OrderType]:
+        if len(new_order) == 0:
+            return []
 
-    def reorder_scenes(self, new_order: list[Scene]) -> Chapter:
         with self.app.get_db() as session:
             self.log.info("Reordering scenes: {}", new_order)
 
-            for authority in new_order:
-                self.log.info("Scene authority is {}", authority)
-
-                record = models.Scene.Fetch_by_uid(session, authority["id"])
-                record.order = int(authority["order"])
-                chapterId = record.chapter.id
+            chapterId = session.scalars(
+                models.select(models.Scene.chapter_id).where(
+                    models.Scene.uid == new_order[0]["id"]
+                )
+            ).one()
 
+            changed = models.Scene.Reorder(session, new_order, chapter_id=chapterId)
             models.Chapter.Touch(session, chapterId)
             session.commit()
 
-            return models.Chapter.Fetch_by_Id(session, chapterId).asdict()
+            return changed
 
+    @writes
     def attach_scene_status2scene(
-        self, scene_uid: UniqueId, status_uid: UniqueId
-    ) -> bool:
+        self, scene_uid: UniqueId, status_uid: UniqueId, delta: bool = False
+    ) -> T.Union[bool, Delta]:
         with self.app.get_db() as session:
             scene_status = models.SceneStatus.Fetch_by_Uid(session, status_uid)
 
             scene = models.Scene.Fetch_by_uid(session, scene_uid)
 
             scene.status = scene_status
+            scene.touch()
             session.commit()
+
+            if delta is True:
+                return Delta(scene=scene.asdelta(("status", "updated_on")))
+
             return True
 
     """
@@ -374,9 +568,44 @@ class BCAPI:
     """
 
     def list_all_characters(self, book_uid: UniqueId) -> list[Character]:
-        with self.app.get_db() as session:
+        def build(session):
+            book = models.Book.Fetch_by_UID(session, book_uid)
+            counts = models.Character.Scene_counts(session, book.id)
+            characters = [
+                toon.asdict(scene_count=counts.get(toon.id, 0))
+                for toon in book.characters
+            ]
+            return characters, [("Characters", book.id)]
+
+        key = ("list_all_characters", book_uid)
+        return self.app.responses.fetch(self.app, key, build)
+
+    def fetch_book_references(self, book_uid: UniqueId) -> BookReferences:
+        """
+        The book's scene statuses and characters by id
+
+        Scene payloads refer to these through `status_id` and `character_ids`,
+        ask for those fields instead of `status` and `characters` to get each
+        one once per book rather than once per scene.
+        """
+
+        def build(session):
             book = models.Book.Fetch_by_UID(session, book_uid)
-            return [toon.asdict() for toon in book.characters]
+            counts = models.Character.Scene_counts(session, book.id)
+            references = BookReferences(
+                book_id=book.uid,
+                statuses={
+                    status.uid: status.asdict() for status in book.scene_statuses
+                },
+                characters={
+                    toon.uid: toon.asdict(scene_count=counts.get(toon.id, 0))
+                    for toon in book.characters
+                },
+            )
+            return references, [("Statuses", book.id), ("Characters", book.id)]
+
+        key = ("fetch_book_references", book_uid)
+        return self.app.responses.fetch(self.app, key, build)
 
     def list_characters_by_scene(self, scene_uid: UniqueId) -> list[Character]:
         with self.app.get_db() as session:
@@ -396,28 +625,46 @@ class BCAPI:
 
         return []
 
-    def add_character_to_scene(self, scene_uid: UniqueId, toon_uid: UniqueId) -> Scene:
+    @writes
+    def add_character_to_scene(
+        self, scene_uid: UniqueId, toon_uid: UniqueId, delta: bool = False
+    ) -> T.Union[Scene, Delta]:
         with self.app.get_db() as session:
             scene = models.Scene.Fetch_by_uid(session, scene_uid)
             toon = models.Character.Fetch_by_Uid(session, toon_uid)
             scene.characters.append(toon)
             scene.touch()
             session.commit()
+
+            if delta is True:
+                return Delta(scene=scene.asdelta(("characters", "updated_on")))
+
             return scene.asdict()
 
+    @writes
     def remove_character_from_scene(
-        self, character_uid: UniqueId, scene_uid: UniqueId
-    ) -> bool:
+        self, character_uid: UniqueId, scene_uid: UniqueId, delta: bool = False
+    ) -> T.Union[bool, Delta]:
         with self.app.get_db() as session:
             scene = models.Scene.Fetch_by_uid(session, scene_uid)
             toon = models.Character.Fetch_by_Uid(session, character_uid)
             scene.characters.remove(toon)
+            scene.touch()
             session.commit()
+
+            if delta is True:
+                return Delta(scene=scene.asdelta(("characters", "updated_on")))
+
             return True
 
+    @writes
     def create_new_character_to_scene(
-        self, book_uid: UniqueId, scene_uid: UniqueId, new_name: str
-    ) -> Scene:
+        self,
+        book_uid: UniqueId,
+        scene_uid: UniqueId,
+        new_name: str,
+        delta: bool = False,
+    ) -> T.Union[Scene, Delta]:
         self.log.info(f"Looking for or add {book_uid=}, {scene_uid=}, {new_name=}")
         with self.app.get_db() as session:
             scene = models.Scene.Fetch_by_uid(session, scene_uid)
@@ -428,6 +675,10 @@ class BCAPI:
             scene.characters.append(toon)
             scene.touch()
             session.commit()
+
+            if delta is True:
+                return Delta(scene=scene.asdelta(("characters", "updated_on")))
+
             return scene.asdict()
 
     def fetch_character(self, book_uid: UniqueId, character_uid: UniqueId) -> Character:
@@ -436,6 +687,7 @@ class BCAPI:
             toon = models.Character.Fetch_by_Uid_and_Book(session, book, character_uid)
             return toon.asdict(extended=True)
 
+    @writes
     def update_character(
         self, bookId: UniqueId, changed_character: Character
     ) -> Character:
@@ -447,6 +699,7 @@ class BCAPI:
             session.commit()
             return character.asdict(extended=True)
 
+    @writes
     def delete_character(self, character_uid: UniqueId) -> bool:
         with self.app.get_db() as session:
             models.Character.Delete_by_Uid(session, character_uid)
@@ -458,36 +711,25 @@ class BCAPI:
     """
 
     def fetchAllSettings(self) -> list[Setting]:
-        with self.app.get_db() as session:
-            return [setting.asdict() for setting in models.Setting.All(session)]
+        return self.app.settings.all()
 
     def getSetting(self, name: str) -> common_setting_type:
-        with self.app.get_db() as session:
-            temp = models.Setting.Get(session, name)
-            return temp
+        return self.app.settings.get(name)
 
     def setSetting(self, name: str, value: common_setting_type):
-        with self.app.get_db() as session:
-            models.Setting.Set(session, name, value)
-            session.commit()
+        self.app.settings.set({name: value})
 
     def bulk_update_settings(self, changeset: T.Dict[str, Setting]):
-        with self.app.get_db() as session:
-            models.Setting.BulkSet(session, changeset)
-            session.commit()
+        self.app.settings.set({name: item["value"] for name, item in changeset.items()})
 
     def bulkDefaultSettings(self, changeset):
-        with self.app.get_db() as session:
-            for default in changeset:
-                models.Setting.SetDefault(
-                    session, default["name"], default["value"], default["type"]
-                )
-
-            session.commit()
+        self.app.settings.add_defaults(
+            (default["name"], default["value"], default["type"])
+            for default in changeset
+        )
 
     def set_default_setting(self, name, val, type):
-        with self.app.get_db() as session:
-            models.Setting.SetDefault(session, name, val, type)
+        self.app.settings.add_defaults([(name, val, type)])
 
     """
         Scene Status
@@ -503,6 +745,7 @@ class BCAPI:
             status = models.SceneStatus.Fetch_by_Uid(session, status_uid)
             return status.asdict(stripped=True)
 
+    @writes
     def create_scene_status(
         self,
         book_uid: UniqueId,
@@ -528,6 +771,7 @@ class BCAPI:
 
             return status.asdict()
 
+    @writes
     def update_scene_status(
         self, status_uid: UniqueId, changeset: SceneStatus
     ) -> SceneStatus:
@@ -537,6 +781,7 @@ class BCAPI:
             session.commit()
             return status.asdict()
 
+    @writes
     def delete_scene_status(self, status_uid: UniqueId) -> None:
         """
         Removes the targetted record
@@ -580,6 +825,11 @@ class BCAPI:
         return returnval
 
     def importer_list_files(self, filepath: str) -> ImportedBook:
+        """
+        The documents in `filepath`, straight from the directory listing
+
+        Word counts are left out, see `importer_preview_files`.
+        """
         path = pathlib.Path(filepath)
         if path.exists() is False or path.is_dir() is False:
             raise ValueError(f"{filepath} is not a valid directory")
@@ -587,146 +837,103 @@ class BCAPI:
         def stat2str(statval):
             return DT.datetime.fromtimestamp(statval).strftime("%Y-%m-%d %H:%M")
 
-        def format_file(file: pathlib.Path):
+        def format_file(entry: os.DirEntry):
+            stat = entry.stat()
             return DocumentFile(
-                name=str(file.name),
-                path=str(file.parent),
-                created_date=stat2str(file.stat().st_ctime),
-                modified_last=stat2str(file.stat().st_mtime),
-                size=file.stat().st_size,
+                name=entry.name,
+                path=str(path),
+                created_date=stat2str(stat.st_ctime),
+                modified_last=stat2str(stat.st_mtime),
+                size=stat.st_size,
             )
 
-        files = [
-            format_file(file)
-            for file in path.iterdir()
-            if file.name.startswith("~") is False
-            and file.name.startswith("_") is False
-            and file.suffix == ".docx"
-        ]
+        with os.scandir(path) as entries:
+            files = [
+                format_file(entry)
+                for entry in entries
+                if is_document(entry.name) and entry.is_file()
+            ]
 
         project = ImportedBook(path=str(path), dir_name=path.name, documents=files)
 
         self.log.debug("File option list is {}", files)
         return project
 
-    def importer_process_batch(self, reporterId: str):
-        def report(msg):
-            payload = ImportMessage(msg=msg, action="show")
-            self.app.callback(reporterId, payload)
-
-        def report_chapter(name, title, scene_ct, word_ct):
-            payload = ImportChapter(
-                action="add_chapter",
-                name=name,
-                title=title,
-                scene_ct=scene_ct,
-                word_ct=word_ct,
-            )
-
-            self.app.callback(reporterId, payload)
-
-        def timestamp2datetime(ts):
-            return DT.datetime.fromtimestamp(ts)
+    def importer_preview_files(
+        self, documents: list[DocumentFile], reporterId: str
+    ) -> UniqueId:
+        """Count the words in each document, reported one at a time to `reporterId`"""
+        return self.app.jobs.submit(
+            "preview",
+            dict(documents=documents, reporter_id=reporterId),
+            bytes_total=sum(document["size"] for document in documents),
+        )
 
+    def importer_process_batch(self, reporterId: str) -> UniqueId:
+        """Start importing the current batch, returns the job's id"""
         batch = self.app.get_batch()  # type: BatchSettings
+        payload = dict(batch, reporter_id=reporterId)
+        return self.app.jobs.submit(
+            "import", payload, bytes_total=import_batch.batch_size(batch["documents"])
+        )
 
-        name_status = batch["name_and_status"]
+    def importer_reimport_chapter(self, chapterUid: UniqueId) -> UniqueId:
+        return self.app.jobs.submit("reimport", dict(chapter_uid=chapterUid))
 
-        with self.app.get_db() as session:
-            book = models.Book(
-                title=name_status["book_name"], operation_type=BookTypes.imported
-            )
-            session.add(book)
+    def importer_purge_cache(self) -> int:
+        """Forget every cached parse, returns how many were dropped"""
+        if self.app.parse_cache is None:
+            return 0
 
-            status = None
-            if name_status["have_default_status"] is True:
-                status_name = name_status["default_status"]
-                status_color = name_status["status_color"]
-                status = models.SceneStatus(
-                    name=status_name, color=status_color, book=book
-                )
-                session.add(status)
+        return self.app.parse_cache.purge()
 
-            for document in batch["documents"]:  # type: DocumentFile
-                report(f"Processing {document['name']}")
-                target = pathlib.Path(document["path"]) / document["name"]
-                assert target.exists() and target.is_file()
-                stat = target.stat()
+    def importer_scan_book(self, bookUid: UniqueId) -> SyncReport:
+        """What changed in the book's source directory, without touching anything"""
+        return self.app.sync.scan(bookUid)
 
-                imported = ChapterImporter.Load(target)
+    def importer_sync_book(self, bookUid: UniqueId) -> SyncReport:
+        """Scan and start reimport jobs for the modified chapters"""
+        return self.app.sync.sync(bookUid)
 
-                report(f"{document['name']} has {len(imported.scenes)} scenes")
-                report_chapter(
-                    document["name"], imported.title, len(imported.scenes), 0
-                )
+    def importer_watch_book(self, bookUid: UniqueId, reporterId: str) -> bool:
+        """Keep syncing the book, each change is reported to `reporterId`"""
+        self.app.sync.watch(
+            bookUid,
+            lambda report: self.app.callback(reporterId, report),
+            interval=self.app.sync_interval,
+        )
+        return True
 
-                chapter = models.Chapter(
-                    title=imported.title,
-                    source_file=target,
-                    source_size=stat.st_size,
-                    source_modified=timestamp2datetime(stat.st_mtime),
-                    last_imported=timestamp2datetime(time.time()),
-                )
+    def importer_unwatch_book(self, bookUid: UniqueId) -> bool:
+        return self.app.sync.unwatch(bookUid)
 
-                for idx, scene_record in enumerate(imported.scenes, 1):
-                    scene_title = (
-                        scene_record.title
-                        if len(scene_record.title.strip()) > 0
-                        else f"Scene {idx}"
-                    )
-                    scene = models.Scene(
-                        title=scene_title,
-                        content=scene_record.body,
-                        location=scene_record.location,
-                        notes=scene_record.notes,
-                    )
-                    if status is not None:
-                        scene.status = status
+    """
+        Background jobs
+    """
 
-                    session.add(scene)
-                    chapter.scenes.append(scene)
+    def job_status(self, job_uid: UniqueId) -> JobType:
+        return self.app.jobs.status(job_uid)
 
-                session.add(chapter)
-                book.chapters.append(chapter)
-            session.commit()
-        return True
+    def job_list(self, active_only: bool = False) -> list[JobType]:
+        if active_only is True:
+            return self.app.jobs.list(JobStatus.pending, JobStatus.running)
 
-    def importer_reimport_chapter(self, chapterUid: UniqueId) -> bool:
-        def timestamp2datetime(ts):
-            return DT.datetime.fromtimestamp(ts)
+        return self.app.jobs.list()
 
-        with self.app.get_db() as session:
-            chapter = models.Chapter.Fetch_by_uid(session, chapterUid)
-            book = chapter.book
-            for scene in chapter.scenes:
-                session.delete(scene)
+    def job_cancel(self, job_uid: UniqueId) -> bool:
+        return self.app.jobs.cancel(job_uid)
 
-            session.commit()
+    def job_resume(self, job_uid: UniqueId) -> UniqueId:
+        return self.app.jobs.resume(job_uid)
 
-            stat = chapter.source_file.stat()
-            imported = ChapterImporter.Load(chapter.source_file)
-            chapter.source_size = stat.st_size
-            chapter.last_imported = timestamp2datetime(time.time())
-            chapter.source_modified = timestamp2datetime(stat.st_mtime)
-
-            for idx, scene_record in enumerate(imported.scenes, 1):
-                if scene_record.title is None or scene_record.title.strip() == "":
-                    title = f"Scene {idx}"
-                else:
-                    title = scene_record.title
-
-                scene = models.Scene(
-                    title=title,
-                    content=scene_record.body,
-                    location=scene_record.location,
-                    notes=scene_record.notes,
-                )
-                chapter.scenes.append(scene)
-                session.add(scene)
+    def job_cleanup(self, job_uid: UniqueId) -> bool:
+        return self.app.jobs.cleanup(job_uid)
 
-            session.commit()
+    def database_optimize(self) -> UniqueId:
+        return self.app.jobs.submit("optimize")
 
-            return True
+    def response_cache_stats(self) -> CacheStats:
+        return self.app.responses.stats()
 
     def debug_long_task(self, callbackId: str):
         payload = dict(msg="Hello World!", nums=123)
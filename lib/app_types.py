@@ -4,6 +4,12 @@ from enum import Enum
 UID = str
 UniqueId = T.Union[str, int]
 common_setting_type = T.Union[str, bool, int, None]
+LoadPlan = T.Literal["tree", "chapter_editor", "scene_editor"]
+Fields = T.Sequence[str]
+"""A projection, the `asdict` keys a caller wants back"""
+
+DBProfile = T.Literal["compat", "performance"]
+PragmaSettings = dict[str, T.Union[str, int]]
 
 
 class SettingType(T.TypedDict):
@@ -18,6 +24,8 @@ class CharacterType(T.TypedDict):
     name: str
     notes: str
     book_id: UniqueId
+    scene_count: T.NotRequired[int]
+    """Left out where embedded in a scene"""
 
 
 class SceneType(T.TypedDict):
@@ -26,19 +34,27 @@ class SceneType(T.TypedDict):
     title: str
     notes: str
     type: T.Literal["scene"]
+    version: str
     order: int
     created_on: str
     updated_on: str
 
     characters: list[CharacterType]
-    status_id: UniqueId
+    character_ids: list[UniqueId]
+    status_id: T.Optional[UniqueId]
     status: T.Optional["SceneStatusType"]
 
 
+class OrderType(T.TypedDict):
+    id: UniqueId
+    order: int
+
+
 class ChapterDict(T.TypedDict):
     id: UniqueId
     book_id: UniqueId
     type: T.Literal["chapter"]
+    version: str
     title: str
     order: T.Union[str | int]
     words: T.Union[str | int]
@@ -56,6 +72,7 @@ class ChapterDict(T.TypedDict):
 
 class BookType(T.TypedDict):
     id: UniqueId
+    version: str
     title: str
     notes: str
 
@@ -66,6 +83,32 @@ class BookType(T.TypedDict):
     chapters: T.List[ChapterDict]
 
 
+class Delta(T.TypedDict, total=False):
+    """
+    Opt-in response of the mutating api calls, only what changed.
+
+    The entities are partial, they always carry their id plus the fields that changed,
+    prose the client just sent is never echoed back.
+    """
+
+    book: BookType
+    chapter: ChapterDict
+    scene: SceneType
+    orders: list[OrderType]
+
+
+class NotModified(T.TypedDict):
+    """
+    What a conditional fetch answers when the client's version is still current
+
+    Books, chapters and scenes carry a `version`, handing it back to their fetch
+    skips building and sending a payload the client already holds.
+    """
+
+    type: T.Literal["not_modified"]
+    version: str
+
+
 class SceneStatusType(T.TypedDict):
     id: UniqueId
     name: str
@@ -93,7 +136,19 @@ class DocumentFile(T.TypedDict):
     created_date: str
     modified_last: str
     size: int
+    words: T.NotRequired[int]
+    """Filled in later by a preview, see importer.preview"""
+
+
+class DocumentPreview(T.TypedDict):
+    action: T.Literal["preview"]
+    name: str
+    path: str
     words: int
+    paragraphs: int
+    pages: T.Optional[int]
+    source: T.Literal["metadata", "scan"]
+    """metadata: Word's own counts from docProps/app.xml, scan: counted here"""
 
 
 class ImportedBook(T.TypedDict):
@@ -126,3 +181,77 @@ class ImportChapter(T.TypedDict):
     title: str
     scene_ct: int
     word_ct: int
+
+
+class ReimportChangeset(T.TypedDict):
+    """The result of a reimport job, scene uids by what happened to them"""
+
+    chapter_id: UniqueId
+    added: list[UniqueId]
+    updated: list[UniqueId]
+    removed: list[UniqueId]
+    moved: list[UniqueId]
+    """Content unchanged but now in a different position"""
+    unchanged: int
+
+
+class SyncReport(T.TypedDict):
+    """How an imported book differs from its source directory"""
+
+    book_id: UniqueId
+    import_dir: str
+    new: list[str]
+    """Documents in the directory that no chapter was imported from"""
+    removed: list[UniqueId]
+    """Chapters whose document is gone"""
+    modified: list[UniqueId]
+    """Chapters whose document changed size or modification time"""
+    unchanged: int
+    jobs: list[UniqueId]
+    """Reimport jobs started for the modified chapters"""
+
+
+class CacheStats(T.TypedDict):
+    entries: int
+    max_entries: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+
+class JobStatus(Enum):
+    """Lifecycle of a background job, see lib.jobs"""
+
+    pending = 1
+    running = 2
+    done = 3
+    failed = 4
+    cancelled = 5
+
+    interrupted = 6
+    """Was pending or running when the app last exited, can be resumed or cleaned up"""
+
+
+class JobType(T.TypedDict):
+    id: UniqueId
+    kind: str
+    status: str
+    message: str
+    bytes_total: int
+    bytes_done: int
+    progress: float
+    eta: T.Optional[float]
+    """Seconds left, estimated from the bytes processed so far"""
+    result: T.Any
+    error: T.Optional[str]
+    created_on: str
+    finished_on: T.Optional[str]
+
+
+class BookReferences(T.TypedDict):
+    """What scene payloads refer to by id, see BCAPI.fetch_book_references"""
+
+    book_id: UniqueId
+    statuses: T.Dict[UniqueId, SceneStatusType]
+    characters: T.Dict[UniqueId, CharacterType]
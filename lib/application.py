@@ -2,13 +2,40 @@ import pathlib
 import tomllib
 import typing as T
 import json
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import webview  # type: ignore
 
-from .app_types import BatchSettings
+from .app_types import BatchSettings, LoadPlan, Fields, DBProfile
 from . import models
+from .jobs import JobManager, optimize_database
+from .response_cache import ResponseCache
+from .settings_store import SettingsStore
+from .importer import batch, preview
+from .importer.parse_cache import ParseCache
+from .importer.sync import SourceSync
 from contextlib import contextmanager
 
+RT = T.TypeVar("RT")
+
+
+def writes(method: T.Callable[..., RT]) -> T.Callable[..., RT]:
+    """
+    Run a BCAPI method on the application's writer thread
+
+    The js_api calls arrive on arbitrary pywebview worker threads, this funnels
+    the ones that commit through a single thread and blocks the caller until
+    the result is ready.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return self.app.write(method, self, *args, **kwargs)
+
+    return wrapper
+
 
 class BCApplication:
     database_path: pathlib.Path
@@ -17,35 +44,165 @@ class BCApplication:
     here: pathlib.Path
 
     Session: models.scoped_session
+    """Sessions bound to the writer connection, only used on the writer thread"""
+    ReadSession: models.scoped_session
+    """Sessions from the query_only read pool, one per calling thread"""
+
+    responses: ResponseCache
+    """BCAPI read responses, invalidated by what the writer commits"""
+    settings: SettingsStore
+    """User settings, read from memory and written through"""
+    jobs: JobManager
+    sync: SourceSync
+    sync_interval: float
+    """Seconds between checks of a watched book's source directory"""
+    import_jobs: int
+    """Processes used to parse documents on import, 0 for one per CPU"""
+    parse_cache: T.Optional[ParseCache]
+    """Parsed documents kept between imports, None if disabled"""
+
+    _writer: ThreadPoolExecutor
+    _writer_ident: T.Optional[int]
+    _local: threading.local
 
     _batch: T.Optional[dict[str, str]]
 
-    def __init__(self, database_path: pathlib.Path, here: pathlib.Path = None):
+    def __init__(
+        self,
+        database_path: pathlib.Path,
+        here: pathlib.Path = None,
+        db_profile: T.Optional[DBProfile] = None,
+    ):
         self.database_path = database_path
         self.main_window = None
         self.book_id = None
         self.here = here
 
+        defaults = self.load_defaults()
+
+        # The [database] table holds connection PRAGMAs, not user settings
+        pragmas = dict(defaults.get("database", {}))
+        profile = pragmas.pop("profile", models.DEFAULT_PROFILE)
+        if db_profile is not None:
+            profile = db_profile
+
         # Makes sure we can connect
-        self.engine, self.Session = models.connect(self.database_path)
+        self.engine, self.Session = models.connect(
+            self.database_path, profile=profile, pragmas=pragmas
+        )
+        self.read_engine, self.ReadSession = models.connect_readonly(
+            self.database_path, profile=profile, pragmas=pragmas
+        )
+
+        self.responses = ResponseCache(
+            defaults.get("cache", {}).get("responses", 256)
+        )
+        self.responses.watch(self.Session.session_factory)
+
+        self._writer_ident = None
+        self._writer = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="BCWriter",
+            initializer=self._register_writer,
+        )
+        self._local = threading.local()
+
+        self.settings = SettingsStore(self, defaults)
+        self.settings.load()
+
+        importer = defaults.get("importer", {})
+        self.import_jobs = importer.get("jobs", 0)
+        self.sync_interval = importer.get("sync_interval", 5.0)
+
+        cache_mb = importer.get("cache_size_mb", 64)
+        self.parse_cache = None
+        if cache_mb > 0:
+            self.parse_cache = ParseCache(
+                self.database_path.with_name(f"{self.database_path.stem}.parse_cache"),
+                max_bytes=cache_mb * 1024 * 1024,
+            )
+
+        self.jobs = JobManager(self)
+        self.jobs.register("import", batch.import_batch, cleanup=batch.cleanup_batch)
+        self.jobs.register("reimport", batch.reimport_chapter)
+        self.jobs.register("preview", preview.preview_documents)
+        self.jobs.register("optimize", optimize_database)
+        self.jobs.recover()
+
+        self.sync = SourceSync(self)
 
         self._batch = None
 
     def set_window(self, main_window):
         self.main_window = main_window
 
+    @property
+    def has_active_book(self) -> bool:
+        return self.book_id is not None
+
+    def get_book(
+        self,
+        session,
+        plan: T.Optional[LoadPlan] = None,
+        fields: T.Optional[Fields] = None,
+    ) -> T.Optional[models.Book]:
+        if self.has_active_book is False:
+            return None
+
+        return models.Book.Fetch_by_Id(session, self.book_id, plan=plan, fields=fields)
+
     def fetch_chapters(self, session):
         if self.has_active_book:
             return [chapter for chapter in self.get_book(session).chapters]
 
         return False
 
+    def _register_writer(self):
+        self._writer_ident = threading.get_ident()
+
+    @property
+    def on_writer(self) -> bool:
+        return threading.get_ident() == self._writer_ident
+
+    def write(self, func: T.Callable[..., RT], *args, **kwargs) -> RT:
+        """Call `func` on the writer thread and wait for its result"""
+        if self.on_writer:
+            # Already queued, a writer calling itself would deadlock
+            return func(*args, **kwargs)
+
+        return self._writer.submit(func, *args, **kwargs).result()
+
     @contextmanager
     def get_db(self):
-        session = self.Session()
-        yield session
-        session.close()
-        del session
+        """
+        The calling thread's session, from the writer or the read pool
+
+        Nested calls on the same thread share the session, only the outermost
+        one rolls back on error and removes it from the registry.
+        """
+        registry = self.Session if self.on_writer else self.ReadSession
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+
+        session = registry()
+        try:
+            yield session
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            self._local.depth = depth
+            if depth == 0:
+                registry.remove()
+
+    def shutdown(self):
+        self.sync.shutdown()
+        self.jobs.shutdown()
+        self._writer.shutdown(wait=True)
+        self.Session.remove()
+        self.ReadSession.remove()
+        self.engine.dispose()
+        self.read_engine.dispose()
 
     def get_batch(self) -> BatchSettings:
         if self._batch is None:
@@ -62,34 +219,21 @@ class BCApplication:
         self._batch = dict()
 
     def callback(self, identifierID, returnval):
+        if self.main_window is None:
+            # Headless, see import_book.py
+            return
+
         payload = json.dumps(returnval)
         script = "window.callBack('{0}', {1})".format(identifierID, payload)
         print(f"callback `{script}`")
         self.main_window.evaluate_js(script)
 
-    def ensure_db_ready(self):
-        def mk_setting(key, value):
-            match type(value):
-                case thing if isinstance(thing, str):
-                    return models.Setting(name=key, value=value, type="string")
-                case thing if isinstance(thing, int):
-                    return models.Setting(name=key, value=value, type="number")
-                case thing if isinstance(thing, bool):
-                    return models.Setting(name=key, value=value, type="boolean")
-                case _:
-                    return models.Setting(name=key, value=value, type="string")
+    def load_defaults(self) -> dict[str, T.Any]:
+        if self.here is None:
+            return dict()
 
         try:
-            defaults = tomllib.load(self.here / "defaults.settings.toml")
+            with (self.here / "defaults.settings.toml").open("rb") as defaults_file:
+                return tomllib.load(defaults_file)
         except FileNotFoundError:
-            defaults = dict()
-
-        with self.get_db() as session:
-            for key, value in defaults.items():
-                setting = models.Setting.Fetch_by_Name(session=session, name=key)
-                if setting is None:
-                    new_setting = mk_setting(key, value)
-                    if new_setting is not None:
-                        session.add(new_setting)
-
-            session.commit()
+            return dict()
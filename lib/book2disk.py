@@ -2,8 +2,8 @@ from typing import Tuple
 
 from sqlalchemy.orm import Session
 
-from app_types import UniqueId
-from log_helper import getLogger
+from .app_types import UniqueId
+from .log_helper import getLogger
 
 LOG = getLogger(__name__)
 
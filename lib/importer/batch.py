@@ -0,0 +1,277 @@
+"""
+Import jobs, see lib.jobs
+
+Documents are parsed on a process pool (see .parallel) and only the
+resulting rows go through the writer, bulk inserted (see .writer) with one
+transaction per chapter, in source order.  Each transaction also records which
+documents are done so an interrupted import resumes with the next document
+instead of starting over.
+"""
+import datetime as DT
+import pathlib
+import time
+import typing as T
+
+from .. import models
+from ..app_types import BookTypes, DocumentFile, InitialSettings, UniqueId
+from ..app_types import ImportMessage, ImportChapter, ReimportChangeset
+from ..jobs import JobContext
+from .chapter_importer import ParsedChapter, parse_document
+from .parallel import parse_documents
+from .reimport import SceneFingerprint, match_scenes
+from .writer import insert_chapter, scene_title
+
+if T.TYPE_CHECKING:
+    from ..application import BCApplication
+
+
+def timestamp2datetime(ts):
+    return DT.datetime.fromtimestamp(ts)
+
+
+def document_path(document: DocumentFile) -> pathlib.Path:
+    return pathlib.Path(document["path"]) / document["name"]
+
+
+def batch_size(documents: T.List[DocumentFile]) -> int:
+    return sum(document_path(document).stat().st_size for document in documents)
+
+
+def import_batch(
+    context: JobContext,
+    documents: T.List[DocumentFile],
+    name_and_status: InitialSettings,
+    book_path: T.Optional[str] = None,
+    reporter_id: T.Optional[str] = None,
+) -> UniqueId:
+    app = context.app
+
+    def report(payload):
+        if reporter_id is not None:
+            app.callback(reporter_id, payload)
+
+    checkpoint = context.checkpoint
+    if "book_uid" not in checkpoint:
+
+        def create_book():
+            with app.get_db() as session:
+                book = models.Book(
+                    title=name_and_status["book_name"],
+                    operation_type=BookTypes.imported,
+                    import_dir=None if book_path is None else pathlib.Path(book_path),
+                )
+                session.add(book)
+
+                status = None
+                if name_and_status["have_default_status"] is True:
+                    status = models.SceneStatus(
+                        name=name_and_status["default_status"],
+                        color=name_and_status["status_color"],
+                        book=book,
+                    )
+                    session.add(status)
+
+                session.flush()
+                context.save_checkpoint(
+                    session,
+                    dict(
+                        book_uid=book.uid,
+                        status_uid=None if status is None else status.uid,
+                        done=[],
+                    ),
+                )
+                session.commit()
+
+        app.write(create_book)
+        checkpoint = context.checkpoint
+
+    # Plain ids are all the bulk writer needs, see .writer
+    with app.get_db() as session:
+        book_id = models.Book.Fetch_by_UID(session, checkpoint["book_uid"]).id
+        status_id = None
+        if checkpoint["status_uid"] is not None:
+            status_id = models.SceneStatus.Fetch_by_Uid(
+                session, checkpoint["status_uid"]
+            ).id
+
+    pending = [
+        document
+        for document in documents
+        if str(document_path(document)) not in checkpoint["done"]
+    ]
+
+    def parsed(position: int, chapter: ParsedChapter):
+        name = pending[position]["name"]
+        report(
+            ImportMessage(action="show", msg=f"{name} has {len(chapter.scenes)} scenes")
+        )
+
+    # Seconds spent waiting on the parsers and on the writer, for import_book.py
+    timings = dict(checkpoint.get("timings", dict(parse_wait=0.0, write=0.0)))
+
+    context.check()
+    chapters = parse_documents(
+        [document_path(document) for document in pending],
+        jobs=app.import_jobs,
+        on_parsed=parsed,
+        cache=app.parse_cache,
+    )
+    try:
+        # Parsed in any order, committed in source order
+        for document in pending:
+            started = time.perf_counter()
+            imported = next(chapters)
+            timings["parse_wait"] += time.perf_counter() - started
+
+            context.check()
+            report(
+                ImportChapter(
+                    action="add_chapter",
+                    name=document["name"],
+                    title=imported.title,
+                    scene_ct=len(imported.scenes),
+                    word_ct=sum(
+                        models.count_words(scene.body) for scene in imported.scenes
+                    ),
+                )
+            )
+
+            def add_chapter():
+                started = time.perf_counter()
+                with app.get_db() as session:
+                    insert_chapter(session, book_id, imported, status_id=status_id)
+                    timings["write"] += time.perf_counter() - started
+                    context.save_checkpoint(
+                        session,
+                        dict(
+                            checkpoint,
+                            done=checkpoint["done"] + [imported.source],
+                            timings=dict(timings),
+                        ),
+                        advance=imported.size,
+                    )
+                    session.commit()
+
+            app.write(add_chapter)
+            checkpoint = context.checkpoint
+            context.progress(message=f"Imported {document['name']}")
+    finally:
+        chapters.close()
+
+    return checkpoint["book_uid"]
+
+
+def cleanup_batch(app: "BCApplication", checkpoint: dict, **_):
+    """Drop the partially imported book"""
+    if checkpoint.get("book_uid") is None:
+        return
+
+    def drop_book():
+        with app.get_db() as session:
+            models.Book.Delete(session, checkpoint["book_uid"])
+            session.commit()
+
+    app.write(drop_book)
+
+
+def reimport_chapter(context: JobContext, chapter_uid: UniqueId) -> ReimportChangeset:
+    """
+    Bring a chapter up to date with its source document, see .reimport
+
+    Only the scenes that changed are written, all in one transaction.
+    """
+    app = context.app
+
+    with app.get_db() as session:
+        source_file = models.Chapter.Fetch_by_uid(session, chapter_uid).source_file
+
+    context.set_total(source_file.stat().st_size)
+    imported = parse_document(source_file, app.parse_cache)
+    if app.parse_cache is not None:
+        app.parse_cache.evict()
+    context.check()
+
+    def apply_changes() -> ReimportChangeset:
+        with app.get_db() as session:
+            chapter = models.Chapter.Fetch_by_uid(session, chapter_uid)
+            previous = list(chapter.scenes)
+            matches = match_scenes(
+                [
+                    SceneFingerprint(scene.uid, scene.source_paras, scene.source_digest)
+                    for scene in previous
+                ],
+                imported.scenes,
+            )
+
+            changes = ReimportChangeset(
+                chapter_id=chapter_uid,
+                added=[],
+                updated=[],
+                removed=[],
+                moved=[],
+                unchanged=0,
+            )
+
+            # Same uid check as a bulk import, see models.reserve_uids
+            fresh = iter(
+                models.reserve_uids(session, models.Scene, matches.count(None))
+            )
+            scenes, added = [], []
+            for position, (scene_record, match) in enumerate(
+                zip(imported.scenes, matches)
+            ):
+                title = scene_title(scene_record.title, position + 1)
+                if match is None:
+                    scene = models.Scene(
+                        uid=next(fresh),
+                        title=title,
+                        content=scene_record.body,
+                        location=scene_record.location,
+                        notes=scene_record.notes,
+                    )
+                    session.add(scene)
+                    added.append(scene)
+                else:
+                    scene = previous[match]
+                    if scene.source_digest != scene_record.digest:
+                        # Notes and summary belong to the author, not the document
+                        scene.title = title
+                        scene.content = scene_record.body
+                        scene.location = scene_record.location
+                        changes["updated"].append(scene.uid)
+                    elif match != position:
+                        changes["moved"].append(scene.uid)
+                    else:
+                        changes["unchanged"] += 1
+
+                scene.source_paras = list(scene_record.para_ids)
+                scene.source_digest = scene_record.digest
+                scenes.append(scene)
+
+            kept = set(match for match in matches if match is not None)
+            for index, scene in enumerate(previous):
+                if index not in kept:
+                    changes["removed"].append(scene.uid)
+                    session.delete(scene)
+
+            chapter.scenes = scenes
+            chapter.scenes.reorder()
+
+            chapter.source_size = imported.size
+            chapter.last_imported = timestamp2datetime(time.time())
+            chapter.source_modified = timestamp2datetime(imported.mtime)
+
+            session.flush()
+            changes["added"] = [scene.uid for scene in added]
+            session.commit()
+            return changes
+
+    changes = app.write(apply_changes)
+    context.progress(
+        imported.size,
+        message=(
+            f"Reimported {source_file.name}: {len(changes['added'])} added,"
+            f" {len(changes['updated'])} updated, {len(changes['removed'])} removed"
+        ),
+    )
+    return changes
@@ -1,5 +1,9 @@
+import hashlib
 import pathlib
+import typing as T
+
 from .docx import Docx
+from .parse_cache import ChapterRecord, ParseCache
 
 
 class Scene:
@@ -7,12 +11,14 @@ class Scene:
     _body: list[str]
     location: str
     notes: str
+    para_ids: list[str]
 
     def __init__(self):
         self.title = ""
         self._body = []
         self.location = ""
         self.notes = ""
+        self.para_ids = []
 
     @property
     def body(self):
@@ -30,6 +36,36 @@ class Scene:
         self.title = self.title.strip()
 
 
+def scene_digest(title: str, body: str, location: str) -> str:
+    """Fingerprint of what an import writes into a scene"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (title, body, location):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+
+    return digest.hexdigest()
+
+
+class ParsedScene(T.NamedTuple):
+    title: str
+    body: str
+    location: str
+    notes: str
+    para_ids: T.Tuple[str, ...] = ()
+    """w14:paraId of the paragraphs the scene was built from"""
+    digest: str = ""
+
+
+class ParsedChapter(T.NamedTuple):
+    """What crosses the process boundary, plain strings and tuples only"""
+
+    source: str
+    title: str
+    scenes: T.Tuple[ParsedScene, ...]
+    size: int
+    mtime: float
+
+
 class ChapterImporter:
     scenes: list[Scene]
     title: str
@@ -45,14 +81,26 @@ class ChapterImporter:
         return len(self.scenes)
 
     @classmethod
-    def Load(cls, src: pathlib.Path):
-        chapter = ChapterImporter()
+    def Load(cls, src: pathlib.Path, cache: T.Optional[ParseCache] = None):
+        if cache is None:
+            return cls.Parse(src)
 
-        document = Docx.Load(src)
+        key = cache.key(src)
+        record = cache.get(key)
+        if record is not None:
+            return cls.From_record(record)
+
+        chapter = cls.Parse(src)
+        cache.put(key, chapter.to_record())
+        return chapter
+
+    @classmethod
+    def Parse(cls, src: pathlib.Path):
+        chapter = ChapterImporter()
 
         current_scene = Scene()
         empty_count = 0
-        for idx, paragraph in enumerate(document.paragraphs):
+        for idx, paragraph in enumerate(Docx.Iterate(src)):
             if len(paragraph.body) == 0:
                 empty_count += 1
             else:
@@ -70,6 +118,9 @@ class ChapterImporter:
                 empty_count = 0
                 continue
 
+            if paragraph.properties.is_title is False:
+                current_scene.para_ids.append(paragraph.paraId)
+
             if len(paragraph.body) == 0:
                 current_scene.add_para("")
             else:
@@ -89,3 +140,53 @@ class ChapterImporter:
             chapter.title = src.name
 
         return chapter
+
+    def to_record(self) -> ChapterRecord:
+        return (
+            self.title,
+            [
+                (scene.title, scene._body, scene.location, scene.notes, scene.para_ids)
+                for scene in self.scenes
+            ],
+        )
+
+    @classmethod
+    def From_record(cls, record: ChapterRecord):
+        chapter = ChapterImporter()
+        chapter.title, scenes = record
+        for title, body, location, notes, para_ids in scenes:
+            scene = Scene()
+            scene.title, scene._body = title, body
+            scene.location, scene.notes = location, notes
+            scene.para_ids = para_ids
+            chapter.add_scene(scene)
+
+        return chapter
+
+    def compact(self, src: pathlib.Path) -> ParsedChapter:
+        stat = src.stat()
+        return ParsedChapter(
+            source=str(src),
+            title=self.title,
+            scenes=tuple(
+                ParsedScene(
+                    scene.title,
+                    scene.body,
+                    scene.location,
+                    scene.notes,
+                    para_ids=tuple(scene.para_ids),
+                    digest=scene_digest(scene.title, scene.body, scene.location),
+                )
+                for scene in self.scenes
+            ),
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+        )
+
+
+def parse_document(
+    src: T.Union[str, pathlib.Path], cache: T.Optional[ParseCache] = None
+) -> ParsedChapter:
+    """Module level so a process pool can pickle a reference to it"""
+    src = pathlib.Path(src)
+    return ChapterImporter.Load(src, cache=cache).compact(src)
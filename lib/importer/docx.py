@@ -3,9 +3,19 @@ from pathlib import Path
 from zipfile import ZipFile
 import unicodedata
 
-from lxml.etree import fromstring, _Element
+from lxml.etree import XPath, iterparse, _Element
 
-from .tags_and_ns import TAGS, NS
+from .styles import StyleMap, justification
+from .tags_and_ns import NAMESPACES, TAGS
+
+# Compiled once, each is a single pass over the paragraph's children
+STYLE_XPATH = XPath("string(w:pPr/w:pStyle/@w:val)", namespaces=NAMESPACES)
+JUSTIFICATION_XPATH = XPath("string(w:pPr/w:jc/@w:val)", namespaces=NAMESPACES)
+PAGE_BREAK_XPATH = XPath("boolean(w:r/w:br)", namespaces=NAMESPACES)
+TEXT_XPATH = XPath("w:r/w:t", namespaces=NAMESPACES)
+
+RUN_SEPARATOR = "\x00"
+"""Can't appear in XML text and normalization never moves anything across it"""
 
 
 class UNSET:
@@ -15,10 +25,13 @@ class UNSET:
 class DocxProperty:
     style_name: str
     orientation: str
+    kind: str
+    """"title"/"subtitle" when the style is, or is based on, one of those"""
 
-    def __init__(self, style_name, orientation):
+    def __init__(self, style_name, orientation, kind=None):
         self.style_name = style_name
         self.orientation = orientation
+        self.kind = style_name.lower() if kind is None else kind
 
     @property
     def is_left(self):
@@ -38,11 +51,11 @@ class DocxProperty:
 
     @property
     def is_title(self):
-        return self.style_name.lower() == "title"
+        return self.kind == "title"
 
     @property
     def is_subtitle(self):
-        return self.style_name.lower() == "subtitle"
+        return self.kind == "subtitle"
 
     @classmethod
     def Load(cls, src_elm: _Element):
@@ -99,26 +112,28 @@ class DocxParagraph:
         return len(self.body) == 0
 
     @classmethod
-    def Load(cls, src_elm: _Element):
-        property_xml = src_elm.find(TAGS.ParaStyle.value)
-        property = (
-            DocxProperty.Load(property_xml)
-            if property_xml is not None
-            else DocxProperty.Default()
-        )
-
-        body = []
-        hard_break = False
-        for run_elm in src_elm.findall(TAGS.Run.value):  # type: _Element
-            if run_elm.find(TAGS.PageBreak.value) is not None:
-                hard_break = True
-
-            for text_elm in run_elm.findall(TAGS.Text.value):  # type: _Element
-                cleaned = unicodedata.normalize("NFKD", text_elm.text)
-                body.append(cleaned)
+    def Load(cls, src_elm: _Element, styles: T.Optional[StyleMap] = None):
+        style_id = STYLE_XPATH(src_elm)
+        orientation = justification(JUSTIFICATION_XPATH(src_elm))
+        style = None if styles is None else styles.get(style_id)
+        if style is None:
+            property = DocxProperty(style_id or "Normal", orientation or "both")
+        else:
+            property = DocxProperty(
+                style_id or style.style_id,
+                orientation or style.justification or "both",
+                kind=style.kind or "",
+            )
+
+        body = [text_elm.text or "" for text_elm in TEXT_XPATH(src_elm)]
+        if len(body) > 0:
+            # One normalize call per paragraph, none at all for plain ASCII
+            joined = RUN_SEPARATOR.join(body)
+            if joined.isascii() is False:
+                body = unicodedata.normalize("NFKD", joined).split(RUN_SEPARATOR)
 
         paraId = src_elm.attrib[TAGS.paraId.value]
-        return cls(body, property, paraId, hard_break=hard_break)
+        return cls(body, property, paraId, hard_break=PAGE_BREAK_XPATH(src_elm))
 
 
 class Docx:
@@ -151,18 +166,39 @@ class Docx:
 
     @classmethod
     def Load(cls, file_path: Path):
+        paragraphs = list(cls.Iterate(file_path))  # type: T.List[DocxParagraph]
+
+        stat = file_path.stat()
+        return cls(paragraphs, stat.st_ctime, stat.st_mtime, stat.st_size)
+
+    @classmethod
+    def Iterate(cls, file_path: Path) -> T.Iterator[DocxParagraph]:
+        """
+        Stream the body's paragraphs straight out of the zip member
+
+        Each paragraph is cleared, along with anything before it, once it has
+        been read so memory stays flat however long the document is.  The zip is
+        closed when the generator is exhausted or closed.
+
+        Paragraphs are classified through the document's resolved styles, see
+        .styles.StyleMap.
+        """
         assert file_path.exists() is True
         assert file_path.is_file() is True
         assert file_path.suffix == ".docx"
 
-        zip_file = ZipFile(file_path).read("word/document.xml")
-        doc_elm = fromstring(zip_file)
-        body = doc_elm[0]
-
-        paragraphs = [
-            DocxParagraph.Load(raw_paragraph)
-            for raw_paragraph in body.findall(TAGS.ParaType.value)
-        ]  # type: T.List[DocxParagraph]
-
-        stat = file_path.stat()
-        return cls(paragraphs, stat.st_ctime, stat.st_mtime, stat.st_size)
+        with ZipFile(file_path) as archive, archive.open("word/document.xml") as xml:
+            styles = StyleMap.Load(archive)
+            for _, element in iterparse(
+                xml, events=("end",), tag=TAGS.ParaType.value
+            ):  # type: str, _Element
+                body = element.getparent()
+                if body is None or body.tag != TAGS.Body.value:
+                    # Paragraphs nested in tables etc. go with their container
+                    continue
+
+                yield DocxParagraph.Load(element, styles)
+
+                element.clear(keep_tail=True)
+                while element.getprevious() is not None:
+                    del body[0]
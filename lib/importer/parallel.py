@@ -0,0 +1,115 @@
+"""
+Parse a batch of documents on a process pool
+
+The lxml parse and unicode normalization are CPU bound, so documents are
+spread across worker processes.  Results are always handed back in the order
+the documents were given, however the workers finish, which keeps an import
+deterministic; `on_parsed` hears about each document as soon as it is done.
+Only WINDOW documents per worker are in flight, the next is submitted as
+each result is handed back, so a long batch never holds all its parsed
+prose at once.
+
+Imports run on a job thread while the writer, the read pool and the sync
+watchers are running, so the workers are never forked from this process: a
+fork copies whatever logging, SQLite or executor locks those threads hold.
+They come from a forkserver where one is available, otherwise are spawned.
+"""
+import collections
+import multiprocessing
+import os
+import pathlib
+import typing as T
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from .chapter_importer import ParsedChapter, parse_document
+from .parse_cache import ParseCache
+
+WINDOW = 2
+"""Documents in flight per worker, only these are held in memory at once"""
+
+OnParsed = T.Callable[[int, ParsedChapter], None]
+"""Called with the document's position and result, in completion order"""
+
+
+def worker_count(jobs: T.Optional[int]) -> int:
+    """`jobs` of None or 0 means one worker per CPU"""
+    if jobs is None or jobs <= 0:
+        return os.cpu_count() or 1
+
+    return jobs
+
+
+def start_method() -> str:
+    """Never "fork", see the module docstring"""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return "forkserver"
+
+    return "spawn"
+
+
+def parse_documents(
+    documents: T.Sequence[pathlib.Path],
+    jobs: T.Optional[int] = None,
+    on_parsed: T.Optional[OnParsed] = None,
+    cache: T.Optional[ParseCache] = None,
+) -> T.Iterator[ParsedChapter]:
+    """
+    Yield a ParsedChapter per document, in source order
+
+    With a single worker, or a single document, everything is parsed in this
+    process.  Closing the generator early cancels any parse not yet started.
+    `cache` is trimmed back to its size once the batch is done.
+    """
+    try:
+        yield from parse_batch(documents, jobs, on_parsed, cache)
+    finally:
+        if cache is not None:
+            cache.evict()
+
+
+def parse_batch(
+    documents: T.Sequence[pathlib.Path],
+    jobs: T.Optional[int],
+    on_parsed: T.Optional[OnParsed],
+    cache: T.Optional[ParseCache],
+) -> T.Iterator[ParsedChapter]:
+    workers = min(worker_count(jobs), len(documents))
+    if workers <= 1:
+        for position, document in enumerate(documents):
+            parsed = parse_document(document, cache)
+            if on_parsed is not None:
+                on_parsed(position, parsed)
+            yield parsed
+        return
+
+    def notify(position: int):
+        def done(future: Future):
+            if on_parsed is not None and future.exception() is None:
+                on_parsed(position, future.result())
+
+        return done
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context(start_method())
+    )
+    try:
+        pending = enumerate(documents)
+        in_flight: T.Deque[Future] = collections.deque()
+
+        def submit():
+            following = next(pending, None)
+            if following is not None:
+                position, document = following
+                future = executor.submit(parse_document, str(document), cache)
+                future.add_done_callback(notify(position))
+                in_flight.append(future)
+
+        for _ in range(workers * WINDOW):
+            submit()
+
+        while len(in_flight) > 0:
+            parsed = in_flight.popleft().result()
+            submit()
+            yield parsed
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,122 @@
+"""
+On disk cache of parsed documents
+
+Parsing is by far the slowest part of an import, while most documents in a
+reimported or retried directory have not changed.  Entries are keyed on the
+document's absolute path, size, mtime and a hash of its bytes, so a cache
+hit costs one read of the file.  Each entry is the parsed chapter marshalled
+and zlib compressed, written to a temporary name and renamed into place so
+parse workers in other processes never see half an entry.
+
+Hits bump the entry's mtime and, once the cache grows past `max_bytes`, the
+least recently used entries are removed first.  Eviction scans the whole
+directory, so it runs once per batch in the importing process (see
+`parallel.parse_documents`) rather than after every `put` in the workers.
+"""
+import hashlib
+import marshal
+import os
+import pathlib
+import typing as T
+import zlib
+
+from ..log_helper import getLogger
+
+log = getLogger(__name__)
+
+FORMAT = 2
+"""Bump when the cached record changes shape, older entries are then ignored"""
+SUFFIX = ".parsed"
+
+ChapterRecord = T.Tuple[str, T.List[T.Tuple[str, T.List[str], str, str, T.List[str]]]]
+"""title, then per scene: title, paragraphs, location, notes, paragraph ids"""
+
+
+class ParseCache:
+    """Plain values only so it can travel to the parse worker processes"""
+
+    directory: pathlib.Path
+    max_bytes: int
+
+    def __init__(self, directory: T.Union[str, os.PathLike], max_bytes: int):
+        self.directory = pathlib.Path(directory)
+        self.max_bytes = max_bytes
+
+    def key(self, src: pathlib.Path) -> str:
+        src = src.absolute()
+        stat = src.stat()
+        digest = hashlib.blake2b(src.read_bytes(), digest_size=20).hexdigest()
+        fingerprint = f"{src}\0{stat.st_size}\0{stat.st_mtime_ns}\0{digest}"
+        return hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=20).hexdigest()
+
+    def entry(self, key: str) -> pathlib.Path:
+        return self.directory / f"{key}{SUFFIX}"
+
+    def get(self, key: str) -> T.Optional[ChapterRecord]:
+        path = self.entry(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        try:
+            version, record = marshal.loads(zlib.decompress(data))
+        except (ValueError, EOFError, TypeError, zlib.error):
+            log.warning("Dropping unreadable cache entry {}", path.name)
+            path.unlink(missing_ok=True)
+            return None
+
+        return record if version == FORMAT else None
+
+    def put(self, key: str, record: ChapterRecord):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.entry(key)
+        temporary = path.with_name(f"{path.name}.{os.getpid()}")
+        temporary.write_bytes(zlib.compress(marshal.dumps((FORMAT, record))))
+        os.replace(temporary, path)
+
+    def entries(self) -> T.List[os.DirEntry]:
+        try:
+            with os.scandir(self.directory) as found:
+                return [entry for entry in found if entry.name.endswith(SUFFIX)]
+        except FileNotFoundError:
+            return []
+
+    def stats(self) -> T.List[T.Tuple[os.DirEntry, os.stat_result]]:
+        """Entries with their stat, skipping any removed meanwhile"""
+        found = []
+        for entry in self.entries():
+            try:
+                found.append((entry, entry.stat()))
+            except FileNotFoundError:
+                # Purged, or evicted by another import
+                continue
+
+        return found
+
+    def size(self) -> int:
+        return sum(stat.st_size for _, stat in self.stats())
+
+    def evict(self) -> int:
+        """Remove the least recently used entries until under max_bytes"""
+        entries = sorted(self.stats(), key=lambda found: found[1].st_mtime_ns)
+        total = sum(stat.st_size for _, stat in entries)
+
+        removed = 0
+        for entry, stat in entries:
+            if total <= self.max_bytes:
+                break
+            total -= stat.st_size
+            pathlib.Path(entry.path).unlink(missing_ok=True)
+            removed += 1
+
+        return removed
+
+    def purge(self) -> int:
+        """Empty the cache, returns how many entries were removed"""
+        entries = self.entries()
+        for entry in entries:
+            pathlib.Path(entry.path).unlink(missing_ok=True)
+
+        return len(entries)
@@ -0,0 +1,117 @@
+"""
+Cheap previews of the documents in an import directory
+
+Word saves word, paragraph and page counts in docProps/app.xml, reading that
+is a few hundred bytes instead of the whole document.  Documents without it
+(or written by tools that leave it out) get a text only scan of
+word/document.xml which skips the styling a real import has to look at.
+
+The import dialog lists the files straight away and a preview job reports
+each document's counts through the UI callback as they arrive.
+"""
+import pathlib
+import typing as T
+from zipfile import BadZipFile, ZipFile
+
+from lxml.etree import XMLSyntaxError, fromstring, iterparse
+
+from ..app_types import DocumentFile, DocumentPreview
+from ..log_helper import getLogger
+from .tags_and_ns import PROPS, TAGS
+
+if T.TYPE_CHECKING:
+    from ..jobs import JobContext
+
+log = getLogger(__name__)
+
+
+def read_properties(
+    archive: ZipFile,
+) -> T.Optional[T.Tuple[int, int, T.Optional[int]]]:
+    """(words, paragraphs, pages) from docProps/app.xml, None if not recorded"""
+    try:
+        properties = fromstring(archive.read("docProps/app.xml"))
+    except (KeyError, XMLSyntaxError):
+        return None
+
+    def count(prop: PROPS) -> T.Optional[int]:
+        value = properties.findtext(prop.value)
+        return int(value) if value is not None and value.isdigit() else None
+
+    words, paragraphs = count(PROPS.Words), count(PROPS.Paragraphs)
+    if words is None or paragraphs is None:
+        return None
+
+    return words, paragraphs, count(PROPS.Pages)
+
+
+def scan_counts(archive: ZipFile) -> T.Tuple[int, int]:
+    """(words, paragraphs) counted from the text runs alone"""
+    words = paragraphs = 0
+    in_word = False
+    with archive.open("word/document.xml") as xml:
+        for _, element in iterparse(
+            xml, events=("end",), tag=(TAGS.Text.value, TAGS.ParaType.value)
+        ):
+            if element.tag == TAGS.ParaType.value:
+                paragraphs += 1
+                in_word = False
+                element.clear(keep_tail=True)
+                continue
+
+            # A word can be split over several runs, only count where one starts
+            for char in element.text or "":
+                if char.isspace():
+                    in_word = False
+                elif in_word is False:
+                    in_word = True
+                    words += 1
+
+    return words, paragraphs
+
+
+def preview_document(path: pathlib.Path) -> DocumentPreview:
+    with ZipFile(path) as archive:
+        properties = read_properties(archive)
+        if properties is not None:
+            words, paragraphs, pages = properties
+            source = "metadata"
+        else:
+            (words, paragraphs), pages = scan_counts(archive), None
+            source = "scan"
+
+    return DocumentPreview(
+        action="preview",
+        name=path.name,
+        path=str(path.parent),
+        words=words,
+        paragraphs=paragraphs,
+        pages=pages,
+        source=source,
+    )
+
+
+def preview_documents(
+    context: "JobContext",
+    documents: T.List[DocumentFile],
+    reporter_id: T.Optional[str] = None,
+) -> T.Dict[str, int]:
+    """Preview job, reports each document as soon as it has been counted"""
+    app = context.app
+    words = dict()
+    for document in documents:
+        context.check()
+        path = pathlib.Path(document["path"]) / document["name"]
+        try:
+            preview = preview_document(path)
+        except (OSError, BadZipFile, KeyError, XMLSyntaxError) as exc:
+            log.warning("Could not preview {}: {}", path, exc)
+            context.progress(document["size"])
+            continue
+
+        words[document["name"]] = preview["words"]
+        if reporter_id is not None:
+            app.callback(reporter_id, preview)
+        context.progress(document["size"])
+
+    return words
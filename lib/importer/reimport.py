@@ -0,0 +1,63 @@
+"""
+Incremental chapter reimport
+
+Every imported scene remembers the w14:paraId of the paragraphs it came from
+and a digest of what the import wrote (see Scene.source_paras/source_digest).
+Word keeps a paragraph's id across edits, so a fresh parse can be matched to
+the scenes already in the database by shared paragraph ids.  Matched scenes
+keep their uid, status, characters, notes and summary and are only rewritten
+if their digest changed; unmatched parsed scenes are added and unmatched old
+scenes are removed.
+"""
+import typing as T
+
+from .chapter_importer import ParsedScene
+
+
+class SceneFingerprint(T.NamedTuple):
+    uid: str
+    para_ids: T.Optional[T.Sequence[str]]
+    """None for scenes imported before fingerprints were stored"""
+    digest: T.Optional[str]
+
+
+def match_scenes(
+    previous: T.Sequence[SceneFingerprint], parsed: T.Sequence[ParsedScene]
+) -> T.List[T.Optional[int]]:
+    """
+    For each parsed scene, the index of the previous scene it continues or None
+
+    The pairs sharing the most paragraphs are matched first, a previous scene
+    is matched at most once.  A chapter imported before fingerprints existed
+    has nothing to compare so its scenes are matched by position instead.
+    """
+    matches: T.List[T.Optional[int]] = [None] * len(parsed)
+
+    if all(scene.para_ids is None for scene in previous):
+        for position in range(min(len(previous), len(parsed))):
+            matches[position] = position
+        return matches
+
+    owners: T.Dict[str, int] = dict()
+    for index, scene in enumerate(previous):
+        for para_id in scene.para_ids or ():
+            owners[para_id] = index
+
+    candidates = []
+    for position, scene in enumerate(parsed):
+        shared: T.Dict[int, int] = dict()
+        for para_id in scene.para_ids:
+            if para_id in owners:
+                shared[owners[para_id]] = shared.get(owners[para_id], 0) + 1
+
+        candidates.extend(
+            (-overlap, position, index) for index, overlap in shared.items()
+        )
+
+    claimed = set()
+    for _, position, index in sorted(candidates):
+        if matches[position] is None and index not in claimed:
+            matches[position] = index
+            claimed.add(index)
+
+    return matches
@@ -0,0 +1,104 @@
+"""
+Resolved paragraph styles from word/styles.xml
+
+A paragraph's look usually comes from its style rather than from the
+paragraph itself, and styles inherit from each other through `w:basedOn`.
+StyleMap walks those chains once per document so classifying a paragraph is
+a dictionary lookup: a "Chapter Heading" based on Title is a title, and a
+style that centres its text makes its paragraphs centred.
+"""
+import typing as T
+from zipfile import ZipFile
+
+from lxml.etree import XPath, XMLSyntaxError, fromstring, _Element
+
+from .tags_and_ns import NAMESPACES, TAGS
+
+KINDS = ("title", "subtitle")
+"""Style names the importer treats specially, matched case insensitively"""
+
+JUSTIFICATION_ALIASES = dict(start="left", end="right")
+"""Strict OOXML names the sides by reading direction"""
+
+PARAGRAPH_STYLES_XPATH = XPath("w:style[@w:type='paragraph']", namespaces=NAMESPACES)
+NAME_XPATH = XPath("string(w:name/@w:val)", namespaces=NAMESPACES)
+BASED_ON_XPATH = XPath("string(w:basedOn/@w:val)", namespaces=NAMESPACES)
+STYLE_JUSTIFICATION_XPATH = XPath("string(w:pPr/w:jc/@w:val)", namespaces=NAMESPACES)
+
+
+def justification(value: str) -> str:
+    return JUSTIFICATION_ALIASES.get(value, value)
+
+
+class ResolvedStyle(T.NamedTuple):
+    style_id: str
+    kind: T.Optional[str]
+    """One of KINDS if the style or one it is based on is named that"""
+    justification: T.Optional[str]
+    """The nearest justification up the basedOn chain"""
+
+
+class StyleMap:
+    styles: T.Dict[str, ResolvedStyle]
+    default: T.Optional[str]
+    """Style id used by paragraphs that don't name one"""
+
+    def __init__(self, styles: T.Dict[str, ResolvedStyle], default=None):
+        self.styles = styles
+        self.default = default
+
+    def get(self, style_id: str) -> T.Optional[ResolvedStyle]:
+        return self.styles.get(style_id or self.default)
+
+    @classmethod
+    def Empty(cls):
+        return cls(dict())
+
+    @classmethod
+    def Load(cls, archive: ZipFile) -> "StyleMap":
+        try:
+            root = fromstring(archive.read("word/styles.xml"))
+        except (KeyError, XMLSyntaxError):
+            return cls.Empty()
+
+        return cls.Parse(root)
+
+    @classmethod
+    def Parse(cls, root: _Element) -> "StyleMap":
+        raw = dict()  # style id -> (kind, justification, based on)
+        default = None
+        for element in PARAGRAPH_STYLES_XPATH(root):
+            style_id = element.get(TAGS.StyleId.value)
+            if style_id is None:
+                continue
+
+            if element.get(TAGS.Default.value) in ("1", "true", "on"):
+                default = style_id
+
+            names = {style_id.lower(), NAME_XPATH(element).lower()}
+            kind = next((kind for kind in KINDS if kind in names), None)
+            raw[style_id] = (
+                kind,
+                justification(STYLE_JUSTIFICATION_XPATH(element)) or None,
+                BASED_ON_XPATH(element) or None,
+            )
+
+        resolved: T.Dict[str, ResolvedStyle] = dict()
+
+        def resolve(style_id: str, seen: T.FrozenSet[str]) -> ResolvedStyle:
+            if style_id in resolved:
+                return resolved[style_id]
+
+            kind, own_justification, based_on = raw[style_id]
+            if based_on in raw and based_on not in seen:
+                parent = resolve(based_on, seen | {style_id})
+                kind = kind or parent.kind
+                own_justification = own_justification or parent.justification
+
+            resolved[style_id] = ResolvedStyle(style_id, kind, own_justification)
+            return resolved[style_id]
+
+        for style_id in raw:
+            resolve(style_id, frozenset())
+
+        return cls(resolved, default)
@@ -0,0 +1,237 @@
+"""
+Keep imported books in step with their source directory
+
+A scan stats the book's import_dir in one `os.scandir` pass and compares it
+with the size and modification time stored on each chapter, fetched with a
+single query.  Syncing hands the stale chapters to background reimport jobs
+(see .reimport), and a watcher repeats that on a timer for open books.
+"""
+import datetime as DT
+import os
+import pathlib
+import threading
+import typing as T
+
+from sqlalchemy import select
+
+from .. import models
+from ..app_types import SyncReport, UniqueId
+from ..log_helper import getLogger
+
+if T.TYPE_CHECKING:
+    from ..application import BCApplication
+
+log = getLogger(__name__)
+
+MTIME_TOLERANCE = 0.001
+"""Seconds, covers the float to datetime round trip of source_modified"""
+
+OnChange = T.Callable[[SyncReport], None]
+
+
+class DocumentStat(T.NamedTuple):
+    path: str
+    size: int
+    mtime: float
+
+
+def path_key(path: T.Union[str, os.PathLike]) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def is_document(name: str) -> bool:
+    """Same rules as the import dialog: word documents, no lock or hidden files"""
+    return (
+        name.endswith(".docx")
+        and name.startswith("~") is False
+        and name.startswith("_") is False
+    )
+
+
+def scan_directory(import_dir: pathlib.Path) -> T.Dict[str, DocumentStat]:
+    """Every document in `import_dir`, keyed by path_key"""
+    documents = dict()
+    with os.scandir(import_dir) as entries:
+        for entry in entries:
+            if is_document(entry.name) is False or entry.is_file() is False:
+                continue
+
+            stat = entry.stat()
+            documents[path_key(entry.path)] = DocumentStat(
+                entry.path, stat.st_size, stat.st_mtime
+            )
+
+    return documents
+
+
+def stored_mtime(value: T.Any) -> T.Optional[float]:
+    """source_modified has been written as a datetime, read it back as a timestamp"""
+    if isinstance(value, DT.datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        try:
+            return DT.datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            return None
+    if isinstance(value, (int, float)) and value > 0:
+        return float(value)
+
+    return None
+
+
+def scan_book(session: models.Session, book_uid: UniqueId) -> SyncReport:
+    """Compare a book's chapters with its import directory, changes nothing"""
+    rows = session.execute(
+        select(
+            models.Book.import_dir,
+            models.Chapter.uid,
+            models.Chapter.source_file,
+            models.Chapter.source_size,
+            models.Chapter.source_modified,
+        )
+        .outerjoin(models.Chapter, models.Chapter.book_id == models.Book.id)
+        .where(models.Book.uid == book_uid)
+    ).all()
+    if len(rows) == 0:
+        raise models.NoResultFound(f"No book {book_uid}")
+
+    import_dir = rows[0].import_dir
+    if import_dir is None or import_dir.is_dir() is False:
+        raise ValueError(f"{import_dir} is not a valid directory")
+
+    documents = scan_directory(import_dir)
+    report = SyncReport(
+        book_id=book_uid,
+        import_dir=str(import_dir),
+        new=[],
+        removed=[],
+        modified=[],
+        unchanged=0,
+        jobs=[],
+    )
+
+    seen = set()
+    for row in rows:
+        # Chapters written by hand have no source, it is stored as "None"
+        if row.uid is None or row.source_file.is_absolute() is False:
+            continue
+
+        key = path_key(row.source_file)
+        seen.add(key)
+        document = documents.get(key)
+        if document is None:
+            report["removed"].append(row.uid)
+            continue
+
+        mtime = stored_mtime(row.source_modified)
+        if (
+            document.size != row.source_size
+            or mtime is None
+            or abs(document.mtime - mtime) > MTIME_TOLERANCE
+        ):
+            report["modified"].append(row.uid)
+        else:
+            report["unchanged"] += 1
+
+    report["new"] = sorted(
+        pathlib.Path(document.path).name
+        for key, document in documents.items()
+        if key not in seen
+    )
+    return report
+
+
+def report_changes(report: SyncReport) -> T.Tuple[T.FrozenSet[str], ...]:
+    """What a watcher compares between one report and the next"""
+    return tuple(frozenset(report[key]) for key in ("new", "removed", "modified"))
+
+
+class SourceSync:
+    """Scans, reimports and watches imported books for the application"""
+
+    app: "BCApplication"
+
+    _reimports: T.Dict[UniqueId, UniqueId]
+    """chapter uid -> the reimport job last submitted for it"""
+    _watchers: T.Dict[UniqueId, T.Tuple[threading.Thread, threading.Event]]
+
+    def __init__(self, app: "BCApplication"):
+        self.app = app
+        self._reimports = dict()
+        self._watchers = dict()
+        self._lock = threading.Lock()
+
+    def scan(self, book_uid: UniqueId) -> SyncReport:
+        with self.app.get_db() as session:
+            return scan_book(session, book_uid)
+
+    def sync(self, book_uid: UniqueId) -> SyncReport:
+        """Scan, then reimport the modified chapters in the background"""
+        report = self.scan(book_uid)
+        with self._lock:
+            for chapter_uid in report["modified"]:
+                job_uid = self._reimports.get(chapter_uid)
+                if job_uid is not None and self._in_flight(job_uid):
+                    continue
+
+                job_uid = self.app.jobs.submit(
+                    "reimport", dict(chapter_uid=chapter_uid)
+                )
+                self._reimports[chapter_uid] = job_uid
+                report["jobs"].append(job_uid)
+
+        return report
+
+    def _in_flight(self, job_uid: UniqueId) -> bool:
+        try:
+            return self.app.jobs.status(job_uid)["status"] in ("pending", "running")
+        except models.NoResultFound:
+            return False
+
+    def watch(self, book_uid: UniqueId, on_change: OnChange, interval: float = 5.0):
+        """
+        Sync `book_uid` every `interval` seconds, `on_change` hears of changes
+
+        Sync leaves new and removed documents alone, so they show up in every
+        report; `on_change` is only called when the report differs from the
+        one before.
+        """
+        self.unwatch(book_uid)
+
+        stop = threading.Event()
+
+        def poll():
+            previous = (frozenset(), frozenset(), frozenset())
+            while stop.wait(interval) is False:
+                try:
+                    report = self.sync(book_uid)
+                except Exception:
+                    log.exception("Sync of {} failed, no longer watching", book_uid)
+                    return
+
+                changes = report_changes(report)
+                if changes != previous:
+                    previous = changes
+                    on_change(report)
+
+        watcher = threading.Thread(
+            target=poll, name=f"BCWatch-{book_uid}", daemon=True
+        )
+        self._watchers[book_uid] = (watcher, stop)
+        watcher.start()
+
+    def unwatch(self, book_uid: UniqueId) -> bool:
+        watcher = self._watchers.pop(book_uid, None)
+        if watcher is None:
+            return False
+
+        thread, stop = watcher
+        stop.set()
+        if thread is not threading.current_thread():
+            thread.join()
+
+        return True
+
+    def shutdown(self):
+        for book_uid in list(self._watchers):
+            self.unwatch(book_uid)
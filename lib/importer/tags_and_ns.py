@@ -3,10 +3,19 @@ from enum import Enum
 
 class NS(Enum):
     MAIN_WORD = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+    EXTENDED_PROPERTIES = (
+        "{http://schemas.openxmlformats.org/officeDocument/2006/extended-properties}"
+    )
     WORD_ML = "{http://schemas.microsoft.com/office/word/2010/wordml}"
     WORD_ML_20210 = "{http://schemas.microsoft.com/office/word/2010/wordml}"
 
 
+NAMESPACES = dict(
+    w=NS.MAIN_WORD.value.strip("{}"), w14=NS.WORD_ML_20210.value.strip("{}")
+)
+"""Prefixes for XPath expressions"""
+
+
 """
 It helps to read the spec slightly intoxicated.
 
@@ -49,3 +58,13 @@ class TAGS(Enum):
     PageBreak = f"{NS.MAIN_WORD.value}br"
     StyleType = f"{NS.MAIN_WORD.value}pStyle"
     paraId = f"{NS.WORD_ML_20210.value}paraId"
+    StyleId = f"{NS.MAIN_WORD.value}styleId"
+    Default = f"{NS.MAIN_WORD.value}default"
+
+
+class PROPS(Enum):
+    """Counts Word keeps in docProps/app.xml, as of the last save"""
+
+    Words = f"{NS.EXTENDED_PROPERTIES.value}Words"
+    Paragraphs = f"{NS.EXTENDED_PROPERTIES.value}Paragraphs"
+    Pages = f"{NS.EXTENDED_PROPERTIES.value}Pages"
@@ -0,0 +1,300 @@
+"""
+Background jobs
+
+Long running work (imports, maintenance) is registered by kind with the
+JobManager and started with `submit`, which hands back the job's uid
+straight away.  Handlers run on a small worker pool, report progress in bytes
+through their JobContext and, like everything else, write to the database
+through the application's writer thread.
+
+Job state lives in the `Job` table.  Anything still pending or running when
+the app starts was interrupted by a crash or a forced exit, it stays around
+until it is resumed or cleaned up.
+"""
+import datetime as DT
+import time
+import typing as T
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import update, text
+from sqlalchemy.orm import Session
+
+from . import models
+from .app_types import JobStatus, JobType, UniqueId
+from .log_helper import getLogger
+
+if T.TYPE_CHECKING:
+    from .application import BCApplication
+
+log = getLogger(__name__)
+
+JobHandler = T.Callable[..., T.Any]
+"""Called as handler(context, **payload), returns a JSON friendly result"""
+
+
+class JobCleanup(T.Protocol):
+    """Undoes a partial run, called with the job's checkpoint and payload"""
+
+    def __call__(self, app: "BCApplication", checkpoint: dict, **payload) -> None:
+        ...
+
+
+ACTIVE = (JobStatus.pending, JobStatus.running)
+RESUMABLE = (JobStatus.interrupted, JobStatus.failed, JobStatus.cancelled)
+
+
+class JobCancelled(Exception):
+    """Raised inside a handler once its job has been cancelled"""
+
+
+class JobContext:
+    """A running handler's line back to its job"""
+
+    uid: UniqueId
+    checkpoint: dict
+    bytes_done: int
+
+    def __init__(
+        self, manager: "JobManager", job_uid: UniqueId, checkpoint: dict, bytes_done=0
+    ):
+        self.manager = manager
+        self.uid = job_uid
+        self.checkpoint = checkpoint
+        self.bytes_done = bytes_done
+
+    @property
+    def app(self) -> "BCApplication":
+        return self.manager.app
+
+    @property
+    def cancelled(self) -> bool:
+        return self.uid in self.manager.cancelled
+
+    def check(self):
+        if self.cancelled:
+            raise JobCancelled(self.uid)
+
+    def set_total(self, bytes_total: int):
+        self.manager.update(self.uid, bytes_total=bytes_total)
+
+    def progress(
+        self,
+        advance: int = 0,
+        message: T.Optional[str] = None,
+        checkpoint: T.Optional[dict] = None,
+    ):
+        """Record `advance` more bytes processed, then honour any cancellation"""
+        self.bytes_done += advance
+        values = dict(bytes_done=self.bytes_done)
+        if message is not None:
+            values["message"] = message
+        if checkpoint is not None:
+            self.checkpoint = checkpoint
+            values["checkpoint"] = checkpoint
+
+        self.manager.update(self.uid, **values)
+        self.check()
+
+    def save_checkpoint(self, session: Session, checkpoint: dict, advance: int = 0):
+        """
+        Stage the checkpoint in `session` so it commits with the work it describes
+
+        Must be called from the writer thread, inside the write being checkpointed.
+        """
+        self.checkpoint = checkpoint
+        self.bytes_done += advance
+        session.execute(
+            update(models.Job)
+            .where(models.Job.uid == self.uid)
+            .values(checkpoint=checkpoint, bytes_done=self.bytes_done)
+        )
+
+
+class JobManager:
+    app: "BCApplication"
+    cancelled: set[UniqueId]
+
+    _handlers: dict[str, T.Tuple[JobHandler, T.Optional[JobCleanup]]]
+    _runs: dict[UniqueId, T.Tuple[float, int]]
+    """Monotonic start time and bytes_done at start, for the running jobs"""
+
+    def __init__(self, app: "BCApplication", max_workers=2):
+        self.app = app
+        self.cancelled = set()
+        self._handlers = dict()
+        self._runs = dict()
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="BCJob"
+        )
+
+    def register(
+        self, kind: str, handler: JobHandler, cleanup: T.Optional[JobCleanup] = None
+    ):
+        self._handlers[kind] = (handler, cleanup)
+
+    def update(self, job_uid: UniqueId, **values):
+        def apply():
+            with self.app.get_db() as session:
+                session.execute(
+                    update(models.Job).where(models.Job.uid == job_uid).values(**values)
+                )
+                session.commit()
+
+        self.app.write(apply)
+
+    def submit(
+        self, kind: str, payload: T.Optional[dict] = None, bytes_total=0
+    ) -> UniqueId:
+        if kind not in self._handlers:
+            raise ValueError(f"No handler registered for {kind!r} jobs")
+
+        def create():
+            with self.app.get_db() as session:
+                job = models.Job(
+                    kind=kind, payload=payload or dict(), bytes_total=bytes_total
+                )
+                session.add(job)
+                session.commit()
+                return job.uid
+
+        job_uid = self.app.write(create)
+        self._pool.submit(self._run, job_uid)
+        return job_uid
+
+    def _run(self, job_uid: UniqueId):
+        with self.app.get_db() as session:
+            job = models.Job.Fetch_by_uid(session, job_uid)
+            kind, payload = job.kind, dict(job.payload)
+            checkpoint, bytes_done = dict(job.checkpoint), job.bytes_done
+
+        if job_uid in self.cancelled:
+            self._finish(job_uid, JobStatus.cancelled, message="Cancelled")
+            return
+
+        handler, _ = self._handlers[kind]
+        self._runs[job_uid] = (time.monotonic(), bytes_done)
+        self.update(
+            job_uid, status=JobStatus.running, started_on=DT.datetime.now(), error=None
+        )
+
+        context = JobContext(self, job_uid, checkpoint, bytes_done)
+        try:
+            result = handler(context, **payload)
+        except JobCancelled:
+            self._finish(job_uid, JobStatus.cancelled, message="Cancelled")
+        except Exception as exc:
+            log.exception("{} job {} failed", kind, job_uid)
+            self._finish(job_uid, JobStatus.failed, error=str(exc))
+        else:
+            self._finish(job_uid, JobStatus.done, result=result)
+
+    def _finish(self, job_uid: UniqueId, status: JobStatus, **values):
+        self._runs.pop(job_uid, None)
+        self.cancelled.discard(job_uid)
+        self.update(job_uid, status=status, finished_on=DT.datetime.now(), **values)
+
+    def eta(self, job: models.Job) -> T.Optional[float]:
+        """Seconds left at the byte rate seen since this run started"""
+        run = self._runs.get(job.uid)
+        if run is None or job.status != JobStatus.running:
+            return None
+
+        started, baseline = run
+        processed = job.bytes_done - baseline
+        elapsed = time.monotonic() - started
+        if processed <= 0 or elapsed <= 0:
+            return None
+
+        return max(job.bytes_total - job.bytes_done, 0) / (processed / elapsed)
+
+    def status(self, job_uid: UniqueId) -> JobType:
+        with self.app.get_db() as session:
+            job = models.Job.Fetch_by_uid(session, job_uid)
+            return job.asdict(eta=self.eta(job))
+
+    def list(self, *statuses: JobStatus) -> T.List[JobType]:
+        with self.app.get_db() as session:
+            jobs = models.Job.Fetch_by_status(session, *(statuses or JobStatus))
+            return [job.asdict(eta=self.eta(job)) for job in jobs]
+
+    def cancel(self, job_uid: UniqueId) -> bool:
+        with self.app.get_db() as session:
+            job = models.Job.Fetch_by_uid(session, job_uid)
+            if job.status not in ACTIVE:
+                return False
+
+        self.cancelled.add(job_uid)
+        return True
+
+    def recover(self) -> T.List[UniqueId]:
+        """Flag the jobs a previous run of the app never finished"""
+
+        def flag():
+            with self.app.get_db() as session:
+                jobs = models.Job.Fetch_by_status(session, *ACTIVE)
+                for job in jobs:
+                    job.status = JobStatus.interrupted
+                session.commit()
+                return [job.uid for job in jobs]
+
+        interrupted = self.app.write(flag)
+        if len(interrupted) > 0:
+            log.warning("{} jobs were interrupted: {}", len(interrupted), interrupted)
+
+        return interrupted
+
+    def resume(self, job_uid: UniqueId) -> UniqueId:
+        """Run a stopped job again, its handler continues from the saved checkpoint"""
+        with self.app.get_db() as session:
+            job = models.Job.Fetch_by_uid(session, job_uid)
+            if job.status not in RESUMABLE:
+                raise ValueError(f"Job {job_uid} is {job.status.name}, not resumable")
+
+        self.update(job_uid, status=JobStatus.pending, finished_on=None, error=None)
+        self._pool.submit(self._run, job_uid)
+        return job_uid
+
+    def cleanup(self, job_uid: UniqueId) -> bool:
+        """Undo what a stopped job left behind and forget it"""
+        with self.app.get_db() as session:
+            job = models.Job.Fetch_by_uid(session, job_uid)
+            if job.status in ACTIVE:
+                return False
+            kind, payload = job.kind, dict(job.payload)
+            checkpoint = dict(job.checkpoint)
+
+        _, cleanup = self._handlers.get(kind, (None, None))
+        if cleanup is not None and job.status != JobStatus.done:
+            cleanup(self.app, checkpoint, **payload)
+
+        def forget():
+            with self.app.get_db() as session:
+                session.delete(models.Job.Fetch_by_uid(session, job_uid))
+                session.commit()
+
+        self.app.write(forget)
+        return True
+
+    def shutdown(self):
+        with self.app.get_db() as session:
+            running = models.Job.Fetch_by_status(session, *ACTIVE)
+            self.cancelled.update(job.uid for job in running)
+
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+def optimize_database(context: JobContext) -> bool:
+    """Maintenance: refresh the planner statistics and compact the file"""
+    app = context.app
+    context.set_total(app.database_path.stat().st_size)
+
+    def optimize():
+        with app.engine.connect() as conn:
+            conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+            conn.execute(text("PRAGMA optimize"))
+            context.check()
+            conn.execute(text("VACUUM"))
+
+    app.write(optimize)
+    context.progress(app.database_path.stat().st_size, message="Optimized")
+    return True
@@ -1,9 +1,9 @@
 import pathlib
-import string
-import random
 import contextlib
+import functools
 import typing as T
 import datetime as DT
+import weakref
 
 from typing import Sequence
 
@@ -15,13 +15,20 @@ from sqlalchemy import (
     func,
     Table,
     Column,
-    and_,
     delete,
     insert,
     UniqueConstraint,
     text,
     String,
     Enum,
+    case,
+    event,
+    Index,
+    JSON,
+    DDL,
+    FetchedValue,
+    bindparam,
+    inspect,
 )
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.hybrid import hybrid_property
@@ -37,10 +44,19 @@ from sqlalchemy.orm import (
     sessionmaker,
     attribute_keyed_dict,
     attributes,
+    column_property,
+    validates,
+    joinedload,
+    selectinload,
+    load_only,
+    undefer,
+    undefer_group,
 )
 from sqlalchemy.orm import MappedAsDataclass
+from sqlalchemy.orm.util import identity_key
 
 from .book2disk import TextFile, ListFile, RawFile
+from . import ids
 
 from .sa_pathlike import SAPathlike
 from .log_helper import getLogger
@@ -52,16 +68,38 @@ from .app_types import (
     SettingType,
     SceneStatusType,
     BookTypes,
+    LoadPlan,
+    Fields,
+    OrderType,
+    SceneType,
+    DBProfile,
+    PragmaSettings,
+    JobStatus,
+    JobType,
 )
 
 log = getLogger(__name__)
 
-GEN_LEN = 18
+generate_id = ids.generate_id
 
 
-def generate_id(length) -> UniqueId:
-    alphanum = string.ascii_letters + string.digits
-    return "".join(random.choice(alphanum) for _ in range(length))
+def version_token(uid: UniqueId, revision: int) -> str:
+    """What a conditional fetch compares, see `fetch_version`"""
+    return f"{uid}:{revision}"
+
+
+def fetch_version(session: Session, entity, *criteria) -> str:
+    """The version token of one Book, Chapter or Scene without loading it"""
+    row = session.execute(select(entity.uid, entity.revision).where(*criteria)).one()
+    return version_token(row.uid, row.revision)
+
+
+def count_words(text: T.Optional[str]) -> int:
+    """Rough word/token count used for the stored Scene counters"""
+    if not isinstance(text, str) or len(text.strip()) == 0:
+        return 0
+
+    return len(text.replace('",.!?', " ").strip().split(" "))
 
 
 @contextlib.contextmanager
@@ -75,10 +113,80 @@ def db_with():
         yield session
 
 
-def connect(db_path: pathlib.Path, echo=False):
+SQLITE_PRAGMAS = (
+    "journal_mode",
+    "synchronous",
+    "foreign_keys",
+    "busy_timeout",
+    "cache_size",
+    "mmap_size",
+    "temp_store",
+)
+"""The PRAGMAs a profile may set, in the order they are applied"""
+
+DB_PROFILES: dict[DBProfile, PragmaSettings] = {
+    "compat": {},
+    "performance": dict(
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        foreign_keys="ON",
+        busy_timeout=5000,
+        cache_size=-32000,
+        mmap_size=268435456,
+        temp_store="MEMORY",
+    ),
+}
+"""
+`compat` leaves sqlite's defaults alone (rollback journal, FULL sync).
+`performance` lets readers run alongside the autosave writer and keeps
+hot pages in memory; cache_size is negative so it is in KiB.
+"""
+
+DEFAULT_PROFILE: DBProfile = "performance"
+
+
+def sqlite_pragmas(
+    profile: DBProfile = DEFAULT_PROFILE, overrides: T.Optional[PragmaSettings] = None
+) -> PragmaSettings:
+    """Resolve a named profile plus any overrides into the PRAGMAs to apply"""
+    if profile not in DB_PROFILES:
+        raise ValueError(f"Unknown database profile {profile!r}")
+
+    pragmas = dict(DB_PROFILES[profile])
+    for name, value in (overrides or {}).items():
+        if name not in SQLITE_PRAGMAS:
+            raise ValueError(f"Unsupported PRAGMA {name!r}")
+        elif not isinstance(value, int) and not str(value).isalnum():
+            raise ValueError(f"Invalid value {value!r} for PRAGMA {name}")
+
+        pragmas[name] = value
+
+    return {name: pragmas[name] for name in SQLITE_PRAGMAS if name in pragmas}
+
+
+def apply_pragmas(engine, pragmas: PragmaSettings):
+    """Run `pragmas` on every new DBAPI connection the engine opens"""
+    if len(pragmas) == 0:
+        return
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+def connect(
+    db_path: pathlib.Path,
+    echo=False,
+    profile: DBProfile = DEFAULT_PROFILE,
+    pragmas: T.Optional[PragmaSettings] = None,
+):
     engine = create_engine(
         f"sqlite:///{db_path}", echo=echo, pool_size=10, max_overflow=20
     )
+    apply_pragmas(engine, sqlite_pragmas(profile, pragmas))
     Base.metadata.create_all(engine, checkfirst=True)
 
     session_factory = sessionmaker(bind=engine)
@@ -86,7 +194,114 @@ def connect(db_path: pathlib.Path, echo=False):
     return engine, scoped_session(session_factory)
 
 
+def connect_readonly(
+    db_path: pathlib.Path,
+    echo=False,
+    profile: DBProfile = DEFAULT_PROFILE,
+    pragmas: T.Optional[PragmaSettings] = None,
+    pool_size=4,
+):
+    """
+    A pool of read connections for the same database as `connect`
+
+    Every connection is `PRAGMA query_only` so a stray write fails loudly instead
+    of contending with the writer.  Under WAL each read runs against the last
+    committed snapshot and never waits for an open write transaction.
+    """
+    engine = create_engine(
+        f"sqlite:///{db_path}", echo=echo, pool_size=pool_size, max_overflow=pool_size
+    )
+    read_pragmas = sqlite_pragmas(profile, pragmas)
+    read_pragmas["query_only"] = "ON"
+    apply_pragmas(engine, read_pragmas)
+
+    session_factory = sessionmaker(bind=engine)
+
+    return engine, scoped_session(session_factory)
+
+
+UID_INDEX = "uid_index"
+"""session.info key of the (entity, uid) -> instance map, see `fetch_by`"""
+
+
+@event.listens_for(Session, "loaded_as_persistent")
+@event.listens_for(Session, "pending_to_persistent")
+def _index_uid(session: Session, instance):
+    # __dict__, a deferred uid must not trigger a load
+    uid = instance.__dict__.get("uid")
+    if uid is not None:
+        index = session.info.get(UID_INDEX)
+        if index is None:
+            index = session.info[UID_INDEX] = weakref.WeakValueDictionary()
+        index[(type(instance), uid)] = instance
+
+
+def _loaded(session: Session, entity, column: str, value):
+    """The instance the session already holds, if it is still usable"""
+    if column == "id":
+        found = session.identity_map.get(identity_key(entity, value))
+    elif column == "uid":
+        found = session.info.get(UID_INDEX, {}).get((entity, value))
+    else:
+        return None
+
+    if (
+        found is None
+        or found not in session
+        or found in session.deleted
+        or inspect(found).expired
+    ):
+        return None
+
+    return found
+
+
+@functools.lru_cache(maxsize=256)
+def lookup_stmt(
+    entity,
+    column: str,
+    plan: T.Optional[LoadPlan] = None,
+    fields: T.Optional[T.Tuple[str, ...]] = None,
+):
+    """
+    `select(entity).where(entity.<column> == :value)` with its load plan
+
+    Built once per combination, later calls skip building the statement and
+    its cache key, only the bound value changes.  lambda_stmt was measured
+    slower than this for these one row lookups, see benchmarks/lookups.py.
+    """
+    stmt = select(entity).where(getattr(entity, column) == bindparam("value"))
+    options = load_plan(entity, plan, fields)
+    return stmt.options(*options) if len(options) > 0 else stmt
+
+
+def fetch_by(
+    session: Session,
+    entity,
+    column: str,
+    value,
+    plan: T.Optional[LoadPlan] = None,
+    fields: T.Optional[Fields] = None,
+):
+    """
+    The one `entity` whose `column` is `value`, NoResultFound if there is none
+
+    Plain lookups by id or uid return what the session already loaded without
+    a query, a load plan always queries so its relationships get loaded.
+    """
+    if plan is None and fields is None:
+        found = _loaded(session, entity, column, value)
+        if found is not None:
+            return found
+
+    fields = None if fields is None else tuple(fields)
+    stmt = lookup_stmt(entity, column, plan, fields)
+    return session.scalars(stmt, dict(value=value)).one()
+
+
 class Base(DeclarativeBase):
+    type_annotation_map = {UniqueId: String}
+
     id: Mapped[int] = mapped_column(
         primary_key=True,
     )
@@ -108,9 +323,44 @@ class Base(DeclarativeBase):
         self.updated_on = DT.datetime.now()
 
     @classmethod
-    def Fetch_by_Id(cls, session: Session, fetch_id: int):
-        stmt = select(cls).where(cls.id == fetch_id)
-        return session.execute(stmt).scalars().one()
+    def Fetch_by_Id(
+        cls,
+        session: Session,
+        fetch_id: int,
+        plan: T.Optional[LoadPlan] = None,
+        fields: T.Optional[Fields] = None,
+    ):
+        return fetch_by(session, cls, "id", fetch_id, plan, fields)
+
+    PROJECTION: T.Dict[str, T.Tuple[str, ...]] = {}
+    """Maps `asdict` keys to the attributes that must be loaded to produce them"""
+
+    STRIPPED_PROJECTION: T.Optional[T.Dict[str, T.Tuple[str, ...]]] = None
+    """Same as PROJECTION but for the stripped form of `asdict`"""
+
+    ALWAYS_LOADED: T.Tuple[str, ...] = ("uid",)
+
+    @classmethod
+    def Projected_columns(cls, fields: Fields, stripped=False):
+        projection = cls.PROJECTION
+        if stripped is True and cls.STRIPPED_PROJECTION is not None:
+            projection = cls.STRIPPED_PROJECTION
+
+        names = list(cls.ALWAYS_LOADED)
+        for field in fields:
+            names.extend(projection.get(field, ()))
+
+        return [getattr(cls, name) for name in dict.fromkeys(names)]
+
+    @staticmethod
+    def _project(
+        fields: T.Optional[Fields], getters: T.Dict[str, T.Callable[[], T.Any]]
+    ) -> T.Dict[str, T.Any]:
+        return {
+            key: getter()
+            for key, getter in getters.items()
+            if fields is None or key in fields
+        }
 
     @declared_attr.directive
     def __tablename__(self):
@@ -131,7 +381,9 @@ class Base(DeclarativeBase):
 
 
 class Book(Base):
-    uid: Mapped[UniqueId] = mapped_column(default=lambda: generate_id(GEN_LEN))
+    uid: Mapped[UniqueId] = mapped_column(
+        default=generate_id, unique=True, index=True
+    )
     title: Mapped[str]
     notes: Mapped[str] = mapped_column(default="")
 
@@ -140,6 +392,11 @@ class Book(Base):
     )
     import_dir: Mapped[SAPathlike] = mapped_column(SAPathlike(), default=None)
 
+    revision: Mapped[int] = mapped_column(
+        default=0, server_default="0", server_onupdate=FetchedValue()
+    )
+    """Bumped by triggers on any change to the book or below, see REVISION_TRIGGERS"""
+
     chapters: Mapped[T.List["Chapter"]] = relationship(
         back_populates="book",
         cascade="all, delete",
@@ -183,48 +440,79 @@ class Book(Base):
         return True
 
     @classmethod
-    def Fetch_All(cls, session: Session):
-        stmt = select(cls)
+    def Fetch_All(
+        cls,
+        session: Session,
+        plan: T.Optional[LoadPlan] = None,
+        fields: T.Optional[Fields] = None,
+    ):
+        stmt = select(cls).options(*load_plan(cls, plan, fields))
         return session.scalars(stmt).all()
 
     @classmethod
-    def Fetch_by_UID(cls, session: Session, uid: UniqueId):
-        stmt = select(cls).where(cls.uid == uid)
-        return session.scalars(stmt).one()
+    def Fetch_by_UID(
+        cls,
+        session: Session,
+        uid: UniqueId,
+        plan: T.Optional[LoadPlan] = None,
+        fields: T.Optional[Fields] = None,
+    ):
+        return fetch_by(session, cls, "uid", uid, plan, fields)
 
     @classmethod
     def Delete(cls, session: Session, book_uid):
         book = cls.Fetch_by_UID(session, book_uid)
         session.delete(book)
 
-    def asdict(self, stripped=True):
+    PROJECTION = dict(
+        title=("title",),
+        operation_type=("operation_type",),
+        updated_on=("updated_on",),
+        created_on=("created_on",),
+        words=("words",),
+        notes=("notes",),
+    )
+
+    DELTA_FIELDS = ("title", "notes", "words", "updated_on")
+
+    def asdelta(self):
+        return self.asdict(stripped=True, fields=self.DELTA_FIELDS)
+
+    def operation_type_name(self) -> str:
         if self.operation_type == BookTypes.managed:
-            operation_type = "Managed"
+            return "Managed"
         elif self.operation_type == BookTypes.imported:
-            operation_type = "Imported"
+            return "Imported"
         elif self.operation_type == BookTypes.oversight:
-            operation_type = "Oversee"
-        else:
-            operation_type = f"Unknown type {self.operation_type.value}"
+            return "Oversee"
+
+        return f"Unknown type {self.operation_type.value}"
 
+    ALWAYS_LOADED = ("uid", "revision")
+
+    def asdict(self, stripped=True, fields: T.Optional[Fields] = None):
         data = dict(
-            type="book",
-            id=self.uid,
-            title=self.title,
-            operation_type=operation_type,
-            updated_on=str(self.updated_on),
-            created_on=str(self.created_on),
-            words=str(self.words),
-            notes=self.notes,
-            chapters=[chapter.asdict(stripped) for chapter in self.chapters],
+            type="book", id=self.uid, version=version_token(self.uid, self.revision)
+        )
+        data.update(
+            self._project(
+                fields,
+                dict(
+                    title=lambda: self.title,
+                    operation_type=self.operation_type_name,
+                    updated_on=lambda: str(self.updated_on),
+                    created_on=lambda: str(self.created_on),
+                    words=lambda: str(self.words or 0),
+                    notes=lambda: self.notes,
+                    chapters=lambda: [
+                        chapter.asdict(stripped, fields) for chapter in self.chapters
+                    ],
+                ),
+            )
         )
 
         return data
 
-    @hybrid_property
-    def words(self):
-        return sum([chapter.words for chapter in self.chapters])
-
     def serialize(self) -> T.List[RawFile]:
         items = ListFile(self.id)
         for key in self.SAFE_KEYS:
@@ -234,7 +522,9 @@ class Book(Base):
 
 
 class Chapter(Base):
-    uid: Mapped[UniqueId] = mapped_column(default=lambda: generate_id(GEN_LEN))
+    uid: Mapped[UniqueId] = mapped_column(
+        default=generate_id, unique=True, index=True
+    )
     title: Mapped[str]
     order: Mapped[int]
 
@@ -255,6 +545,11 @@ class Chapter(Base):
     last_imported: Mapped[T.Optional[DT.datetime]] = mapped_column(default=None)
     """When was it last imported"""
 
+    revision: Mapped[int] = mapped_column(
+        default=0, server_default="0", server_onupdate=FetchedValue()
+    )
+    """Bumped by triggers on any change to the chapter or its scenes"""
+
     scenes: Mapped[T.List["Scene"]] = relationship(
         back_populates="chapter",
         cascade="all, delete",
@@ -265,37 +560,74 @@ class Chapter(Base):
     book_id: Mapped[int] = mapped_column(ForeignKey("Book.id", ondelete="CASCADE"))
     book: Mapped["Book"] = relationship(back_populates="chapters")
 
+    # Serves both the book_id join and the `order_by` of Book.chapters
+    __table_args__ = (Index("ix_Chapter_book_id_order", "book_id", "order"),)
+
     SAFE_KEYS = ["title", "order", "summary", "notes"]
 
-    def asdict(self, stripped=False) -> ChapterDict:
+    ALWAYS_LOADED = ("uid", "order", "book_id", "revision")
+
+    PROJECTION = dict(
+        title=("title",),
+        words=("words",),
+        summary_tokens=("summary_tokens",),
+        created_on=("created_on",),
+        updated_on=("updated_on",),
+        notes=("notes",),
+        summary=("summary",),
+        source_file=("source_file",),
+        source_size=("source_size",),
+        source_modified=("source_modified",),
+        last_imported=("last_imported",),
+    )
+
+    STRIPPED_PROJECTION = {
+        key: columns
+        for key, columns in PROJECTION.items()
+        if key not in ("notes", "summary")
+    }
+
+    DELTA_FIELDS = ("title", "words", "summary_tokens", "updated_on")
+
+    def asdict(self, stripped=False, fields: T.Optional[Fields] = None) -> ChapterDict:
         data: ChapterDict = dict(
             id=self.uid,
             book_id=self.book.uid,
             type="chapter",
-            title=self.title,
             order=self.order,
-            words=self.words,
-            summary_tokens=self.summary_tokens,
-            created_on=str(self.created_on),
-            updated_on=str(self.updated_on),
-            notes=self.notes if stripped is False else "",
-            summary=self.summary if stripped is False else "",
-            scenes=[scene.asdict(stripped=stripped) for scene in self.scenes],
-            source_file=str(self.source_file) if self.source_file else None,
-            source_size=self.source_size if self.source_size else None,
-            source_modified=str(self.source_modified) if self.source_modified else None,
-            last_imported=str(self.last_imported) if self.last_imported else None,
+            version=version_token(self.uid, self.revision),
         )  # type: ignore
 
-        return data
-
-    @hybrid_property
-    def words(self):
-        return sum(scene.words for scene in self.scenes)
+        data.update(
+            self._project(
+                fields,
+                dict(
+                    title=lambda: self.title,
+                    words=lambda: self.words or 0,
+                    summary_tokens=lambda: self.summary_tokens or 0,
+                    created_on=lambda: str(self.created_on),
+                    updated_on=lambda: str(self.updated_on),
+                    notes=lambda: self.notes if stripped is False else "",
+                    summary=lambda: self.summary if stripped is False else "",
+                    scenes=lambda: [
+                        scene.asdict(stripped=stripped, fields=fields)
+                        for scene in self.scenes
+                    ],
+                    source_file=lambda: str(self.source_file)
+                    if self.source_file
+                    else None,
+                    source_size=lambda: self.source_size if self.source_size else None,
+                    source_modified=lambda: str(self.source_modified)
+                    if self.source_modified
+                    else None,
+                    last_imported=lambda: str(self.last_imported)
+                    if self.last_imported
+                    else None,
+                ),
+            )
+        )
 
-    @hybrid_property
-    def summary_tokens(self):
-        return sum(scene.summary_tokens for scene in self.scenes)
+        return data
 
     @classmethod
     def Fetch_all(cls, session):
@@ -303,21 +635,49 @@ class Chapter(Base):
         return session.scalars(stmt)
 
     @classmethod
-    def Fetch_by_uid(cls, session: Session, chapter_uid: UniqueId) -> "Chapter":
-        stmt = select(cls).where(cls.uid == chapter_uid)
-        return session.scalars(stmt).one()
+    def Fetch_by_uid(
+        cls,
+        session: Session,
+        chapter_uid: UniqueId,
+        plan: T.Optional[LoadPlan] = None,
+        fields: T.Optional[Fields] = None,
+    ) -> "Chapter":
+        return fetch_by(session, cls, "uid", chapter_uid, plan, fields)
 
     @classmethod
     def Reorder(
         cls,
         session: Session,
-        chapters: T.List[ChapterDict],
-    ):
-        for chapterData in chapters:
-            record = cls.Fetch_by_uid(session, chapterData["id"])
-            record.order = int(chapterData["order"])
+        chapters: T.Sequence[T.Union[ChapterDict, OrderType]],
+        book_id: T.Optional[int] = None,
+    ) -> T.List[OrderType]:
+        criteria = [] if book_id is None else [cls.book_id == book_id]
+        return reorder(session, cls, chapters, *criteria)
 
-        session.commit()
+    @classmethod
+    def Move(
+        cls, session: Session, book_uid: UniqueId, from_pos: int, to_pos: int
+    ) -> T.List[OrderType]:
+        return move(session, cls, cls.book_id, Book, book_uid, from_pos, to_pos)
+
+    @classmethod
+    def Fetch_delta(cls, session: Session, chapter_id: int) -> ChapterDict:
+        """The chapter's id and aggregates without touching any of its scenes"""
+        chapter = cls.Fetch_by_Id(
+            session, chapter_id, plan="tree", fields=cls.DELTA_FIELDS
+        )
+        return chapter.asdict(stripped=True, fields=cls.DELTA_FIELDS)
+
+    @classmethod
+    def Fetch_scene_order(cls, session: Session, chapter_id: int) -> T.List[OrderType]:
+        stmt = (
+            select(Scene.uid, Scene.order)
+            .where(Scene.chapter_id == chapter_id)
+            .order_by(Scene.order)
+        )
+        return [
+            OrderType(id=row.uid, order=row.order) for row in session.execute(stmt)
+        ]
 
     def serialize(self) -> T.List[RawFile]:
         items = ListFile(self.id)
@@ -344,27 +704,55 @@ Scenes2Characters = Table(
         ForeignKey("Character.id", name="FK_Character2Scene"),
         primary_key=True,
     ),
+    # The primary key covers scene_id lookups, this covers the character side
+    Index("ix_scenes2characters_character_id", "character_id"),
 )
 
 
 class Scene(Base):
-    uid: Mapped[UniqueId] = mapped_column(default=lambda: generate_id(12))
+    uid: Mapped[UniqueId] = mapped_column(
+        default=generate_id, unique=True, index=True
+    )
     title: Mapped[str]
     order: Mapped[int]
 
-    summary: Mapped[str] = mapped_column(default="")
-    content: Mapped[str] = mapped_column(default="")
-    notes: Mapped[str] = mapped_column(default="")
+    summary: Mapped[str] = mapped_column(default="", deferred_group="text")
+    content: Mapped[str] = mapped_column(default="", deferred_group="text")
+    notes: Mapped[str] = mapped_column(default="", deferred_group="text")
+    """The prose columns are deferred and load together, see `undefer_group("text")`"""
+
     location: Mapped[str] = mapped_column(default="")
 
     is_locked: Mapped[str] = mapped_column(default=False)
     """If set, the Scene is locked due likely to being imported in a managed book"""
 
+    source_paras: Mapped[T.Optional[list[str]]] = mapped_column(
+        JSON, default=None, deferred_group="source"
+    )
+    """w14:paraId of every source paragraph this scene was imported from"""
+
+    source_digest: Mapped[T.Optional[str]] = mapped_column(
+        default=None, deferred_group="source"
+    )
+    """Digest of the imported title, content and location, see importer.reimport"""
+
+    word_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    """Kept in sync with `content` so listings never have to read the prose"""
+
+    summary_token_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    """Kept in sync with `summary`"""
+
+    revision: Mapped[int] = mapped_column(
+        default=0, server_default="0", server_onupdate=FetchedValue()
+    )
+    """Bumped by triggers on any change to the scene, its characters or status"""
+
     status: Mapped["SceneStatus"] = relationship(back_populates="scenes")
     scene_status_id: Mapped[int] = mapped_column(
         ForeignKey("SceneStatus.id", name="FK_Scene2SceneStatus"),
         default=None,
         nullable=True,
+        index=True,
     )
 
     characters: Mapped[list["Character"]] = relationship(
@@ -377,6 +765,19 @@ class Scene(Base):
     chapter_id: Mapped[int] = mapped_column(ForeignKey("Chapter.id"))
     chapter: Mapped["Chapter"] = relationship(back_populates="scenes")
 
+    __table_args__ = (
+        # Serves both the chapter_id join and the `order_by` of Chapter.scenes
+        Index("ix_Scene_chapter_id_order", "chapter_id", "order"),
+        # Covers the word and token totals, the rows hold the prose before
+        # the counts so summing them from the table reads every scene's text
+        Index(
+            "ix_Scene_chapter_id_counts",
+            "chapter_id",
+            "word_count",
+            "summary_token_count",
+        ),
+    )
+
     SAFE_KEYS = [
         "title",
         "order",
@@ -388,59 +789,131 @@ class Scene(Base):
 
     FMT_STR = "%y/%m/%d %H:%M:%S"
 
+    @validates("content")
+    def _validate_content(self, key, content):
+        self.word_count = count_words(content)
+        return content
+
+    @validates("summary")
+    def _validate_summary(self, key, summary):
+        self.summary_token_count = count_words(summary)
+        return summary
+
     @hybrid_property
     def words(self):
-        cleaned = "" + self.content
-        if cleaned == "":
-            return 0
-
-        return len(cleaned.replace('",.!?', " ").strip().split(" "))
+        return self.word_count
 
     @hybrid_property
     def summary_tokens(self):
-        cleaned = self.summary
-        if isinstance(cleaned, str):
-            if len(cleaned.strip()) == 0:
-                return 0
-            else:
-                return len(cleaned.replace('",.!?', " ").strip().split(" "))
+        return self.summary_token_count
+
+    ALWAYS_LOADED = ("uid", "order", "chapter_id", "revision")
+
+    PROJECTION = dict(
+        title=("title",),
+        created_on=("created_on",),
+        updated_on=("updated_on",),
+        words=("word_count",),
+        summary_tokens=("summary_token_count",),
+        status=("scene_status_id",),
+        status_id=("scene_status_id",),
+        summary=("summary",),
+        notes=("notes",),
+        content=("content",),
+        location=("location",),
+    )
 
-        return 0
+    STRIPPED_PROJECTION = dict(
+        title=("title",),
+        created_on=("created_on",),
+        updated_on=("updated_on",),
+        words=("word_count",),
+        summary_tokens=("summary_token_count",),
+        status=("scene_status_id",),
+        status_id=("scene_status_id",),
+        notes=("has_notes",),
+    )
 
-    def asdict(self, stripped=False):
+    DELTA_FIELDS = (
+        "title",
+        "location",
+        "words",
+        "summary_tokens",
+        "updated_on",
+        "status",
+    )
+    """What a delta response carries, the prose columns are left out on purpose"""
+
+    def asdelta(self, fields: Fields = DELTA_FIELDS):
+        return self.asdict(stripped=False, fields=fields)
+
+    def asdict(self, stripped=False, fields: T.Optional[Fields] = None):
         data = dict(
             id=self.uid,
             type="scene",
-            title=self.title,
             order=self.order,
             chapterId=self.chapter.uid,
-            created_on=str(self.created_on),
-            updated_on=str(self.updated_on),
-            words=self.words,
-            summary_tokens=self.summary_tokens,
+            version=version_token(self.uid, self.revision),
         )
 
-        if self.status:
-            data["status"] = self.status.asdict()
-        else:
-            data["status"] = None
+        getters = dict(
+            title=lambda: self.title,
+            created_on=lambda: str(self.created_on),
+            updated_on=lambda: str(self.updated_on),
+            words=lambda: self.words,
+            summary_tokens=lambda: self.summary_tokens,
+            status=lambda: self.status.asdict() if self.status else None,
+            # Resolve against the book's references, see `book_references`
+            status_id=lambda: self.status.uid if self.status else None,
+        )
 
         if stripped is False:
-            data["summary"] = self.summary
-            data["notes"] = self.notes
-            data["content"] = self.content
-            data["location"] = self.location
-            data["characters"] = [toon.asdict() for toon in self.characters]
-
+            getters.update(
+                summary=lambda: self.summary,
+                notes=lambda: self.notes,
+                content=lambda: self.content,
+                location=lambda: self.location,
+                # Without scene counts, they follow scenes in other chapters
+                # that this scene's version doesn't, see fetch_book_references
+                characters=lambda: [
+                    toon.asdict(counted=False) for toon in self.characters
+                ],
+                character_ids=lambda: [toon.uid for toon in self.characters],
+            )
         else:
-            data["notes"] = self.notes and len(self.notes.strip()) > 0
+            getters.update(notes=lambda: bool(self.has_notes))
+
+        data.update(self._project(fields, getters))
 
         return data
 
     @classmethod
-    def Fetch_by_uid(cls, session: Session, scene_uid: UniqueId) -> "Scene":
-        stmt = select(cls).where(cls.uid == scene_uid)
-        return session.execute(stmt).scalars().one()
+    def Fetch_by_uid(
+        cls,
+        session: Session,
+        scene_uid: UniqueId,
+        plan: T.Optional[LoadPlan] = None,
+        fields: T.Optional[Fields] = None,
+    ) -> "Scene":
+        return fetch_by(session, cls, "uid", scene_uid, plan, fields)
+
+    @classmethod
+    def Reorder(
+        cls,
+        session: Session,
+        scenes: T.Sequence[T.Union[SceneType, OrderType]],
+        chapter_id: T.Optional[int] = None,
+    ) -> T.List[OrderType]:
+        criteria = [] if chapter_id is None else [cls.chapter_id == chapter_id]
+        return reorder(session, cls, scenes, *criteria)
+
+    @classmethod
+    def Move(
+        cls, session: Session, chapter_uid: UniqueId, from_pos: int, to_pos: int
+    ) -> T.List[OrderType]:
+        return move(
+            session, cls, cls.chapter_id, Chapter, chapter_uid, from_pos, to_pos
+        )
 
     @classmethod
     def List_all_characters_by_Uid(
@@ -461,12 +934,225 @@ class Scene(Base):
         return [items, content, summary, notes]
 
 
+# Chapter and Book totals are SQL aggregates over the stored Scene counters, they
+# are attached here because Scene has to exist before they can be declared.
+
+Chapter.words = column_property(
+    select(func.coalesce(func.sum(Scene.word_count), 0))
+    .where(Scene.chapter_id == Chapter.id)
+    .correlate_except(Scene)
+    .scalar_subquery()
+)
+
+Chapter.summary_tokens = column_property(
+    select(func.coalesce(func.sum(Scene.summary_token_count), 0))
+    .where(Scene.chapter_id == Chapter.id)
+    .correlate_except(Scene)
+    .scalar_subquery()
+)
+
+# Deferred so only stripped loads, the ones that show it, read the notes
+Scene.has_notes = column_property(
+    func.length(func.trim(func.coalesce(Scene.notes, ""))) > 0, deferred=True
+)
+
+Book.words = column_property(
+    select(func.coalesce(func.sum(Scene.word_count), 0))
+    .join(Chapter, Scene.chapter_id == Chapter.id)
+    .where(Chapter.book_id == Book.id)
+    .correlate_except(Scene, Chapter)
+    .scalar_subquery()
+)
+
+
+# Revisions are bumped in SQLite so Core bulk statements can't skip them.  A
+# row's own update bumps it unless the update already moved the revision, and
+# every change is pushed up to the parent, which bumps that parent's parent in
+# turn, so a scene edit reaches its chapter and book.  Recursive triggers are
+# off by default, the self bump doesn't fire its own trigger again.
+
+REVISION_TRIGGERS = dict(
+    book_revision_update="""
+        AFTER UPDATE ON "Book" WHEN NEW.revision = OLD.revision
+        BEGIN
+            UPDATE "Book" SET revision = revision + 1 WHERE id = NEW.id;
+        END""",
+    chapter_revision_insert="""
+        AFTER INSERT ON "Chapter"
+        BEGIN
+            UPDATE "Book" SET revision = revision + 1 WHERE id = NEW.book_id;
+        END""",
+    chapter_revision_update="""
+        AFTER UPDATE ON "Chapter"
+        BEGIN
+            UPDATE "Chapter" SET revision = revision + 1
+            WHERE id = NEW.id AND NEW.revision = OLD.revision;
+            UPDATE "Book" SET revision = revision + 1
+            WHERE id IN (NEW.book_id, OLD.book_id);
+        END""",
+    chapter_revision_delete="""
+        AFTER DELETE ON "Chapter"
+        BEGIN
+            UPDATE "Book" SET revision = revision + 1 WHERE id = OLD.book_id;
+        END""",
+    scene_revision_insert="""
+        AFTER INSERT ON "Scene"
+        BEGIN
+            UPDATE "Chapter" SET revision = revision + 1 WHERE id = NEW.chapter_id;
+        END""",
+    scene_revision_update="""
+        AFTER UPDATE ON "Scene"
+        BEGIN
+            UPDATE "Scene" SET revision = revision + 1
+            WHERE id = NEW.id AND NEW.revision = OLD.revision;
+            UPDATE "Chapter" SET revision = revision + 1
+            WHERE id IN (NEW.chapter_id, OLD.chapter_id);
+        END""",
+    scene_revision_delete="""
+        AFTER DELETE ON "Scene"
+        BEGIN
+            UPDATE "Chapter" SET revision = revision + 1 WHERE id = OLD.chapter_id;
+        END""",
+    scene_character_revision_insert="""
+        AFTER INSERT ON "scenes2characters"
+        BEGIN
+            UPDATE "Scene" SET revision = revision + 1 WHERE id = NEW.scene_id;
+        END""",
+    scene_character_revision_delete="""
+        AFTER DELETE ON "scenes2characters"
+        BEGIN
+            UPDATE "Scene" SET revision = revision + 1 WHERE id = OLD.scene_id;
+        END""",
+    character_revision_update="""
+        AFTER UPDATE ON "Character"
+        BEGIN
+            UPDATE "Scene" SET revision = revision + 1 WHERE id IN (
+                SELECT scene_id FROM "scenes2characters" WHERE character_id = NEW.id
+            );
+        END""",
+    status_revision_update="""
+        AFTER UPDATE ON "SceneStatus"
+        BEGIN
+            UPDATE "Scene" SET revision = revision + 1
+            WHERE scene_status_id = NEW.id;
+        END""",
+)
+"""Trigger name to body, created with the tables and by the migration"""
+
+for _name, _body in REVISION_TRIGGERS.items():
+    event.listen(
+        Base.metadata,
+        "after_create",
+        DDL(f"CREATE TRIGGER IF NOT EXISTS {_name} {_body}"),
+    )
+
+
+def reorder(
+    session: Session,
+    entity: T.Type[T.Union[Chapter, Scene]],
+    new_order: T.Sequence[T.Mapping[str, T.Any]],
+    *criteria,
+) -> T.List[OrderType]:
+    """
+    Apply a whole new ordering with one UPDATE ... CASE statement.
+
+    Bypasses `ordering_list` entirely so the caller is responsible for committing and
+    for not trusting any already loaded collections afterwards.
+    """
+    mapping = {item["id"]: int(item["order"]) for item in new_order}
+    if len(mapping) == 0:
+        return []
+
+    stmt = (
+        update(entity)
+        .where(entity.uid.in_(mapping.keys()), *criteria)
+        .values(order=case(mapping, value=entity.uid))
+        .execution_options(synchronize_session=False)
+    )
+    session.execute(stmt)
+
+    return [OrderType(id=uid, order=order) for uid, order in mapping.items()]
+
+
+def move(
+    session: Session,
+    entity: T.Type[T.Union[Chapter, Scene]],
+    parent_key,
+    parent: T.Type[T.Union[Book, Chapter]],
+    parent_uid: UniqueId,
+    from_pos: int,
+    to_pos: int,
+) -> T.List[OrderType]:
+    """
+    Move the sibling at `from_pos` to `to_pos`, only the siblings whose order changed
+    are updated and returned.
+    """
+    stmt = (
+        select(entity.uid, entity.order, parent.id)
+        .join(parent)
+        .where(parent.uid == parent_uid)
+        .order_by(entity.order)
+    )
+    rows = session.execute(stmt).all()
+    if len(rows) == 0:
+        return []
+
+    parent_id = rows[0].id
+    uids = [row.uid for row in rows]
+    uids.insert(to_pos, uids.pop(from_pos))
+
+    current = {row.uid: row.order for row in rows}
+    changed = [
+        OrderType(id=uid, order=idx)
+        for idx, uid in enumerate(uids)
+        if current[uid] != idx
+    ]
+
+    reorder(session, entity, changed, parent_key == parent_id)
+    parent.Touch(session, parent_id)
+    return changed
+
+
+def reserve_uids(session: Session, entity, count: int) -> T.List[UniqueId]:
+    """
+    `count` fresh uids for `entity`, checked against its uid index
+
+    The ids are unique by construction, the check guards against rows whose
+    uid was imported or copied from elsewhere.  Clashes are replaced and
+    re-checked, each check is one indexed IN lookup per chunk.
+    """
+    reserved = ids.generate_ids(count)
+    pending = reserved
+
+    while len(pending) > 0:
+        taken = set()
+        for start in range(0, len(pending), 500):
+            chunk = pending[start : start + 500]
+            stmt = select(entity.uid).where(entity.uid.in_(chunk))
+            taken.update(session.execute(stmt).scalars())
+
+        if len(taken) == 0:
+            break
+
+        log.warning("Replacing {} colliding {} uids", len(taken), entity.__name__)
+        clashes = [uid for uid in reserved if uid in taken]
+        replacements = dict(zip(clashes, ids.generate_ids(len(clashes))))
+        reserved = [replacements.get(uid, uid) for uid in reserved]
+        pending = list(replacements.values())
+
+    return reserved
+
+
 class Character(Base):
-    uid: Mapped[UniqueId] = mapped_column(default=lambda: generate_id(GEN_LEN))
+    uid: Mapped[UniqueId] = mapped_column(
+        default=generate_id, unique=True, index=True
+    )
     name: Mapped[str] = mapped_column(unique=True)
     notes: Mapped[str] = mapped_column(default="")
 
-    book_id: Mapped[int] = mapped_column(ForeignKey("Book.id", name="FK_Book2Scenes"))
+    book_id: Mapped[int] = mapped_column(
+        ForeignKey("Book.id", name="FK_Book2Scenes"), index=True
+    )
     book: Mapped[Book] = relationship(back_populates="characters")
 
     scenes: Mapped[list[Scene]] = relationship(
@@ -489,7 +1175,24 @@ class Character(Base):
         stmt = select(cls).where(cls.name.ilike(f"{query}%"))
         return session.execute(stmt).scalars().all()
 
-    def asdict(self, extended=False):
+    @classmethod
+    def Scene_counts(cls, session: Session, book_id: int) -> T.Dict[int, int]:
+        """Scenes per character of the book, one GROUP BY instead of loading them"""
+        stmt = (
+            select(Scenes2Characters.c.character_id, func.count())
+            .join(cls, cls.id == Scenes2Characters.c.character_id)
+            .where(cls.book_id == book_id)
+            .group_by(Scenes2Characters.c.character_id)
+        )
+        return dict(session.execute(stmt).tuples().all())
+
+    def asdict(
+        self, extended=False, scene_count: T.Optional[int] = None, counted=True
+    ):
+        """
+        `scene_count` saves loading the scenes when it is already known,
+        `counted=False` leaves it out altogether
+        """
         data = dict(
             id=self.uid,
             name=self.name,
@@ -497,8 +1200,11 @@ class Character(Base):
             book_id=self.book_id,
             created_on=str(self.created_on),
             updated_on=str(self.updated_on),
-            scene_count=len(self.scenes),
         )
+        if counted is True:
+            data["scene_count"] = (
+                len(self.scenes) if scene_count is None else scene_count
+            )
 
         if extended is True:
             locations = []
@@ -514,8 +1220,7 @@ class Character(Base):
 
     @classmethod
     def Fetch_by_Uid(cls, session: Session, scene_uid: UniqueId):
-        stmt = select(cls).where(cls.uid == scene_uid)
-        return session.execute(stmt).scalars().one()
+        return fetch_by(session, cls, "uid", scene_uid)
 
     @classmethod
     def Fetch_by_name_or_create(cls, session: Session, new_name: str):
@@ -531,11 +1236,21 @@ class Character(Base):
     def Fetch_by_Uid_and_Book(
         cls, session: Session, book: Book, character_uid: UniqueId
     ):
-        stmt = select(cls).where(and_(cls.book == book, cls.uid == character_uid))
-        return session.execute(stmt).scalars().one()
+        toon = fetch_by(session, cls, "uid", character_uid)
+        if toon.book_id != book.id:
+            raise NoResultFound(f"Character {character_uid} is not in book {book.uid}")
+
+        return toon
 
     @classmethod
     def Delete_by_Uid(cls, session: Session, character_uid: UniqueId):
+        # foreign_keys=ON refuses to orphan the scene links, so drop them first
+        character_ids = select(cls.id).where(cls.uid == character_uid)
+        session.execute(
+            delete(Scenes2Characters).where(
+                Scenes2Characters.c.character_id.in_(character_ids)
+            )
+        )
         stmt = delete(cls).where(cls.uid == character_uid)
         return session.execute(stmt)
 
@@ -575,9 +1290,8 @@ class Setting(Base):
 
     @classmethod
     def Fetch_by_Name(cls, session: Session, name: str) -> common_setting_type:
-        stmt = select(cls).where(cls.name == name)
         try:
-            rec = session.execute(stmt).scalars().one()  # type: 'Setting'
+            rec = fetch_by(session, cls, "name", name)  # type: 'Setting'
         except NoResultFound:
             log.error(f"Failed to fetch: {name}")
             return None
@@ -635,7 +1349,9 @@ class Setting(Base):
 
 
 class SceneStatus(Base):
-    uid: Mapped[UniqueId] = mapped_column(default=lambda: generate_id(GEN_LEN))
+    uid: Mapped[UniqueId] = mapped_column(
+        default=generate_id, unique=True, index=True
+    )
     name: Mapped[str] = mapped_column(String(255, collation="NOCASE"))
     color: Mapped[str] = mapped_column(default="gray")
 
@@ -646,6 +1362,7 @@ class SceneStatus(Base):
 
     scenes: Mapped[T.List["Scene"]] = relationship(back_populates="status")
 
+    # ux_book_name leads with book_id so it doubles as the foreign key index
     __table_args__ = (UniqueConstraint("book_id", "name", name="ux_book_name"),)
 
     SAFE_KEYS = ["name", "color"]
@@ -658,19 +1375,16 @@ class SceneStatus(Base):
 
     @classmethod
     def Fetch_by_Uid(cls, session, scene_uid: UniqueId) -> "SceneStatus":
-        stmt = select(cls).where(cls.uid == scene_uid)
-        return session.execute(stmt).scalars().one()
+        return fetch_by(session, cls, "uid", scene_uid)
 
     @classmethod
     def Fetch_by_Name(
         cls, session, book_uid: UniqueId, status_name: str
     ) -> T.Optional["SceneStatus"]:
         # TODO security threat!
-        stmt = select(cls).where(
-            cls.book.uid == book_uid, cls.name.ilike(f"{status_name}%")
-        )
-        print("Fetch by name", stmt)
-        return session.execute(stmt).scalars().one_or_none()
+        return session.scalars(
+            _status_by_name_stmt(), dict(book_uid=book_uid, name=f"{status_name}%")
+        ).one_or_none()
 
     @classmethod
     def Fetch_All(cls, session: Session) -> T.Sequence["SceneStatus"]:
@@ -687,10 +1401,30 @@ class SceneStatus(Base):
 
     @classmethod
     def Delete(cls, session: Session, status_uid: UniqueId):
+        # Scenes keep existing without a status rather than blocking the delete
+        status_ids = select(cls.id).where(cls.uid == status_uid)
+        session.execute(
+            update(Scene)
+            .where(Scene.scene_status_id.in_(status_ids))
+            .values(scene_status_id=None)
+            .execution_options(synchronize_session=False)
+        )
         stmt = delete(cls).where(cls.uid == status_uid)
         return session.execute(stmt)
 
 
+@functools.cache
+def _status_by_name_stmt():
+    return (
+        select(SceneStatus)
+        .join(SceneStatus.book)
+        .where(
+            Book.uid == bindparam("book_uid"),
+            SceneStatus.name.ilike(bindparam("name")),
+        )
+    )
+
+
 class AIActions(Base):
     target: Mapped[str]
     target_id: Mapped[UniqueId]
@@ -701,4 +1435,190 @@ class AIActions(Base):
     result: Mapped[str]
 
     book: Mapped["Book"] = relationship(back_populates="actions")
-    book_id: Mapped[int] = mapped_column(ForeignKey("Book.id", name="FK_ACTION2BOOK"))
+    book_id: Mapped[int] = mapped_column(
+        ForeignKey("Book.id", name="FK_ACTION2BOOK"), index=True
+    )
+
+
+class Job(Base):
+    """
+    A background job run by lib.jobs.JobManager
+
+    The row is the job's durable state: what to run (`kind` + `payload`), how
+    far it got (`bytes_done`, `checkpoint`) and how it ended.
+    """
+
+    uid: Mapped[UniqueId] = mapped_column(default=generate_id, unique=True, index=True)
+    kind: Mapped[str]
+    status: Mapped[JobStatus] = mapped_column(
+        Enum(JobStatus), default=JobStatus.pending, index=True
+    )
+
+    payload: Mapped[dict] = mapped_column(JSON, default=dict)
+    """Keyword arguments for the job's handler"""
+
+    checkpoint: Mapped[dict] = mapped_column(JSON, default=dict)
+    """Whatever the handler needs to pick up where it left off"""
+
+    message: Mapped[str] = mapped_column(default="")
+    bytes_total: Mapped[int] = mapped_column(default=0)
+    bytes_done: Mapped[int] = mapped_column(default=0)
+
+    result: Mapped[T.Optional[T.Any]] = mapped_column(JSON, default=None)
+    error: Mapped[T.Optional[str]] = mapped_column(default=None)
+
+    started_on: Mapped[T.Optional[DT.datetime]] = mapped_column(default=None)
+    finished_on: Mapped[T.Optional[DT.datetime]] = mapped_column(default=None)
+
+    @classmethod
+    def Fetch_by_uid(cls, session: Session, job_uid: UniqueId) -> "Job":
+        return fetch_by(session, cls, "uid", job_uid)
+
+    @classmethod
+    def Fetch_by_status(
+        cls, session: Session, *statuses: JobStatus
+    ) -> T.Sequence["Job"]:
+        stmt = select(cls).where(cls.status.in_(statuses)).order_by(cls.uid)
+        return session.execute(stmt).scalars().all()
+
+    @property
+    def progress(self) -> float:
+        if self.bytes_total <= 0:
+            return 1.0 if self.status == JobStatus.done else 0.0
+
+        return min(self.bytes_done / self.bytes_total, 1.0)
+
+    def asdict(self, eta: T.Optional[float] = None) -> JobType:
+        return JobType(
+            id=self.uid,
+            kind=self.kind,
+            status=self.status.name,
+            message=self.message,
+            bytes_total=self.bytes_total,
+            bytes_done=self.bytes_done,
+            progress=self.progress,
+            eta=eta,
+            result=self.result,
+            error=self.error,
+            created_on=str(self.created_on),
+            finished_on=None if self.finished_on is None else str(self.finished_on),
+        )
+
+
+def _wants(fields: T.Optional[Fields], key: str) -> bool:
+    return fields is None or key in fields
+
+
+def _narrow(loader, entity, fields: T.Optional[Fields], stripped: bool):
+    """Restrict `loader` to the columns needed by the projection, if there is one"""
+    if fields is not None:
+        return loader.load_only(*entity.Projected_columns(fields, stripped))
+    elif stripped is False and entity is Scene:
+        return loader.undefer_group("text")
+    elif entity is Scene:
+        return loader.undefer(Scene.has_notes)
+
+    return loader
+
+
+def _root(entity, fields: T.Optional[Fields], stripped: bool) -> T.List:
+    if fields is not None:
+        return [load_only(*entity.Projected_columns(fields, stripped))]
+    elif stripped is False and entity is Scene:
+        return [undefer_group("text")]
+    elif entity is Scene:
+        return [undefer(Scene.has_notes)]
+
+    return []
+
+
+def _scene_details(loader, fields: T.Optional[Fields], editor=False):
+    """Everything Scene.asdict touches beyond its own columns"""
+    loader = _narrow(loader, Scene, fields, stripped=not editor)
+
+    options = _scene_relations(fields, editor)
+    return loader.options(*options) if len(options) > 0 else loader
+
+
+def _scene_relations(fields: T.Optional[Fields], editor: bool) -> T.List:
+    options = []
+    if _wants(fields, "status") or _wants(fields, "status_id"):
+        options.append(joinedload(Scene.status))
+    if editor is True and _wants(fields, "characters"):
+        options.append(selectinload(Scene.characters))
+    elif editor is True and _wants(fields, "character_ids"):
+        options.append(selectinload(Scene.characters).load_only(Character.uid))
+
+    return options
+
+
+def _book_tree(fields: T.Optional[Fields], editor: bool) -> T.List:
+    options = _root(Book, fields, stripped=not editor)
+    if _wants(fields, "chapters"):
+        chapters = _narrow(
+            selectinload(Book.chapters), Chapter, fields, stripped=not editor
+        )
+        if _wants(fields, "scenes"):
+            chapters = chapters.options(
+                _scene_details(selectinload(Chapter.scenes), fields, editor=editor)
+            )
+        options.append(chapters)
+
+    return options
+
+
+def _chapter_tree(fields: T.Optional[Fields], editor: bool) -> T.List:
+    options = _root(Chapter, fields, stripped=not editor)
+    options.append(joinedload(Chapter.book).load_only(Book.uid))
+    if _wants(fields, "scenes"):
+        options.append(
+            _scene_details(selectinload(Chapter.scenes), fields, editor=editor)
+        )
+
+    return options
+
+
+def _scene_root(fields: T.Optional[Fields], editor: bool) -> T.List:
+    options = _root(Scene, fields, stripped=not editor)
+    options.append(joinedload(Scene.chapter).load_only(Chapter.uid, Chapter.book_id))
+    return options + _scene_relations(fields, editor)
+
+
+LOAD_PLANS: T.Dict[
+    str, T.Dict[type, T.Callable[[T.Optional[Fields]], T.Sequence]]
+] = {
+    "tree": {
+        Book: lambda fields: _book_tree(fields, editor=False),
+        Chapter: lambda fields: _chapter_tree(fields, editor=False),
+        Scene: lambda fields: _scene_root(fields, editor=False),
+    },
+    "chapter_editor": {
+        Book: lambda fields: _book_tree(fields, editor=True),
+        Chapter: lambda fields: _chapter_tree(fields, editor=True),
+    },
+    "scene_editor": {
+        Scene: lambda fields: _scene_root(fields, editor=True),
+    },
+}
+"""
+Named loader strategies for the serializers, keyed by plan then root entity.
+
+Each plan pulls in what the matching `asdict` walks in a fixed number of
+queries so that serializing a book costs the same regardless of its size.
+When a projection is given only the columns behind the requested fields
+are SELECTed and relationships that aren't requested are left alone.
+"""
+
+
+def load_plan(
+    entity: type, plan: T.Optional[LoadPlan], fields: T.Optional[Fields] = None
+) -> T.Sequence:
+    if plan is None:
+        return _root(entity, fields, stripped=False) if fields is not None else []
+
+    try:
+        builder = LOAD_PLANS[plan][entity]
+    except KeyError:
+        raise ValueError(f"There is no `{plan}` load plan for {entity.__name__}")
+
+    return builder(fields)
@@ -0,0 +1,332 @@
+"""
+Cache of BCAPI read responses
+
+The UI asks for the same book tree and chapters over and over while nothing
+changes.  Read methods hand `ResponseCache.fetch` a key (method and
+arguments) and a builder that returns the response along with the tags of
+the rows it was built from, e.g. ("Chapter", 12).
+
+`watch` hooks the writer's sessions: after every flush the new, changed and
+deleted rows are mapped to tags (see `tags_for`), and when the transaction
+commits every response carrying one of those tags is dropped.  Bulk
+statements against the watched tables are mapped too, from the ids, chapter
+ids and book ids found in their criteria or parameters (see
+`statement_tags`); only one that can't be mapped empties the whole cache at
+commit.
+
+A response built from a read that began before a commit is not stored, see
+`generation`, so a slow read can't put stale data back after invalidation.
+Cached responses are shared, they are only ever handed to the UI's JSON
+bridge and must not be modified.
+"""
+import operator
+import threading
+import typing as T
+from collections import OrderedDict
+
+from sqlalchemy import Delete, Insert, Update, event, inspect
+from sqlalchemy.sql.elements import BinaryExpression, BindParameter, BooleanClauseList
+from sqlalchemy.sql.operators import in_op
+from sqlalchemy.orm import ORMExecuteState, Session, sessionmaker
+
+from . import models
+from .app_types import CacheStats
+
+Tag = T.Tuple[str, T.Optional[int]]
+"""(kind, row id), an id of None stands for every row of that kind"""
+
+Builder = T.Callable[[Session], T.Tuple[T.Any, T.Iterable[Tag]]]
+
+WATCHED_TABLES = frozenset(
+    ("Book", "Chapter", "Scene", "Character", "SceneStatus", "scenes2characters")
+)
+"""Tables the cached responses are built from"""
+
+SCOPE_KEYS = ("id", "chapter_id", "book_id")
+"""Columns that tell which rows a bulk statement touches"""
+
+PENDING_TAGS = "response_cache_tags"
+PENDING_CLEAR = "response_cache_clear"
+
+
+def tags_for(instance: T.Any, deleted=False) -> T.List[Tag]:
+    """What a change to `instance` invalidates"""
+    if isinstance(instance, models.Book):
+        return [("Book", instance.id)]
+    if isinstance(instance, models.Chapter):
+        # The book tree lists its chapters
+        return [("Chapter", instance.id), ("Book", instance.book_id)]
+    if isinstance(instance, models.Scene):
+        tags = [("Chapter", instance.chapter_id)]
+        if deleted is True:
+            # Its character links went with it, scene counts changed somewhere
+            tags.append(("Characters", None))
+        else:
+            # Linking or unlinking characters changes their scene counts
+            linked = inspect(instance).attrs.characters.history
+            tags.extend(
+                ("Characters", toon.book_id)
+                for toon in (*linked.added, *linked.deleted)
+            )
+        return tags
+    if isinstance(instance, models.Character):
+        return [("Characters", instance.book_id)]
+    if isinstance(instance, models.SceneStatus):
+        return [("Statuses", instance.book_id)]
+
+    return []
+
+
+Scope = T.Dict[str, T.Set[T.Any]]
+"""SCOPE_KEYS values a statement's rows are known to have"""
+
+
+def criteria_scope(table: T.Any, where: T.Any) -> Scope:
+    """From `key == value` and `key IN (values)` terms ANDed at the top level"""
+    if isinstance(where, BooleanClauseList) and where.operator is operator.and_:
+        terms = where.clauses
+    elif where is None:
+        terms = []
+    else:
+        terms = [where]
+
+    scope = dict()
+    for term in terms:
+        if not isinstance(term, BinaryExpression):
+            continue
+        # ORM statements annotate their tables, so match them by name
+        if getattr(getattr(term.left, "table", None), "name", None) != table.name:
+            continue
+        key = getattr(term.left, "key", None)
+        if key not in SCOPE_KEYS or not isinstance(term.right, BindParameter):
+            continue
+
+        value = term.right.effective_value
+        if term.operator is operator.eq:
+            scope.setdefault(key, set()).add(value)
+        elif term.operator is in_op and isinstance(value, (list, tuple)):
+            scope.setdefault(key, set()).update(value)
+
+    return scope
+
+
+def parameter_rows(statement: T.Any, parameters: T.Any) -> T.List[T.Mapping]:
+    if isinstance(parameters, dict) and len(parameters) > 0:
+        return [parameters]
+    if isinstance(parameters, (list, tuple)) and len(parameters) > 0:
+        return list(parameters)
+
+    # .values(...) rather than execute() parameters, criteria binds get a suffix
+    return [statement.compile().params]
+
+
+def parameter_scope(rows: T.List[T.Mapping]) -> Scope:
+    scope = dict()
+    for key in SCOPE_KEYS:
+        values = set(row.get(key) for row in rows)
+        if None not in values:
+            scope[key] = values
+
+    return scope
+
+
+def statement_scope(statement: T.Any, parameters: T.Any) -> Scope:
+    if isinstance(statement, Insert):
+        return parameter_scope(parameter_rows(statement, parameters))
+
+    if isinstance(statement, Update):
+        rows = parameter_rows(statement, parameters)
+        assigned = set(rows[0])
+        if statement.whereclause is None:
+            # ORM bulk UPDATE by primary key, every row names its id
+            assigned.discard("id")
+        if "chapter_id" in assigned or "book_id" in assigned:
+            # Rows moved to another parent, the previous one isn't known
+            return dict()
+        if statement.whereclause is None:
+            return parameter_scope(rows)
+
+    return criteria_scope(statement.table, statement.whereclause)
+
+
+def statement_tags(
+    statement: T.Any, parameters: T.Any = None
+) -> T.Optional[T.List[Tag]]:
+    """What a bulk statement invalidates, None if that can't be told"""
+    table = getattr(statement, "table", None)
+    if table is None or not isinstance(statement, (Insert, Update, Delete)):
+        return None
+    if table.name not in WATCHED_TABLES:
+        return []
+
+    scope = statement_scope(statement, parameters)
+
+    def tagged(kind: str, key: str) -> T.List[Tag]:
+        return [(kind, row_id) for row_id in scope.get(key, ())]
+
+    name = table.name
+    if name == "Book":
+        if isinstance(statement, Delete):
+            return None
+        return tagged("Book", "id") or None
+    if name == "Chapter":
+        # The book tree lists its chapters, see tags_for
+        tags = tagged("Chapter", "id")
+        tags += tagged("Book", "book_id") + tagged("Chapters", "book_id")
+        return tags or None
+    if name == "Scene":
+        tags = tagged("Chapter", "chapter_id") or [("Chapter", None)]
+        if isinstance(statement, Delete):
+            tags.append(("Characters", None))
+        return tags
+    if name == "Character":
+        return tagged("Characters", "book_id") or [("Characters", None)]
+    if name == "SceneStatus":
+        return tagged("Statuses", "book_id") or [("Statuses", None)]
+
+    # scenes2characters, chapter payloads carry their book's Characters tag
+    return [("Characters", None)]
+
+
+class ResponseCache:
+    max_entries: int
+    generation: int
+    """Bumped by every invalidation"""
+
+    _entries: "OrderedDict[T.Hashable, T.Tuple[T.Any, T.FrozenSet[Tag]]]"
+    _tagged: T.Dict[Tag, T.Set[T.Hashable]]
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.generation = 0
+        self._entries = OrderedDict()
+        self._tagged = dict()
+        self._lock = threading.Lock()
+        self._stats = dict(hits=0, misses=0, evictions=0, invalidations=0)
+
+    def get(self, key: T.Hashable) -> T.Tuple[bool, T.Any]:
+        with self._lock:
+            if key not in self._entries:
+                self._stats["misses"] += 1
+                return False, None
+
+            self._stats["hits"] += 1
+            self._entries.move_to_end(key)
+            return True, self._entries[key][0]
+
+    def put(
+        self, key: T.Hashable, value: T.Any, tags: T.Iterable[Tag], generation: int
+    ) -> bool:
+        """Store `value` unless something was invalidated since `generation`"""
+        with self._lock:
+            if generation != self.generation or self.max_entries <= 0:
+                return False
+
+            self._discard(key)
+            tags = frozenset(tags)
+            self._entries[key] = (value, tags)
+            for tag in tags:
+                self._tagged.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                self._discard(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+
+            return True
+
+    def fetch(self, app, key: T.Hashable, build: Builder) -> T.Any:
+        """The cached response for `key`, built from a read session on a miss"""
+        if app.on_writer is True:
+            # The writer's session may hold uncommitted changes
+            with app.get_db() as session:
+                return build(session)[0]
+
+        found, value = self.get(key)
+        if found is True:
+            return value
+
+        generation = self.generation
+        with app.get_db() as session:
+            value, tags = build(session)
+
+        self.put(key, value, tags, generation)
+        return value
+
+    def _discard(self, key: T.Hashable):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        for tag in entry[1]:
+            keys = self._tagged.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if len(keys) == 0:
+                    del self._tagged[tag]
+
+    def invalidate(self, tags: T.Iterable[Tag]) -> int:
+        with self._lock:
+            self.generation += 1
+            keys = set()
+            for kind, row_id in set(tags):
+                if row_id is None:
+                    for tag in [tag for tag in self._tagged if tag[0] == kind]:
+                        keys.update(self._tagged[tag])
+                else:
+                    keys.update(self._tagged.get((kind, row_id), ()))
+
+            for key in keys:
+                self._discard(key)
+
+            self._stats["invalidations"] += len(keys)
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._stats["invalidations"] += len(self._entries)
+            self._entries.clear()
+            self._tagged.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                entries=len(self._entries), max_entries=self.max_entries, **self._stats
+            )
+
+    def watch(self, session_factory: sessionmaker):
+        """Invalidate on commit of the sessions `session_factory` makes"""
+
+        @event.listens_for(session_factory, "after_flush")
+        def collect(session: Session, flush_context):
+            pending = session.info.setdefault(PENDING_TAGS, set())
+            for instance in session.new:
+                pending.update(tags_for(instance))
+            for instance in session.dirty:
+                pending.update(tags_for(instance))
+            for instance in session.deleted:
+                pending.update(tags_for(instance, deleted=True))
+
+        @event.listens_for(session_factory, "do_orm_execute")
+        def bulk(state: ORMExecuteState):
+            if state.is_select is True:
+                return
+
+            tags = statement_tags(state.statement, state.parameters)
+            if tags is None:
+                state.session.info[PENDING_CLEAR] = True
+            else:
+                state.session.info.setdefault(PENDING_TAGS, set()).update(tags)
+
+        @event.listens_for(session_factory, "after_commit")
+        def apply(session: Session):
+            tags = session.info.pop(PENDING_TAGS, set())
+            if session.info.pop(PENDING_CLEAR, False) is True:
+                self.clear()
+            elif len(tags) > 0:
+                self.invalidate(tags)
+
+        @event.listens_for(session_factory, "after_rollback")
+        def forget(session: Session):
+            session.info.pop(PENDING_TAGS, None)
+            session.info.pop(PENDING_CLEAR, None)
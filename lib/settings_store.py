@@ -0,0 +1,206 @@
+"""
+User settings kept in memory
+
+The `Setting` table stores every value as a string next to its type name.
+`SettingsStore` reads the table once at startup, adds whatever
+defaults.settings.toml has that the table doesn't, and keeps the values cast
+to their types so reads never touch SQLite.  Changes are written through in
+one executemany UPDATE on the writer thread, the memory copy follows once
+that commits, then subscribers hear about the values that changed.
+"""
+import threading
+import typing as T
+
+from sqlalchemy import insert, select, update
+
+from . import models
+from .app_types import SettingType, common_setting_type
+from .log_helper import getLogger
+
+if T.TYPE_CHECKING:
+    from .application import BCApplication
+
+log = getLogger(__name__)
+
+Subscriber = T.Callable[[str, common_setting_type], None]
+"""Called as subscriber(name, value) after a change is committed"""
+
+
+def setting_type(value: common_setting_type) -> str:
+    """The Setting.type a defaults.settings.toml value is stored as"""
+    # bool first, it is an int too
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "number"
+
+    return "string"
+
+
+def cast(type_name: str, value: common_setting_type) -> common_setting_type:
+    """`value` as it reads back once stored, see Setting._CastVal2Type"""
+    return models.Setting._CastVal2Type(type_name, str(value))
+
+
+class SettingsStore:
+    app: "BCApplication"
+    defaults: T.Dict[str, common_setting_type]
+    """The top level values of defaults.settings.toml"""
+
+    _settings: T.Dict[str, SettingType]
+    _subscribers: T.List[T.Tuple[Subscriber, T.FrozenSet[str]]]
+
+    def __init__(
+        self,
+        app: "BCApplication",
+        defaults: T.Optional[T.Dict[str, T.Any]] = None,
+    ):
+        self.app = app
+        # Tables like [database] configure the app, they aren't user settings
+        self.defaults = {
+            name: value
+            for name, value in (defaults or dict()).items()
+            if not isinstance(value, dict)
+        }
+        self._settings = dict()
+        self._subscribers = []
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Read the table, adding the defaults it is missing, in one write"""
+
+        def read_and_fill() -> T.List[SettingType]:
+            with self.app.get_db() as session:
+                stored = session.execute(select(models.Setting)).scalars().all()
+                names = set(setting.name for setting in stored)
+                missing = [
+                    dict(name=name, val=str(value), type=setting_type(value))
+                    for name, value in self.defaults.items()
+                    if name not in names
+                ]
+                if len(missing) > 0:
+                    session.execute(insert(models.Setting), missing)
+                    session.commit()
+                    stored = session.execute(select(models.Setting)).scalars().all()
+
+                return [setting.asdict() for setting in stored]
+
+        settings = self.app.write(read_and_fill)
+        with self._lock:
+            self._settings = {setting["name"]: setting for setting in settings}
+
+    def get(
+        self, name: str, default: common_setting_type = None
+    ) -> common_setting_type:
+        with self._lock:
+            setting = self._settings.get(name)
+
+        return default if setting is None else setting["value"]
+
+    def all(self) -> T.List[SettingType]:
+        with self._lock:
+            return [SettingType(**setting) for setting in self._settings.values()]
+
+    def set(self, changes: T.Dict[str, common_setting_type]) -> T.Dict[str, T.Any]:
+        """
+        Write `changes` through and return the ones that changed, cast
+
+        Every name must already exist, like `Setting.Set` nothing is written
+        if one doesn't.
+        """
+        with self._lock:
+            unknown = [name for name in changes if name not in self._settings]
+            if len(unknown) > 0:
+                raise ValueError(
+                    f"Attempting to set {', '.join(unknown)} but it hasn't been"
+                    " created in the DB yet and therefore has no default."
+                )
+
+            changed = dict()
+            for name, value in changes.items():
+                setting = self._settings[name]
+                value = cast(setting["type"], value)
+                if value != setting["value"]:
+                    changed[name] = (setting["id"], value)
+
+        if len(changed) == 0:
+            return dict()
+
+        def write_through():
+            with self.app.get_db() as session:
+                # ORM bulk UPDATE by primary key, one executemany
+                session.execute(
+                    update(models.Setting),
+                    [
+                        dict(id=setting_id, val=str(value))
+                        for setting_id, value in changed.values()
+                    ],
+                )
+                session.commit()
+
+            # Still on the writer, so memory follows the commits in their order
+            with self._lock:
+                for name, (_, value) in changed.items():
+                    setting = self._settings[name]
+                    self._settings[name] = SettingType(setting, value=value)
+
+        self.app.write(write_through)
+
+        values = {name: value for name, (_, value) in changed.items()}
+        self._notify(values)
+        return values
+
+    def add_defaults(
+        self, defaults: T.Iterable[T.Tuple[str, common_setting_type, str]]
+    ) -> T.List[str]:
+        """Add the (name, value, type) settings that don't exist yet"""
+        with self._lock:
+            missing = {
+                name: dict(name=name, val=str(value), type=type_name)
+                for name, value, type_name in defaults
+                if name not in self._settings
+            }
+
+        if len(missing) == 0:
+            return []
+
+        def add() -> T.List[SettingType]:
+            with self.app.get_db() as session:
+                # Another caller may have added some since the check above
+                names = models.Setting.name.in_(missing)
+                for name in session.scalars(select(models.Setting.name).where(names)):
+                    missing.pop(name)
+                if len(missing) == 0:
+                    return []
+
+                session.execute(insert(models.Setting), list(missing.values()))
+                session.commit()
+                names = models.Setting.name.in_(missing)
+                stmt = select(models.Setting).where(names)
+                return [setting.asdict() for setting in session.scalars(stmt)]
+
+        added = self.app.write(add)
+        with self._lock:
+            self._settings.update((setting["name"], setting) for setting in added)
+
+        return list(missing)
+
+    def subscribe(self, subscriber: Subscriber, *names: str):
+        """Hear about changes to `names`, or to every setting if none are given"""
+        self._subscribers.append((subscriber, frozenset(names)))
+
+    def unsubscribe(self, subscriber: Subscriber):
+        self._subscribers = [
+            entry for entry in self._subscribers if entry[0] is not subscriber
+        ]
+
+    def _notify(self, values: T.Dict[str, common_setting_type]):
+        for subscriber, names in list(self._subscribers):
+            for name, value in values.items():
+                if len(names) > 0 and name not in names:
+                    continue
+
+                try:
+                    subscriber(name, value)
+                except Exception:
+                    log.exception("Settings subscriber failed on {}", name)
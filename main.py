@@ -98,6 +98,11 @@ class MainArgs(Tap):
     :param database: An alternative database file to use
     """
 
+    db_profile: T.Optional[T.Literal["compat", "performance"]] = None
+    """
+    :param db_profile: SQLite PRAGMA profile, overrides [database] profile in defaults.settings.toml
+    """
+
     def configure(self) -> None:
         self.add_argument("--dev", action="store_true")
 
@@ -111,8 +116,9 @@ def main():
     LOG.debug(f"{result.dev=}")
     LOG.debug(f"{result.transform_api=}")
     LOG.debug(f"{result.database.as_posix()=}")
+    LOG.debug(f"{result.db_profile=}")
 
-    app = BCApplication(result.database, here=HERE)
+    app = BCApplication(result.database, here=HERE, db_profile=result.db_profile)
 
     api = BCAPI(app)
 
@@ -143,6 +149,7 @@ def main():
     win1 = webview.create_window("PyBook Control", **default_win_settings)
     app.set_window(win1)
     webview.start(debug=True)
+    app.shutdown()
 
     if worker is not None:
         worker.send_signal(signal.CTRL_BREAK_EVENT)
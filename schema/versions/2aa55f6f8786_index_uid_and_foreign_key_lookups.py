@@ -0,0 +1,57 @@
+"""Index uid and foreign key lookups
+
+Revision ID: 2aa55f6f8786
+Revises: 5079af4e30ba
+Create Date: 2026-10-18 16:01:48.469905
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "2aa55f6f8786"
+down_revision = "5079af4e30ba"
+branch_labels = None
+depends_on = None
+
+
+UID_TABLES = ("Book", "Chapter", "Scene", "Character", "SceneStatus")
+
+
+def upgrade() -> None:
+    for table in UID_TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.create_index(f"ix_{table}_uid", ["uid"], unique=True)
+
+    with op.batch_alter_table("Chapter", schema=None) as batch_op:
+        batch_op.create_index("ix_Chapter_book_id_order", ["book_id", "order"])
+
+    with op.batch_alter_table("Scene", schema=None) as batch_op:
+        batch_op.create_index("ix_Scene_chapter_id_order", ["chapter_id", "order"])
+        batch_op.create_index("ix_Scene_scene_status_id", ["scene_status_id"])
+
+    with op.batch_alter_table("Character", schema=None) as batch_op:
+        batch_op.create_index("ix_Character_book_id", ["book_id"])
+
+    with op.batch_alter_table("scenes2characters", schema=None) as batch_op:
+        batch_op.create_index("ix_scenes2characters_character_id", ["character_id"])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("scenes2characters", schema=None) as batch_op:
+        batch_op.drop_index("ix_scenes2characters_character_id")
+
+    with op.batch_alter_table("Character", schema=None) as batch_op:
+        batch_op.drop_index("ix_Character_book_id")
+
+    with op.batch_alter_table("Scene", schema=None) as batch_op:
+        batch_op.drop_index("ix_Scene_scene_status_id")
+        batch_op.drop_index("ix_Scene_chapter_id_order")
+
+    with op.batch_alter_table("Chapter", schema=None) as batch_op:
+        batch_op.drop_index("ix_Chapter_book_id_order")
+
+    for table in reversed(UID_TABLES):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_index(f"ix_{table}_uid")
@@ -0,0 +1,28 @@
+"""Store source paragraph fingerprints on scenes
+
+Revision ID: 3c1e9b7d52a4
+Revises: f84af694d75b
+Create Date: 2026-10-18 17:12:41.508213
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3c1e9b7d52a4"
+down_revision = "f84af694d75b"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("Scene", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("source_paras", sa.JSON(), nullable=True))
+        batch_op.add_column(sa.Column("source_digest", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("Scene", schema=None) as batch_op:
+        batch_op.drop_column("source_digest")
+        batch_op.drop_column("source_paras")
@@ -0,0 +1,75 @@
+"""Store scene word and summary token counts
+
+Revision ID: 5079af4e30ba
+Revises: 79a9a942869a
+Create Date: 2026-10-18 15:58:12.402117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "5079af4e30ba"
+down_revision = "79a9a942869a"
+branch_labels = None
+depends_on = None
+
+
+def count_words(text):
+    # Frozen copy of lib.models.count_words as of this revision
+    if not isinstance(text, str) or len(text.strip()) == 0:
+        return 0
+
+    return len(text.replace('",.!?', " ").strip().split(" "))
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("Scene", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("word_count", sa.Integer(), server_default="0", nullable=False)
+        )
+        batch_op.add_column(
+            sa.Column(
+                "summary_token_count",
+                sa.Integer(),
+                server_default="0",
+                nullable=False,
+            )
+        )
+
+    conn = op.get_bind()
+    rows = conn.execute(sa.text('SELECT id, content, summary FROM "Scene"')).all()
+    counts = [
+        dict(
+            scene_id=row.id,
+            word_count=count_words(row.content),
+            summary_token_count=count_words(row.summary),
+        )
+        for row in rows
+    ]
+
+    if len(counts) > 0:
+        conn.execute(
+            sa.text(
+                'UPDATE "Scene" SET word_count = :word_count, '
+                "summary_token_count = :summary_token_count WHERE id = :scene_id"
+            ),
+            counts,
+        )
+
+    # ADD COLUMN puts the counts after the content, an index covering them
+    # keeps the chapter and book totals from reading the prose
+    op.create_index(
+        "ix_Scene_chapter_id_counts",
+        "Scene",
+        ["chapter_id", "word_count", "summary_token_count"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_Scene_chapter_id_counts", table_name="Scene")
+    with op.batch_alter_table("Scene", schema=None) as batch_op:
+        batch_op.drop_column("summary_token_count")
+        batch_op.drop_column("word_count")
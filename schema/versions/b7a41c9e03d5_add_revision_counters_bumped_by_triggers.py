@@ -0,0 +1,107 @@
+"""Add revision counters bumped by triggers
+
+Revision ID: b7a41c9e03d5
+Revises: 3c1e9b7d52a4
+Create Date: 2026-10-18 19:02:37.118406
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b7a41c9e03d5"
+down_revision = "3c1e9b7d52a4"
+branch_labels = None
+depends_on = None
+
+# Frozen copy of lib.models.REVISION_TRIGGERS as of this revision
+REVISION_TRIGGERS = dict(
+    book_revision_update="""
+        AFTER UPDATE ON "Book" WHEN NEW.revision = OLD.revision
+        BEGIN
+            UPDATE "Book" SET revision = revision + 1 WHERE id = NEW.id;
+        END""",
+    chapter_revision_insert="""
+        AFTER INSERT ON "Chapter"
+        BEGIN
+            UPDATE "Book" SET revision = revision + 1 WHERE id = NEW.book_id;
+        END""",
+    chapter_revision_update="""
+        AFTER UPDATE ON "Chapter"
+        BEGIN
+            UPDATE "Chapter" SET revision = revision + 1
+            WHERE id = NEW.id AND NEW.revision = OLD.revision;
+            UPDATE "Book" SET revision = revision + 1
+            WHERE id IN (NEW.book_id, OLD.book_id);
+        END""",
+    chapter_revision_delete="""
+        AFTER DELETE ON "Chapter"
+        BEGIN
+            UPDATE "Book" SET revision = revision + 1 WHERE id = OLD.book_id;
+        END""",
+    scene_revision_insert="""
+        AFTER INSERT ON "Scene"
+        BEGIN
+            UPDATE "Chapter" SET revision = revision + 1 WHERE id = NEW.chapter_id;
+        END""",
+    scene_revision_update="""
+        AFTER UPDATE ON "Scene"
+        BEGIN
+            UPDATE "Scene" SET revision = revision + 1
+            WHERE id = NEW.id AND NEW.revision = OLD.revision;
+            UPDATE "Chapter" SET revision = revision + 1
+            WHERE id IN (NEW.chapter_id, OLD.chapter_id);
+        END""",
+    scene_revision_delete="""
+        AFTER DELETE ON "Scene"
+        BEGIN
+            UPDATE "Chapter" SET revision = revision + 1 WHERE id = OLD.chapter_id;
+        END""",
+    scene_character_revision_insert="""
+        AFTER INSERT ON "scenes2characters"
+        BEGIN
+            UPDATE "Scene" SET revision = revision + 1 WHERE id = NEW.scene_id;
+        END""",
+    scene_character_revision_delete="""
+        AFTER DELETE ON "scenes2characters"
+        BEGIN
+            UPDATE "Scene" SET revision = revision + 1 WHERE id = OLD.scene_id;
+        END""",
+    character_revision_update="""
+        AFTER UPDATE ON "Character"
+        BEGIN
+            UPDATE "Scene" SET revision = revision + 1 WHERE id IN (
+                SELECT scene_id FROM "scenes2characters" WHERE character_id = NEW.id
+            );
+        END""",
+    status_revision_update="""
+        AFTER UPDATE ON "SceneStatus"
+        BEGIN
+            UPDATE "Scene" SET revision = revision + 1
+            WHERE scene_status_id = NEW.id;
+        END""",
+)
+
+TABLES = ("Book", "Chapter", "Scene")
+
+
+def upgrade() -> None:
+    # Columns first, batch mode recreates the tables and would drop the triggers
+    for table in TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(
+                sa.Column("revision", sa.Integer(), server_default="0", nullable=False)
+            )
+
+    for name, body in REVISION_TRIGGERS.items():
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+
+def downgrade() -> None:
+    for name in REVISION_TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+    for table in reversed(TABLES):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_column("revision")
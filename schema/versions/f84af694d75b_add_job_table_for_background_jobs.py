@@ -0,0 +1,71 @@
+"""Add job table for background jobs
+
+Revision ID: f84af694d75b
+Revises: 2aa55f6f8786
+Create Date: 2026-10-18 16:06:03.327983
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "f84af694d75b"
+down_revision = "2aa55f6f8786"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "Job",
+        sa.Column("uid", sa.String(), nullable=False),
+        sa.Column("kind", sa.String(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "pending",
+                "running",
+                "done",
+                "failed",
+                "cancelled",
+                "interrupted",
+                name="jobstatus",
+            ),
+            nullable=False,
+        ),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("checkpoint", sa.JSON(), nullable=False),
+        sa.Column("message", sa.String(), nullable=False),
+        sa.Column("bytes_total", sa.Integer(), nullable=False),
+        sa.Column("bytes_done", sa.Integer(), nullable=False),
+        sa.Column("result", sa.JSON(), nullable=True),
+        sa.Column("error", sa.String(), nullable=True),
+        sa.Column("started_on", sa.DateTime(), nullable=True),
+        sa.Column("finished_on", sa.DateTime(), nullable=True),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_on",
+            sa.DateTime(),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_on",
+            sa.DateTime(),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("Job", schema=None) as batch_op:
+        batch_op.create_index("ix_Job_status", ["status"], unique=False)
+        batch_op.create_index("ix_Job_uid", ["uid"], unique=True)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("Job", schema=None) as batch_op:
+        batch_op.drop_index("ix_Job_uid")
+        batch_op.drop_index("ix_Job_status")
+
+    op.drop_table("Job")
@@ -0,0 +1,90 @@
+import contextlib
+import typing as T
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from lib import models
+from lib.application import BCApplication
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine, Session = models.connect(tmp_path / "test.sqlite3")
+    session = Session()
+    yield session
+    session.close()
+    Session.remove()
+    engine.dispose()
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = BCApplication(tmp_path / "app.sqlite3")
+    yield app
+    app.shutdown()
+
+
+@pytest.fixture
+def make_book():
+    """Adds and commits a book of `chapters` chapters of `scenes` scenes"""
+
+    def make(session, chapters=2, scenes=3) -> models.Book:
+        book = models.Book(title="Test book")
+        for chapter_idx in range(chapters):
+            chapter = models.Chapter(title=f"Chapter {chapter_idx}")
+            for scene_idx in range(scenes):
+                chapter.scenes.append(
+                    models.Scene(
+                        title=f"Scene {scene_idx}",
+                        content="one two three",
+                        summary="a summary",
+                    )
+                )
+            book.chapters.append(chapter)
+
+        session.add(book)
+        session.commit()
+        return book
+
+    return make
+
+
+@pytest.fixture
+def app_book(app, make_book) -> T.Tuple[str, T.List[str]]:
+    """make_book(scenes=1) through the app's writer, (book uid, chapter uids)"""
+
+    def create():
+        with app.get_db() as session:
+            book = make_book(session, scenes=1)
+            return book.uid, [chapter.uid for chapter in book.chapters]
+
+    return app.write(create)
+
+
+class Executed(T.NamedTuple):
+    statement: str
+    parameters: T.Any
+    executemany: bool
+
+
+@pytest.fixture
+def record_sql():
+    """Collects the SQL sent through an engine, or a session's engine"""
+
+    @contextlib.contextmanager
+    def record(target) -> T.Iterator[T.List[Executed]]:
+        engine = target.get_bind() if isinstance(target, Session) else target
+        executed = []
+
+        def on_execute(conn, cursor, statement, parameters, context, executemany):
+            executed.append(Executed(statement, parameters, executemany))
+
+        event.listen(engine, "before_cursor_execute", on_execute)
+        try:
+            yield executed
+        finally:
+            event.remove(engine, "before_cursor_execute", on_execute)
+
+    return record
@@ -0,0 +1,63 @@
+import threading
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+
+from lib import models
+from lib.api import BCAPI
+
+
+def test_writes_run_on_the_writer_thread(app):
+    assert app.write(threading.current_thread).name.startswith("BCWriter")
+    assert app.write(app.write, lambda: app.on_writer) is True
+
+    api = BCAPI(app)
+    with pytest.warns(DeprecationWarning):
+        book = api.create_managed_book("Written")
+
+    assert api.list_books()[0]["id"] == book["id"]
+
+
+def test_reads_are_query_only(app):
+    with pytest.raises(OperationalError):
+        with app.get_db() as session:
+            session.add(models.Book(title="Nope"))
+            session.commit()
+
+    # The failed session was rolled back and discarded
+    with app.get_db() as session:
+        assert session.execute(select(models.Book)).first() is None
+
+
+def test_nested_get_db_shares_the_session(app):
+    with app.get_db() as outer:
+        with app.get_db() as inner:
+            assert inner is outer
+        assert outer.is_active
+
+    with app.get_db() as later:
+        assert later is not outer
+
+
+def test_reads_do_not_wait_for_a_long_write(app):
+    holding, release = threading.Event(), threading.Event()
+
+    def long_import():
+        with app.get_db() as session:
+            session.add(models.Book(title="Importing"))
+            session.flush()
+            holding.set()
+            release.wait(5)
+            session.commit()
+
+    pending = app._writer.submit(long_import)
+    assert holding.wait(5)
+    try:
+        with app.get_db() as session:
+            titles = session.execute(select(models.Book.title)).scalars().all()
+    finally:
+        release.set()
+        pending.result()
+
+    assert titles == []
@@ -0,0 +1,62 @@
+import os
+import pathlib
+from zipfile import ZipFile
+
+import pytest
+from lxml.etree import fromstring
+
+from lib.importer.docx import Docx, DocxParagraph
+from lib.importer.tags_and_ns import TAGS
+
+HERE = pathlib.Path(__file__).parent
+DOCUMENTS = sorted((HERE / "data").glob("*.docx"))
+
+
+def open_fds():
+    return len(os.listdir("/proc/self/fd"))
+
+
+@pytest.mark.parametrize("document", DOCUMENTS, ids=lambda path: path.name)
+def test_iterate_matches_a_full_parse(document):
+    body = fromstring(ZipFile(document).read("word/document.xml"))[0]
+    expected = [
+        DocxParagraph.Load(element) for element in body.findall(TAGS.ParaType.value)
+    ]
+
+    streamed = list(Docx.Iterate(document))
+
+    assert [p.body for p in streamed] == [p.body for p in expected]
+    assert [p.paraId for p in streamed] == [p.paraId for p in expected]
+    assert [p.hard_break for p in streamed] == [p.hard_break for p in expected]
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs procfs")
+def test_iterate_closes_the_archive():
+    before = open_fds()
+
+    paragraphs = Docx.Iterate(DOCUMENTS[0])
+    next(paragraphs)
+    assert open_fds() > before
+    paragraphs.close()
+    assert open_fds() == before
+
+    list(Docx.Iterate(DOCUMENTS[0]))
+    assert open_fds() == before
+
+
+def test_paragraph_fields_match_the_element():
+    w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    w14 = "http://schemas.microsoft.com/office/word/2010/wordml"
+    element = fromstring(
+        f'<w:p xmlns:w="{w}" xmlns:w14="{w14}" w14:paraId="0A1B2C3D">'
+        '<w:pPr><w:pStyle w:val="Title"/><w:jc w:val="center"/></w:pPr>'
+        "<w:r><w:t>ﬁrst </w:t></w:r><w:r><w:br/><w:t>café</w:t></w:r>"
+        "<w:r><w:t/></w:r></w:p>"
+    )
+
+    paragraph = DocxParagraph.Load(element)
+
+    assert paragraph.body == ["first ", "cafe\u0301", ""]
+    assert paragraph.properties.is_title and paragraph.properties.is_center
+    assert paragraph.paraId == "0A1B2C3D"
+    assert paragraph.hard_break is True
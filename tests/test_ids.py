@@ -0,0 +1,37 @@
+import datetime as DT
+
+from lib import ids, models
+
+
+def test_ids_are_time_sortable():
+    before = DT.datetime.now(DT.timezone.utc).replace(microsecond=0)
+    generated = [ids.generate_id() for _ in range(2000)]
+
+    assert all(len(uid) == ids.ID_LEN for uid in generated)
+    assert sorted(generated) == generated
+    assert len(set(generated)) == len(generated)
+    assert ids.timestamp_of(generated[0]) >= before
+
+
+def test_batches_continue_the_sequence():
+    first = ids.generate_ids(5000)
+    second = ids.generate_ids(3)
+
+    assert sorted(first) == first
+    assert first[-1] < second[0]
+    assert ids.generate_ids(0) == []
+
+
+def test_reserve_uids_replaces_collisions(session, monkeypatch):
+    chapter = models.Chapter(title="Chapter", book=models.Book(title="Book"))
+    chapter.scenes.extend([models.Scene(title="One"), models.Scene(title="Two")])
+    session.add(chapter)
+    session.commit()
+    existing = [scene.uid for scene in chapter.scenes]
+
+    batches = iter([existing + ["fresh"], ["replacement 1", "replacement 2"]])
+    monkeypatch.setattr(ids, "generate_ids", lambda count: next(batches)[:count])
+
+    reserved = models.reserve_uids(session, models.Scene, 3)
+
+    assert reserved == ["replacement 1", "replacement 2", "fresh"]
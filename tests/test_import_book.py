@@ -0,0 +1,55 @@
+import pathlib
+import shutil
+
+import import_book
+
+HERE = pathlib.Path(__file__).parent
+DATA = HERE / "data"
+
+
+def test_natural_sort():
+    names = ["Chapter 10.docx", "chapter 2.docx", "Chapter 1.docx", "Appendix.docx"]
+
+    assert sorted(names, key=import_book.natural_key) == [
+        "Appendix.docx",
+        "Chapter 1.docx",
+        "chapter 2.docx",
+        "Chapter 10.docx",
+    ]
+
+
+def test_headless_import(tmp_path):
+    source = tmp_path / "Novel"
+    source.mkdir()
+    for idx, name in ((10, "sample_chapter_document"), (2, "three_page_scene")):
+        shutil.copy(DATA / f"{name}.docx", source / f"Chapter {idx}.docx")
+
+    args = import_book.MainArgs(underscores_to_dashes=True).parse_args(
+        ["--database", str(tmp_path / "book.sqlite3"), "--jobs", "1", "--quiet"]
+        + [str(source)]
+    )
+    timings = dict()
+    summary = import_book.run_import(args, timings)
+
+    assert summary["status"] == "done"
+    assert summary["chapters"] == 2
+    assert {"list", "import", "parse_wait", "write"} <= set(timings)
+
+    preview = import_book.dry_run(args, dict())
+    assert [file["name"] for file in preview["files"]] == [
+        "Chapter 2.docx",
+        "Chapter 10.docx",
+    ]
+
+
+def test_dry_run_lists_unreadable_documents(tmp_path):
+    shutil.copy(DATA / "three_page_scene.docx", tmp_path / "Chapter 1.docx")
+    (tmp_path / "Chapter 2.docx").write_bytes(b"not a zip file")
+
+    args = import_book.MainArgs(underscores_to_dashes=True).parse_args(
+        ["--quiet", str(tmp_path)]
+    )
+    summary = import_book.dry_run(args, dict())
+
+    assert [file["name"] for file in summary["files"]] == ["Chapter 1.docx"]
+    assert summary["unreadable"] == ["Chapter 2.docx"]
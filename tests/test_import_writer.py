@@ -0,0 +1,75 @@
+from lib import ids, models
+from lib.importer import writer
+from lib.importer.chapter_importer import ParsedChapter, ParsedScene
+
+
+def parsed_chapter(title, count):
+    scenes = tuple(
+        ParsedScene("", f"Scene {idx} has five words", "", "", (f"P{idx}",), "d")
+        for idx in range(count)
+    )
+    return ParsedChapter(f"/tmp/{title}.docx", title, scenes, 100, 1700000000.0)
+
+
+def test_chapters_are_appended_in_chunks(session, monkeypatch):
+    monkeypatch.setattr(writer, "SCENE_CHUNK", 3)
+    statements = []
+    original = session.execute
+
+    def execute(statement, *args, **kwargs):
+        statements.append(args)
+        return original(statement, *args, **kwargs)
+
+    monkeypatch.setattr(session, "execute", execute)
+
+    book = models.Book(title="Bulk")
+    status = models.SceneStatus(name="Draft", color="red", book=book)
+    session.add_all([book, status])
+    session.commit()
+
+    first = writer.insert_chapter(
+        session, book.id, parsed_chapter("One", 7), status_id=status.id
+    )
+    second = writer.insert_chapter(session, book.id, parsed_chapter("Two", 1))
+    session.commit()
+
+    # 7 scenes in chunks of 3
+    assert [len(args[0]) for args in statements if args] == [3, 3, 1, 1]
+
+    session.expire_all()
+    chapters = models.Book.Fetch_by_UID(session, book.uid).chapters
+    assert [chapter.uid for chapter in chapters] == [first, second]
+    assert [chapter.order for chapter in chapters] == [0, 1]
+
+    scenes = chapters[0].scenes
+    assert [scene.order for scene in scenes] == list(range(7))
+    assert [scene.uid for scene in scenes] == sorted(scene.uid for scene in scenes)
+    assert scenes[0].title == "Scene 1"
+    assert scenes[0].word_count == 5
+    assert scenes[0].status.name == "Draft"
+    assert scenes[0].created_on is not None
+    assert scenes[0].source_paras == ["P0"]
+    assert chapters[1].scenes[0].status is None
+
+
+def test_clashing_uids_are_replaced(session, monkeypatch):
+    book = models.Book(title="Bulk")
+    session.add(book)
+    session.commit()
+    first = writer.insert_chapter(session, book.id, parsed_chapter("One", 2))
+    session.commit()
+    taken = [scene.uid for scene in models.Chapter.Fetch_by_uid(session, first).scenes]
+
+    # A copied database can already hold the uids generated next
+    generated = ids.generate_ids
+    batches = iter([[first], taken])
+    monkeypatch.setattr(
+        ids, "generate_ids", lambda count: next(batches, None) or generated(count)
+    )
+
+    second = writer.insert_chapter(session, book.id, parsed_chapter("Two", 2))
+    session.commit()
+
+    assert second != first
+    scenes = models.Chapter.Fetch_by_uid(session, second).scenes
+    assert len(scenes) == 2 and set(scene.uid for scene in scenes).isdisjoint(taken)
@@ -0,0 +1,157 @@
+import pathlib
+import threading
+import time
+
+import pytest
+
+from lib import models
+from lib.app_types import JobStatus
+from lib.application import BCApplication
+
+HERE = pathlib.Path(__file__).parent
+DATA = HERE / "data"
+
+
+def wait_for(app, job_uid, *statuses, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = app.jobs.status(job_uid)
+        if job["status"] in statuses:
+            return job
+        time.sleep(0.02)
+
+    raise AssertionError(f"{job_uid} never reached {statuses}: {job}")
+
+
+def test_submit_returns_at_once_and_reports_progress(app):
+    release = threading.Event()
+
+    def chunks(context, count):
+        for _ in range(count):
+            release.wait(5)
+            context.progress(100, message="chunk")
+        return count
+
+    app.jobs.register("chunks", chunks)
+    job_uid = app.jobs.submit("chunks", dict(count=3), bytes_total=300)
+
+    assert app.jobs.status(job_uid)["status"] in ("pending", "running")
+
+    release.set()
+    job = wait_for(app, job_uid, "done")
+
+    assert job["result"] == 3
+    assert job["bytes_done"] == 300
+    assert job["progress"] == 1.0
+    assert job["finished_on"] is not None
+
+
+def test_eta_is_estimated_from_bytes(app):
+    job = models.Job(uid="job", kind="chunks", status=JobStatus.running)
+    job.bytes_total, job.bytes_done = 1000, 250
+    app.jobs._runs["job"] = (time.monotonic() - 1.0, 0)
+
+    # 250 bytes in ~1s, 750 to go
+    assert app.jobs.eta(job) == pytest.approx(3.0, rel=0.1)
+
+
+def test_cancel_stops_a_running_job(app):
+    started = threading.Event()
+
+    def forever(context):
+        started.set()
+        while True:
+            context.progress(1)
+            time.sleep(0.01)
+
+    app.jobs.register("forever", forever)
+    job_uid = app.jobs.submit("forever")
+    assert started.wait(5)
+
+    assert app.jobs.cancel(job_uid) is True
+    wait_for(app, job_uid, "cancelled")
+    assert app.jobs.cancel(job_uid) is False
+
+
+def test_failures_are_recorded(app):
+    def broken(context):
+        raise RuntimeError("Out of ink")
+
+    app.jobs.register("broken", broken)
+    job = wait_for(app, app.jobs.submit("broken"), "failed")
+
+    assert job["error"] == "Out of ink"
+
+
+def import_payload(*names):
+    return dict(
+        documents=[dict(name=name, path=str(DATA)) for name in names],
+        name_and_status=dict(
+            book_name="Imported",
+            have_default_status=True,
+            default_status="Draft",
+            status_color="blue",
+        ),
+        book_path=str(DATA),
+    )
+
+
+def test_interrupted_import_resumes_after_the_last_chapter(tmp_path):
+    names = ("sample_chapter_document.docx", "sample_chapter_with_titles.docx")
+    db_path = tmp_path / "crash.sqlite3"
+
+    # Import the first document only, then rewrite the job row to look like
+    # the app died part way through importing both.
+    app = BCApplication(db_path)
+    try:
+        job_uid = app.jobs.submit("import", import_payload(names[0]))
+        wait_for(app, job_uid, "done")
+        app.jobs.update(
+            job_uid,
+            status=JobStatus.running,
+            payload=import_payload(*names),
+            result=None,
+        )
+    finally:
+        app.shutdown()
+
+    restarted = BCApplication(db_path)
+    try:
+        assert restarted.jobs.status(job_uid)["status"] == "interrupted"
+
+        restarted.jobs.resume(job_uid)
+        job = wait_for(restarted, job_uid, "done")
+
+        with restarted.get_db() as session:
+            book = models.Book.Fetch_by_UID(session, job["result"])
+            sources = [chapter.source_file.name for chapter in book.chapters]
+            assert sources == list(names)
+            assert book.chapters[0].scenes[0].status.name == "Draft"
+
+        assert restarted.jobs.cleanup(job_uid) is True
+        with pytest.raises(models.NoResultFound):
+            restarted.jobs.status(job_uid)
+    finally:
+        restarted.shutdown()
+
+
+def test_cleanup_drops_a_partial_import(app):
+    def fail_after_book(context, **payload):
+        from lib.importer import batch
+
+        payload["documents"] = []
+        batch.import_batch(context, **payload)
+        raise RuntimeError("Lost the source directory")
+
+    app.jobs.register("partial", fail_after_book, cleanup=None)
+    job_uid = app.jobs.submit("partial", import_payload())
+    wait_for(app, job_uid, "failed")
+    app.jobs.update(job_uid, kind="import")
+
+    with app.get_db() as session:
+        assert len(models.Book.Fetch_All(session)) == 1
+
+    assert app.jobs.cleanup(job_uid) is True
+
+    with app.get_db() as session:
+        assert len(models.Book.Fetch_All(session)) == 0
@@ -0,0 +1,382 @@
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.exc import NoResultFound
+
+from lib import models
+
+
+def test_scene_counts_are_stored(session, make_book):
+    book = make_book(session, chapters=1, scenes=1)
+    scene = book.chapters[0].scenes[0]
+
+    assert scene.word_count == 3
+    assert scene.summary_token_count == 2
+
+    scene.update(dict(content="just two", summary=""))
+    session.commit()
+
+    assert scene.words == 2
+    assert scene.summary_tokens == 0
+
+
+def test_chapter_and_book_totals_are_aggregates(session, make_book):
+    book = make_book(session, chapters=2, scenes=3)
+
+    assert book.words == 2 * 3 * 3
+    assert book.chapters[0].words == 3 * 3
+    assert book.chapters[0].summary_tokens == 3 * 2
+
+    book.chapters[0].scenes[0].update(dict(content=""))
+    session.commit()
+
+    assert book.chapters[0].words == 2 * 3
+    assert book.asdict()["words"] == str(5 * 3)
+
+
+def populate_references(session, book):
+    status = models.SceneStatus(name="Draft")
+    book.scene_statuses.append(status)
+    toons = [models.Character(name=f"{book.title} toon {idx}") for idx in range(3)]
+    book.characters.extend(toons)
+    for chapter in book.chapters:
+        for idx, scene in enumerate(chapter.scenes):
+            scene.status = status
+            scene.characters.append(toons[idx % len(toons)])
+
+    session.commit()
+
+
+@pytest.mark.parametrize(
+    "root,plan,stripped",
+    [
+        ("book", "tree", True),
+        ("book", "chapter_editor", False),
+        ("chapter", "tree", True),
+        ("chapter", "chapter_editor", False),
+    ],
+)
+def test_load_plans_use_a_fixed_number_of_queries(
+    session, root, plan, stripped, make_book, record_sql
+):
+    counts = []
+    for size in (2, 12):
+        book = make_book(session, chapters=size, scenes=size)
+        book.title = f"Book {size}"
+        populate_references(session, book)
+        book_uid, chapter_uid = book.uid, book.chapters[-1].uid
+        session.expunge_all()
+
+        with record_sql(session) as statements:
+            if root == "book":
+                models.Book.Fetch_by_UID(session, book_uid, plan=plan).asdict(stripped)
+            else:
+                record = models.Chapter.Fetch_by_uid(session, chapter_uid, plan=plan)
+                record.asdict(stripped)
+
+        counts.append(len(statements))
+        session.expunge_all()
+
+    assert counts[0] == counts[1]
+
+
+def test_scene_editor_plan(session, make_book, record_sql):
+    book = make_book(session, chapters=1, scenes=4)
+    populate_references(session, book)
+    scene_uid = book.chapters[0].scenes[0].uid
+    session.expunge_all()
+
+    with record_sql(session) as statements:
+        scene = models.Scene.Fetch_by_uid(session, scene_uid, plan="scene_editor")
+        data = scene.asdict()
+
+    # Counts come from fetch_book_references, see test_versions
+    assert "scene_count" not in data["characters"][0]
+    assert len(statements) <= 3
+
+
+def test_notes_flag_only_computed_for_stripped_loads(session, make_book, record_sql):
+    book = make_book(session, chapters=1, scenes=2)
+    chapter_uid = book.chapters[0].uid
+    session.expunge_all()
+
+    loads = (("chapter_editor", False, False), ("tree", True, True))
+    for plan, stripped, computed in loads:
+        with record_sql(session) as statements:
+            chapter = models.Chapter.Fetch_by_uid(session, chapter_uid, plan=plan)
+            chapter.asdict(stripped)
+
+        assert any("trim(" in query.statement for query in statements) is computed
+        session.expunge_all()
+
+
+@pytest.mark.parametrize("entity", [models.Chapter, models.Book])
+def test_totals_never_read_scene_rows(session, entity):
+    stmt = select(entity.words).where(entity.id == 1)
+    sql = str(stmt.compile(compile_kwargs=dict(literal_binds=True)))
+    plan = session.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+
+    scene_steps = [row[-1] for row in plan if " Scene " in f"{row[-1]} "]
+    assert scene_steps and all(
+        "COVERING INDEX ix_Scene_chapter_id_counts" in step for step in scene_steps
+    )
+
+
+def test_unknown_load_plan(session):
+    with pytest.raises(ValueError):
+        models.Book.Fetch_All(session, plan="outline")
+
+
+def test_projection_only_loads_requested_columns(session, make_book, record_sql):
+    book = make_book(session, chapters=2, scenes=2)
+    book.chapters[0].scenes[0].notes = "Remember this"
+    session.commit()
+    book_uid = book.uid
+    session.expunge_all()
+
+    fields = ["title", "words", "notes", "chapters", "scenes"]
+    with record_sql(session) as statements:
+        record = models.Book.Fetch_by_UID(session, book_uid, plan="tree", fields=fields)
+        data = record.asdict(stripped=True, fields=fields)
+
+    assert len(statements) == 3
+    assert not any('"Scene".content' in query.statement for query in statements)
+
+    scene = data["chapters"][0]["scenes"][0]
+    assert set(scene) == {
+        "id",
+        "type",
+        "order",
+        "chapterId",
+        "version",
+        "title",
+        "words",
+        "notes",
+    }
+    assert scene["notes"] is True
+    assert data["chapters"][1]["scenes"][0]["notes"] is False
+    assert "operation_type" not in data
+
+
+def scene_titles(session, chapter_uid):
+    session.expire_all()
+    chapter = models.Chapter.Fetch_by_uid(session, chapter_uid)
+    return [scene.title for scene in chapter.scenes]
+
+
+@pytest.mark.parametrize("size", [5, 200])
+def test_move_scene_is_set_based(session, size, make_book, record_sql):
+    book = make_book(session, chapters=1, scenes=size)
+    chapter_uid = book.chapters[0].uid
+    session.expunge_all()
+
+    with record_sql(session) as statements:
+        changed = models.Scene.Move(session, chapter_uid, 0, 2)
+        session.commit()
+
+    # select siblings, update ... case, touch the chapter
+    kinds = [query.statement[:6] for query in statements]
+    assert len([kind for kind in kinds if kind in ("SELECT", "UPDATE")]) == 3
+    assert [item["order"] for item in changed] == [0, 1, 2]
+    assert scene_titles(session, chapter_uid)[:3] == ["Scene 1", "Scene 2", "Scene 0"]
+
+
+def test_reorder_applies_whole_ordering(session, make_book):
+    book = make_book(session, chapters=2, scenes=3)
+    chapter = book.chapters[0]
+    chapter_uid = chapter.uid
+    new_order = [
+        dict(id=scene.uid, order=len(chapter.scenes) - idx)
+        for idx, scene in enumerate(chapter.scenes)
+    ]
+
+    changed = models.Scene.Reorder(session, new_order, chapter_id=chapter.id)
+    session.commit()
+
+    assert len(changed) == 3
+    assert scene_titles(session, chapter_uid) == ["Scene 2", "Scene 1", "Scene 0"]
+
+    changed = models.Chapter.Move(session, book.uid, 1, 0)
+    session.commit()
+    session.expire_all()
+
+    assert [item["id"] for item in changed] == [c.uid for c in book.chapters]
+    assert book.chapters[1].uid == chapter_uid
+
+
+def test_chapter_delta_skips_scenes(session, make_book, record_sql):
+    book = make_book(session, chapters=1, scenes=5)
+    chapter_id = book.chapters[0].id
+    session.expunge_all()
+
+    with record_sql(session) as statements:
+        delta = models.Chapter.Fetch_delta(session, chapter_id)
+        orders = models.Chapter.Fetch_scene_order(session, chapter_id)
+
+    assert len(statements) == 2
+    assert "scenes" not in delta
+    assert delta["words"] == 5 * 3
+    assert [item["order"] for item in orders] == list(range(5))
+
+
+def pragma(session, name):
+    return session.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_performance_profile_is_applied_per_connection(session):
+    assert pragma(session, "journal_mode") == "wal"
+    assert pragma(session, "foreign_keys") == 1
+    assert pragma(session, "synchronous") == 1  # NORMAL
+    assert pragma(session, "busy_timeout") == 5000
+
+
+def test_compat_profile_and_overrides(tmp_path):
+    engine, Session = models.connect(
+        tmp_path / "compat.sqlite3", profile="compat", pragmas=dict(cache_size=-1000)
+    )
+    with Session() as session:
+        assert pragma(session, "journal_mode") == "delete"
+        assert pragma(session, "cache_size") == -1000
+    Session.remove()
+    engine.dispose()
+
+    with pytest.raises(ValueError):
+        models.sqlite_pragmas("compat", dict(writable_schema="ON"))
+
+    with pytest.raises(ValueError):
+        models.sqlite_pragmas("turbo")
+
+
+def test_deletes_respect_foreign_keys(session, make_book):
+    book = make_book(session, chapters=1, scenes=2)
+    populate_references(session, book)
+    scene = book.chapters[0].scenes[0]
+    toon_uid = scene.characters[0].uid
+    status_uid = scene.status.uid
+
+    models.Character.Delete_by_Uid(session, toon_uid)
+    models.SceneStatus.Delete(session, status_uid)
+    session.commit()
+    session.expire_all()
+
+    assert scene.characters == []
+    assert scene.status is None
+
+
+def test_lookups_never_scan_a_table(session, make_book, record_sql):
+    book = make_book(session, chapters=3, scenes=3)
+    populate_references(session, book)
+    chapter, scene = book.chapters[1], book.chapters[1].scenes[1]
+    toon, status = scene.characters[0], scene.status
+    uids = dict(book=book.uid, chapter=chapter.uid, scene=scene.uid)
+    ids = dict(chapter=chapter.id, toon=toon.uid, status=status.uid)
+    session.expunge_all()
+
+    with record_sql(session) as executed:
+        for plan in ("tree", "chapter_editor"):
+            models.Book.Fetch_by_UID(session, uids["book"], plan=plan).asdict()
+            models.Chapter.Fetch_by_uid(session, uids["chapter"], plan=plan).asdict()
+            session.expunge_all()
+        models.Scene.Fetch_by_uid(session, uids["scene"], plan="scene_editor").asdict()
+        models.Chapter.Fetch_delta(session, ids["chapter"])
+        models.Chapter.Fetch_scene_order(session, ids["chapter"])
+        models.Character.Fetch_by_Uid(session, ids["toon"])
+        models.SceneStatus.Fetch_by_Uid(session, ids["status"])
+        models.Scene.Move(session, uids["chapter"], 0, 2)
+        models.Chapter.Move(session, uids["book"], 0, 1)
+        session.flush()
+
+    connection = session.connection().connection.dbapi_connection
+    full_scans = []
+    queries = [
+        (query.statement, query.parameters)
+        for query in executed
+        if query.statement.startswith(("SELECT", "UPDATE", "DELETE"))
+        and not query.executemany
+    ]
+    for statement, parameters in queries:
+        plan = connection.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        for *_, detail in plan.fetchall():
+            if detail.startswith("SCAN ") and "USING" not in detail:
+                full_scans.append((detail, statement))
+
+    assert len(queries) > 10
+    assert full_scans == []
+
+
+def test_scene_counts_are_grouped(session, make_book, record_sql):
+    book = make_book(session, chapters=2, scenes=4)
+    populate_references(session, book)
+    expected = {toon.id: len(toon.scenes) for toon in book.characters}
+    session.expunge_all()
+
+    with record_sql(session) as statements:
+        counts = models.Character.Scene_counts(session, book.id)
+
+    assert counts == expected
+    assert len(statements) == 1
+
+
+def test_reference_ids_skip_the_character_scenes(session, make_book, record_sql):
+    book = make_book(session, chapters=1, scenes=4)
+    populate_references(session, book)
+    chapter_uid = book.chapters[0].uid
+    status_uid, toon_uid = book.scene_statuses[0].uid, book.characters[0].uid
+    session.expunge_all()
+
+    fields = ["title", "scenes", "status_id", "character_ids"]
+    with record_sql(session) as statements:
+        chapter = models.Chapter.Fetch_by_uid(
+            session, chapter_uid, plan="chapter_editor", fields=fields
+        )
+        data = chapter.asdict(fields=fields)
+
+    scene = data["scenes"][0]
+    assert "status" not in scene and "characters" not in scene
+    assert scene["status_id"] == status_uid
+    assert scene["character_ids"] == [toon_uid]
+    # chapter + book, scenes, characters; nothing for Character.scenes
+    assert len(statements) == 3
+
+
+def test_lookups_reuse_loaded_instances(session, make_book, record_sql):
+    book = make_book(session, chapters=1, scenes=2)
+    scene_uid = book.chapters[0].scenes[0].uid
+    session.expunge_all()
+
+    with record_sql(session) as statements:
+        scene = models.Scene.Fetch_by_uid(session, scene_uid)
+        assert models.Scene.Fetch_by_uid(session, scene_uid) is scene
+        assert models.Scene.Fetch_by_Id(session, scene.id) is scene
+
+    assert len(statements) == 1
+
+    # A load plan still queries for the relationships it loads
+    with record_sql(session) as statements:
+        models.Scene.Fetch_by_uid(session, scene_uid, plan="scene_editor")
+    assert len(statements) > 0
+
+    session.commit()
+    with record_sql(session) as statements:
+        assert models.Scene.Fetch_by_uid(session, scene_uid) is scene
+    assert len(statements) == 1
+
+    assert models.lookup_stmt(models.Scene, "uid") is models.lookup_stmt(
+        models.Scene, "uid"
+    )
+    with pytest.raises(NoResultFound):
+        models.Scene.Fetch_by_uid(session, "missing")
+
+
+def test_lookups_by_name_and_book(session, make_book):
+    book, other = make_book(session), models.Book(title="Other")
+    session.add(other)
+    populate_references(session, book)
+    toon_uid = book.characters[0].uid
+
+    assert models.SceneStatus.Fetch_by_Name(session, book.uid, "dra").name == "Draft"
+    assert models.SceneStatus.Fetch_by_Name(session, other.uid, "Draft") is None
+
+    toon = models.Character.Fetch_by_Uid_and_Book(session, book, toon_uid)
+    assert toon.uid == toon_uid
+    with pytest.raises(NoResultFound):
+        models.Character.Fetch_by_Uid_and_Book(session, other, toon_uid)
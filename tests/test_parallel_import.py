@@ -0,0 +1,75 @@
+import pathlib
+
+from lib.importer.chapter_importer import ParsedChapter, parse_document
+from lib.importer import parallel
+from lib.importer.parallel import parse_documents, start_method
+
+HERE = pathlib.Path(__file__).parent
+DATA = HERE / "data"
+
+# The big document first so the workers are likely to finish out of order
+DOCUMENTS = [
+    DATA / "three_page_scene.docx",
+    DATA / "sample_chapter_document.docx",
+    DATA / "sample_chapter_with_locations.docx",
+    DATA / "sample_chapter_with_titles.docx",
+]
+
+
+def test_parse_document_is_compact():
+    parsed = parse_document(DOCUMENTS[1])
+
+    assert isinstance(parsed, ParsedChapter)
+    assert parsed.source == str(DOCUMENTS[1])
+    assert parsed.size == DOCUMENTS[1].stat().st_size
+    assert len(parsed.scenes) == 3
+    assert all(isinstance(scene.body, str) for scene in parsed.scenes)
+
+
+def test_results_keep_source_order_whatever_finishes_first():
+    seen = []
+
+    sequential = list(parse_documents(DOCUMENTS, jobs=1))
+    parallel = list(
+        parse_documents(
+            DOCUMENTS, jobs=4, on_parsed=lambda pos, parsed: seen.append(pos)
+        )
+    )
+
+    assert parallel == sequential
+    assert [parsed.source for parsed in parallel] == [str(doc) for doc in DOCUMENTS]
+    assert sorted(seen) == [0, 1, 2, 3]
+
+
+def test_closing_early_stops_the_pool():
+    chapters = parse_documents(DOCUMENTS, jobs=2)
+    first = next(chapters)
+    chapters.close()
+
+    assert first.source == str(DOCUMENTS[0])
+
+
+def test_workers_are_never_forked():
+    # Forking from a process with the writer and job threads running can
+    # copy their held locks into the workers
+    assert start_method() in ("forkserver", "spawn")
+
+
+def test_only_a_window_of_documents_is_in_flight(monkeypatch):
+    submitted = []
+
+    class Counting(parallel.ProcessPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            submitted.append(args[0])
+            return super().submit(fn, *args, **kwargs)
+
+    monkeypatch.setattr(parallel, "ProcessPoolExecutor", Counting)
+    monkeypatch.setattr(parallel, "WINDOW", 1)
+
+    chapters = parse_documents(DOCUMENTS, jobs=2)
+    next(chapters)
+    # Two in flight, plus the one submitted as the first was handed back
+    assert len(submitted) == 3
+
+    assert len(list(chapters)) == 3
+    assert submitted == [str(document) for document in DOCUMENTS]
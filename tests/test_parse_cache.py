@@ -0,0 +1,93 @@
+import os
+import pathlib
+import shutil
+
+import pytest
+
+from lib.importer.chapter_importer import ChapterImporter, parse_document
+from lib.importer.parallel import parse_documents
+from lib.importer.parse_cache import ParseCache
+
+HERE = pathlib.Path(__file__).parent
+DATA = HERE / "data"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ParseCache(tmp_path / "cache", max_bytes=1024 * 1024)
+
+
+@pytest.fixture
+def document(tmp_path):
+    copy = tmp_path / "chapter.docx"
+    shutil.copy(DATA / "sample_chapter_with_titles.docx", copy)
+    return copy
+
+
+def test_hits_skip_the_parse(cache, document, monkeypatch):
+    parsed = parse_document(document, cache)
+    assert len(cache.entries()) == 1
+
+    def no_parse(src):
+        raise AssertionError("Parsed a cached document")
+
+    monkeypatch.setattr(ChapterImporter, "Parse", no_parse)
+    assert parse_document(document, cache) == parsed
+
+
+def test_changed_documents_miss(cache, document):
+    parse_document(document, cache)
+    stat = document.stat()
+    os.utime(document, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    parse_document(document, cache)
+    assert len(cache.entries()) == 2
+
+
+def test_least_recently_used_entries_are_evicted(cache, tmp_path):
+    names = ["sample_chapter_document.docx", "sample_chapter_with_locations.docx"]
+    keys = []
+    for age, name in enumerate(names):
+        parse_document(DATA / name, cache)
+        keys.append(cache.key(DATA / name))
+        os.utime(cache.entry(keys[-1]), (age, age))
+
+    cache.max_bytes = cache.entry(keys[1]).stat().st_size
+    assert cache.evict() == 1
+    assert [entry.name for entry in cache.entries()] == [cache.entry(keys[1]).name]
+
+
+def test_purge_and_unreadable_entries(cache, document):
+    parse_document(document, cache)
+    key = cache.key(document)
+    cache.entry(key).write_bytes(b"garbage")
+
+    assert cache.get(key) is None
+    assert cache.entries() == []
+
+    parse_document(document, cache)
+    assert cache.purge() == 1
+    assert cache.size() == 0
+
+
+def test_evicted_once_per_batch(cache):
+    names = ["sample_chapter_document.docx", "sample_chapter_with_locations.docx"]
+    cache.max_bytes = 1
+
+    # Workers only write, however big the cache gets
+    parse_document(DATA / names[0], cache)
+    assert len(cache.entries()) == 1
+
+    list(parse_documents([DATA / name for name in names], jobs=1, cache=cache))
+    assert cache.entries() == []
+
+
+def test_entries_removed_meanwhile_are_skipped(cache, document, monkeypatch):
+    parse_document(document, cache)
+    entries = cache.entries()
+    pathlib.Path(entries[0].path).unlink()
+
+    # As if another import evicted it between the scan and the stat
+    monkeypatch.setattr(ParseCache, "entries", lambda self: entries)
+    assert cache.size() == 0
+    assert cache.evict() == 0
@@ -0,0 +1,54 @@
+import pathlib
+import time
+from zipfile import ZipFile
+
+from lib.importer.docx import Docx
+from lib.importer.preview import preview_document
+
+HERE = pathlib.Path(__file__).parent
+DOCUMENT = HERE / "data" / "sample_chapter_with_titles.docx"
+
+
+def without_properties(src: pathlib.Path, dest: pathlib.Path):
+    with ZipFile(src) as original, ZipFile(dest, "w") as copy:
+        for item in original.infolist():
+            if item.filename != "docProps/app.xml":
+                copy.writestr(item, original.read(item))
+
+
+def test_counts_come_from_the_metadata():
+    preview = preview_document(DOCUMENT)
+
+    assert preview["source"] == "metadata"
+    assert (preview["words"], preview["paragraphs"], preview["pages"]) == (1080, 12, 3)
+
+
+def test_falls_back_to_a_text_scan(tmp_path):
+    document = tmp_path / DOCUMENT.name
+    without_properties(DOCUMENT, document)
+    paragraphs = list(Docx.Iterate(document))
+
+    preview = preview_document(document)
+
+    assert preview["source"] == "scan"
+    assert preview["pages"] is None
+    assert preview["paragraphs"] == len(paragraphs)
+    assert preview["words"] == sum(len("".join(p.body).split()) for p in paragraphs)
+
+
+def test_preview_job_reports_each_document(app, monkeypatch):
+    reported = []
+    monkeypatch.setattr(app, "callback", lambda _, payload: reported.append(payload))
+
+    document = dict(name=DOCUMENT.name, path=str(DOCUMENT.parent), size=1)
+    job_uid = app.jobs.submit(
+        "preview", dict(documents=[document], reporter_id="dialog"), bytes_total=1
+    )
+
+    deadline = time.monotonic() + 10
+    while app.jobs.status(job_uid)["status"] != "done":
+        assert time.monotonic() < deadline
+        time.sleep(0.02)
+
+    assert [preview["name"] for preview in reported] == [DOCUMENT.name]
+    assert app.jobs.status(job_uid)["result"] == {DOCUMENT.name: 1080}
@@ -0,0 +1,51 @@
+import pytest
+
+from lib import models
+from lib.api import BCAPI
+
+
+@pytest.fixture
+def referenced_book(app, make_book):
+    """One chapter, a status on both scenes and a character in the first"""
+
+    def create():
+        with app.get_db() as session:
+            book = make_book(session, chapters=1, scenes=2)
+            status = models.SceneStatus(name="Draft", color="red")
+            toon = models.Character(name="Alice")
+            book.scene_statuses.append(status)
+            book.characters.append(toon)
+            scenes = book.chapters[0].scenes
+            for scene in scenes:
+                scene.status = status
+            scenes[0].characters.append(toon)
+            session.commit()
+            return book.uid, [scene.uid for scene in scenes], toon.uid
+
+    return app.write(create)
+
+
+def test_references_resolve_scene_ids(app, referenced_book):
+    book_uid, (first_uid, _), toon_uid = referenced_book
+    api = BCAPI(app)
+
+    references = api.fetch_book_references(book_uid)
+    assert api.fetch_book_references(book_uid) is references
+
+    scene = api.fetch_scene(first_uid, fields=["status_id", "character_ids"])
+    assert references["statuses"][scene["status_id"]]["name"] == "Draft"
+    assert references["characters"][scene["character_ids"][0]]["scene_count"] == 1
+    assert api.list_all_characters(book_uid)[0]["scene_count"] == 1
+
+
+def test_references_refresh_on_commit(app, referenced_book):
+    book_uid, (_, second_uid), toon_uid = referenced_book
+    api = BCAPI(app)
+    api.fetch_book_references(book_uid)
+
+    app.write(api.add_character_to_scene, second_uid, toon_uid)
+    characters = api.fetch_book_references(book_uid)["characters"]
+    assert characters[toon_uid]["scene_count"] == 2
+
+    status = app.write(api.create_scene_status, book_uid, "Done", "green")
+    assert status["id"] in api.fetch_book_references(book_uid)["statuses"]
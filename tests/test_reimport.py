@@ -0,0 +1,124 @@
+import pathlib
+import shutil
+from zipfile import ZipFile
+
+from lib import ids, models
+from lib.importer import batch
+from lib.importer.chapter_importer import ParsedScene
+from lib.importer.reimport import SceneFingerprint, match_scenes
+from lib.jobs import JobContext
+
+HERE = pathlib.Path(__file__).parent
+SOURCE = HERE / "data" / "sample_chapter_with_titles.docx"
+
+
+def parsed(*para_ids):
+    return ParsedScene("", "", "", "", para_ids=para_ids)
+
+
+def test_matches_by_shared_paragraphs():
+    previous = [
+        SceneFingerprint("a", ["1", "2"], "x"),
+        SceneFingerprint("b", ["3", "4"], "y"),
+        SceneFingerprint("c", ["5"], "z"),
+    ]
+    # b was split in two and c deleted, a new scene went in front
+    scenes = [parsed("9"), parsed("1", "2"), parsed("3"), parsed("4", "8")]
+
+    assert match_scenes(previous, scenes) == [None, 0, 1, None]
+
+
+def test_chapters_without_fingerprints_match_by_position():
+    previous = [SceneFingerprint("a", None, None), SceneFingerprint("b", None, None)]
+
+    assert match_scenes(previous, [parsed("1")]) == [0]
+    assert match_scenes(previous, [parsed(), parsed(), parsed()]) == [0, 1, None]
+
+
+def rewrite(src: pathlib.Path, dest: pathlib.Path, old: str, new: str):
+    with ZipFile(src) as original, ZipFile(dest, "w") as copy:
+        for item in original.infolist():
+            data = original.read(item)
+            if item.filename == "word/document.xml":
+                data = data.replace(old.encode(), new.encode())
+            copy.writestr(item, data)
+
+
+def test_reimport_only_touches_changed_scenes(app, tmp_path):
+    document = tmp_path / SOURCE.name
+    shutil.copy(SOURCE, document)
+
+    context = JobContext(app.jobs, "direct", dict())
+    book_uid = batch.import_batch(
+        context,
+        [dict(name=document.name, path=str(tmp_path))],
+        dict(
+            book_name="Reimported",
+            have_default_status=False,
+            default_status="",
+            status_color="",
+        ),
+    )
+
+    def annotate():
+        with app.get_db() as session:
+            book = models.Book.Fetch_by_UID(session, book_uid)
+            scenes = book.chapters[0].scenes
+            scenes[0].notes = "Keep me"
+            scenes[0].characters.append(models.Character(name="Alice", book=book))
+            session.commit()
+            return book.chapters[0].uid, [scene.uid for scene in scenes]
+
+    chapter_uid, uids = app.write(annotate)
+
+    rewrite(SOURCE, document, "Second scene starts here!", "Second scene began here!")
+    changes = batch.reimport_chapter(
+        JobContext(app.jobs, "direct", dict()), chapter_uid
+    )
+
+    assert changes["updated"] == [uids[1]]
+    assert changes["added"] == changes["removed"] == changes["moved"] == []
+    assert changes["unchanged"] == 2
+
+    with app.get_db() as session:
+        scenes = models.Chapter.Fetch_by_uid(session, chapter_uid).scenes
+        assert [scene.uid for scene in scenes] == uids
+        assert scenes[0].notes == "Keep me"
+        assert [toon.name for toon in scenes[0].characters] == ["Alice"]
+        assert scenes[1].content.startswith("Second scene began here!")
+
+
+def test_added_scenes_get_reserved_uids(app, tmp_path, monkeypatch):
+    shutil.copy(SOURCE, tmp_path / SOURCE.name)
+    book_uid = batch.import_batch(
+        JobContext(app.jobs, "direct", dict()),
+        [dict(name=SOURCE.name, path=str(tmp_path))],
+        dict(
+            book_name="Reimported",
+            have_default_status=False,
+            default_status="",
+            status_color="",
+        ),
+    )
+
+    def existing():
+        with app.get_db() as session:
+            chapter = models.Book.Fetch_by_UID(session, book_uid).chapters[0]
+            return chapter.uid, [scene.uid for scene in chapter.scenes]
+
+    chapter_uid, uids = app.write(existing)
+
+    # Nothing matches so every scene is new, and the first uids generated clash
+    monkeypatch.setattr(
+        batch, "match_scenes", lambda previous, scenes: [None] * len(scenes)
+    )
+    replacements = [f"Replacement {idx}" for idx in range(len(uids))]
+    batches = iter([uids, replacements])
+    monkeypatch.setattr(ids, "generate_ids", lambda count: next(batches)[:count])
+
+    changes = batch.reimport_chapter(
+        JobContext(app.jobs, "direct", dict()), chapter_uid
+    )
+
+    assert changes["added"] == replacements
+    assert sorted(changes["removed"]) == sorted(uids)
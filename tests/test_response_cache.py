@@ -0,0 +1,139 @@
+from sqlalchemy import delete, insert, update
+
+from lib import models
+from lib.api import BCAPI
+from lib.response_cache import ResponseCache, statement_tags, tags_for
+
+
+def test_repeated_reads_are_served_from_the_cache(app, app_book):
+    _, (chapter_uid, _) = app_book
+    api = BCAPI(app)
+
+    first = api.chapter_fetch(chapter_uid)
+    assert api.chapter_fetch(chapter_uid) is first
+
+    stats = api.response_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_scene_update_only_invalidates_its_chapter(app, app_book):
+    _, (first_uid, second_uid) = app_book
+    api = BCAPI(app)
+
+    first, second = api.chapter_fetch(first_uid), api.chapter_fetch(second_uid)
+    scene = first["scenes"][0]
+    app.write(api.update_scene, scene["id"], dict(content="Changed words"))
+
+    assert api.chapter_fetch(second_uid) is second
+    fetched = api.chapter_fetch(first_uid)
+    assert fetched is not first
+    assert fetched["scenes"][0]["content"] == "Changed words"
+
+
+def test_new_character_invalidates_the_character_list(app, app_book):
+    book_uid, (chapter_uid, _) = app_book
+    api = BCAPI(app)
+
+    assert api.list_all_characters(book_uid) == []
+    scene_uid = api.chapter_fetch(chapter_uid)["scenes"][0]["id"]
+    app.write(api.create_new_character_to_scene, book_uid, scene_uid, "Alice")
+
+    assert [toon["name"] for toon in api.list_all_characters(book_uid)] == ["Alice"]
+
+
+def test_bulk_statements_invalidate_the_rows_they_touch(app, app_book):
+    book_uid, (first_uid, second_uid) = app_book
+    api = BCAPI(app)
+    first, second = api.chapter_fetch(first_uid), api.chapter_fetch(second_uid)
+
+    def bulk(make_statement):
+        def run():
+            with app.get_db() as session:
+                chapter = models.Chapter.Fetch_by_uid(session, first_uid)
+                session.execute(*make_statement(chapter))
+                session.commit()
+
+        app.write(run)
+
+    # Like the importer's Core inserts, the scenes name their chapter
+    bulk(
+        lambda chapter: (
+            insert(models.Scene),
+            [dict(title="Bulk", order=1, chapter_id=chapter.id)],
+        )
+    )
+    assert api.chapter_fetch(second_uid) is second
+    assert len(api.chapter_fetch(first_uid)["scenes"]) == 2
+
+    # Every chapter of the book, they all list their siblings' order
+    bulk(
+        lambda chapter: (
+            update(models.Chapter)
+            .where(models.Chapter.book_id == chapter.book_id)
+            .values(title="Renamed")
+            .execution_options(synchronize_session=False),
+        )
+    )
+    assert api.chapter_fetch(second_uid)["title"] == "Renamed"
+
+    api.chapter_fetch(first_uid)
+    bulk(lambda chapter: (update(models.Book).values(title="Unscoped"),))
+    assert api.response_cache_stats()["entries"] == 0
+
+
+def test_statement_tags():
+    chapter_scenes = models.Scene.chapter_id == 3
+    reorder = update(models.Scene).where(models.Scene.uid.in_(["a"]), chapter_scenes)
+    assert statement_tags(reorder.values(order=1)) == [("Chapter", 3)]
+
+    imported = insert(models.Chapter.__table__).values(title="Imported", book_id=2)
+    assert set(statement_tags(imported)) == {("Book", 2), ("Chapters", 2)}
+
+    bulk_by_id = [dict(id=4, title="One"), dict(id=5, title="Two")]
+    assert set(statement_tags(update(models.Chapter), bulk_by_id)) == {
+        ("Chapter", 4),
+        ("Chapter", 5),
+    }
+
+    # Moved to another chapter, the one they left isn't known
+    moved = update(models.Scene).where(chapter_scenes).values(chapter_id=4)
+    assert statement_tags(moved) == [("Chapter", None)]
+
+    unlinked = delete(models.Scenes2Characters)
+    assert statement_tags(unlinked) == [("Characters", None)]
+    assert statement_tags(delete(models.Setting)) == []
+    assert statement_tags(update(models.Chapter).values(title="All")) is None
+
+
+def test_character_links_tag_the_characters(session, make_book):
+    book = make_book(session, chapters=1, scenes=1)
+    toon = models.Character(name="Alice")
+    book.characters.append(toon)
+    session.commit()
+
+    chapter = book.chapters[0]
+    scene = chapter.scenes[0]
+    scene.characters.append(toon)
+    assert set(tags_for(scene)) == {("Chapter", chapter.id), ("Characters", book.id)}
+
+
+def test_least_recently_used_is_evicted():
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", 1, [("Chapter", 1)], cache.generation)
+    cache.put("b", 2, [("Chapter", 2)], cache.generation)
+    cache.get("a")
+    cache.put("c", 3, [("Chapter", 3)], cache.generation)
+
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_reads_older_than_an_invalidation_are_not_stored():
+    cache = ResponseCache()
+    generation = cache.generation
+    cache.invalidate([("Chapter", 1)])
+
+    assert cache.put("a", 1, [("Chapter", 1)], generation) is False
+    assert cache.put("a", 1, [("Chapter", 1)], cache.generation) is True
+    assert cache.invalidate([("Chapter", None)]) == 1
@@ -0,0 +1,86 @@
+import pytest
+from sqlalchemy import select
+
+from lib import models
+from lib.api import BCAPI
+from lib.application import BCApplication
+
+DEFAULTS = """
+fontName = "Calibri"
+debounceTime = 800
+save2Disk = false
+
+[importer]
+jobs = 1
+"""
+
+
+@pytest.fixture
+def app(tmp_path):
+    (tmp_path / "defaults.settings.toml").write_text(DEFAULTS)
+    app = BCApplication(tmp_path / "app.sqlite3", here=tmp_path)
+    yield app
+    app.shutdown()
+
+
+def stored(app):
+    with app.get_db() as session:
+        return {
+            setting.name: setting.asdict()["value"]
+            for setting in session.scalars(select(models.Setting))
+        }
+
+
+def test_defaults_are_loaded_typed(app):
+    api = BCAPI(app)
+
+    assert api.getSetting("debounceTime") == 800
+    assert api.getSetting("save2Disk") is False
+    assert api.getSetting("jobs") is None
+    assert stored(app) == dict(fontName="Calibri", debounceTime=800, save2Disk=False)
+
+
+def test_reads_never_touch_the_database(app, record_sql):
+    api = BCAPI(app)
+    with record_sql(app.read_engine) as reads, record_sql(app.engine) as writes:
+        api.getSetting("fontName")
+        api.fetchAllSettings()
+
+    assert reads == writes == []
+
+
+def test_changes_write_through_in_one_statement(app, record_sql):
+    api = BCAPI(app)
+    with record_sql(app.engine) as statements:
+        api.bulk_update_settings(
+            dict(
+                debounceTime=dict(value="1200"),
+                save2Disk=dict(value=True),
+                fontName=dict(value="Calibri"),
+            )
+        )
+
+    updates = [query for query in statements if query.statement.startswith("UPDATE")]
+    assert len(updates) == 1
+    assert api.getSetting("debounceTime") == 1200
+    assert stored(app)["save2Disk"] is True
+
+    with pytest.raises(ValueError):
+        api.setSetting("missing", 1)
+
+
+def test_subscribers_hear_committed_changes(app):
+    heard = []
+    app.settings.subscribe(
+        lambda name, value: heard.append((name, value)), "saveInterval"
+    )
+    app.settings.subscribe(lambda name, value: 1 / 0)
+
+    api = BCAPI(app)
+    api.set_default_setting("saveInterval", 2, "number")
+    api.setSetting("saveInterval", 5)
+    api.setSetting("saveInterval", 5)
+    api.setSetting("fontName", "Arial")
+
+    assert heard == [("saveInterval", 5)]
+    assert api.getSetting("fontName") == "Arial"
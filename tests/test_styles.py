@@ -0,0 +1,71 @@
+from lxml.etree import fromstring
+
+from lib.importer.docx import DocxParagraph
+from lib.importer.styles import StyleMap
+from lib.importer.tags_and_ns import NAMESPACES
+
+W = NAMESPACES["w"]
+
+STYLES = f"""<w:styles xmlns:w="{W}">
+    <w:style w:type="paragraph" w:default="1" w:styleId="Normal">
+        <w:name w:val="Normal"/>
+    </w:style>
+    <w:style w:type="paragraph" w:styleId="Title">
+        <w:name w:val="Title"/><w:basedOn w:val="Normal"/>
+    </w:style>
+    <w:style w:type="paragraph" w:styleId="ChapterHeading">
+        <w:name w:val="Chapter Heading"/><w:basedOn w:val="Title"/>
+    </w:style>
+    <w:style w:type="paragraph" w:styleId="SceneBreak">
+        <w:name w:val="Scene Break"/><w:basedOn w:val="Normal"/>
+        <w:pPr><w:jc w:val="center"/></w:pPr>
+    </w:style>
+    <w:style w:type="paragraph" w:styleId="SceneBreakSmall">
+        <w:basedOn w:val="SceneBreak"/>
+    </w:style>
+    <w:style w:type="paragraph" w:styleId="Place">
+        <w:pPr><w:jc w:val="end"/></w:pPr>
+    </w:style>
+    <w:style w:type="paragraph" w:styleId="Loop"><w:basedOn w:val="Pool"/></w:style>
+    <w:style w:type="paragraph" w:styleId="Pool"><w:basedOn w:val="Loop"/></w:style>
+</w:styles>"""
+
+
+def paragraph(style_id=None, jc=None):
+    ppr = ""
+    if style_id is not None:
+        ppr += f'<w:pStyle w:val="{style_id}"/>'
+    if jc is not None:
+        ppr += f'<w:jc w:val="{jc}"/>'
+
+    return fromstring(
+        f'<w:p xmlns:w="{W}" xmlns:w14="{NAMESPACES["w14"]}" w14:paraId="1">'
+        f"<w:pPr>{ppr}</w:pPr><w:r><w:t>Text</w:t></w:r></w:p>"
+    )
+
+
+def test_inheritance_is_resolved():
+    styles = StyleMap.Parse(fromstring(STYLES))
+
+    assert styles.default == "Normal"
+    assert styles.get("ChapterHeading").kind == "title"
+    assert styles.get("SceneBreakSmall").justification == "center"
+    assert styles.get("Place").justification == "right"
+    assert styles.get("").style_id == "Normal"
+    assert styles.get("Loop").kind is None
+
+
+def test_paragraphs_are_classified_through_their_style():
+    styles = StyleMap.Parse(fromstring(STYLES))
+
+    def load(*args):
+        return DocxParagraph.Load(paragraph(*args), styles).properties
+
+    assert load("ChapterHeading").is_title
+    assert load("SceneBreakSmall").is_center
+    assert load("Place").is_right
+    # Direct formatting still beats the style
+    assert load("SceneBreak", "right").is_right
+    assert load().name == "Normal" and load().is_title is False
+    # Unknown styles fall back to the name alone
+    assert load("Title").is_title and load("Missing").is_title is False
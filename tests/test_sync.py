@@ -0,0 +1,96 @@
+import os
+import pathlib
+import shutil
+import threading
+import time
+
+from lib.importer import batch
+from lib.jobs import JobContext
+
+HERE = pathlib.Path(__file__).parent
+DATA = HERE / "data"
+NAMES = ("sample_chapter_document.docx", "sample_chapter_with_titles.docx")
+
+
+def import_dir(app, source_dir: pathlib.Path) -> str:
+    for name in NAMES:
+        shutil.copy(DATA / name, source_dir / name)
+
+    return batch.import_batch(
+        JobContext(app.jobs, "direct", dict()),
+        [dict(name=name, path=str(source_dir)) for name in NAMES],
+        dict(
+            book_name="Synced",
+            have_default_status=False,
+            default_status="",
+            status_color="",
+        ),
+        book_path=str(source_dir),
+    )
+
+
+def wait_until_synced(app, book_uid, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        report = app.sync.scan(book_uid)
+        if len(report["modified"]) == 0:
+            return report
+        time.sleep(0.02)
+
+    raise AssertionError(f"{book_uid} still has stale chapters: {report}")
+
+
+def test_scan_reports_new_removed_and_modified(app, tmp_path):
+    book_uid = import_dir(app, tmp_path)
+
+    report = app.sync.scan(book_uid)
+    assert (report["new"], report["removed"], report["modified"]) == ([], [], [])
+    assert report["unchanged"] == 2
+
+    (tmp_path / NAMES[0]).unlink()
+    shutil.copy(DATA / "three_page_scene.docx", tmp_path / "three_page_scene.docx")
+    (tmp_path / "~$lock.docx").write_bytes(b"")
+    stat = (tmp_path / NAMES[1]).stat()
+    os.utime(tmp_path / NAMES[1], (stat.st_atime, stat.st_mtime + 60))
+
+    report = app.sync.scan(book_uid)
+    assert report["new"] == ["three_page_scene.docx"]
+    assert len(report["removed"]) == 1
+    assert len(report["modified"]) == 1
+    assert report["jobs"] == []
+
+
+def test_sync_reimports_only_stale_chapters(app, tmp_path):
+    book_uid = import_dir(app, tmp_path)
+    stat = (tmp_path / NAMES[1]).stat()
+    os.utime(tmp_path / NAMES[1], (stat.st_atime, stat.st_mtime + 60))
+
+    report = app.sync.sync(book_uid)
+    assert len(report["jobs"]) == 1
+
+    report = wait_until_synced(app, book_uid)
+    assert report["unchanged"] == 2
+
+
+def test_watcher_reports_changes(app, tmp_path):
+    book_uid = import_dir(app, tmp_path)
+    reports = []
+    changed = threading.Event()
+
+    def on_change(report):
+        reports.append(report)
+        changed.set()
+
+    app.sync.watch(book_uid, on_change, interval=0.05)
+    shutil.copy(DATA / "three_page_scene.docx", tmp_path / "three_page_scene.docx")
+
+    assert changed.wait(5)
+    assert reports[0]["new"] == ["three_page_scene.docx"]
+
+    # Still there but nothing changed since, later ticks stay silent
+    changed.clear()
+    assert changed.wait(0.3) is False
+    assert len(reports) == 1
+
+    assert app.sync.unwatch(book_uid) is True
+    assert app.sync.unwatch(book_uid) is False
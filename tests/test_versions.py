@@ -0,0 +1,111 @@
+from sqlalchemy import insert, select
+
+from lib import models
+from lib.api import BCAPI
+
+
+def revisions(session, book):
+    session.expire_all()
+    chapter = book.chapters[0]
+    return book.revision, chapter.revision, chapter.scenes[0].revision
+
+
+def test_changes_bump_the_row_and_its_parents(session, make_book):
+    book = make_book(session, scenes=1)
+    book_rev, chapter_rev, scene_rev = revisions(session, book)
+    sibling_rev = book.chapters[1].revision
+
+    book.chapters[0].scenes[0].content = "Other words"
+    session.commit()
+    assert revisions(session, book) == (book_rev + 1, chapter_rev + 1, scene_rev + 1)
+
+    # Untouched siblings keep their revision
+    assert book.chapters[1].revision == sibling_rev
+
+
+def test_bulk_statements_and_links_bump_revisions(session, make_book):
+    book = make_book(session, scenes=1)
+    book_rev, chapter_rev, scene_rev = revisions(session, book)
+
+    session.execute(
+        insert(models.Scene),
+        [dict(title="Bulk", order=1, chapter_id=book.chapters[0].id)],
+    )
+    session.commit()
+    assert revisions(session, book)[:2] == (book_rev + 1, chapter_rev + 1)
+
+    toon = models.Character(name="Alice")
+    book.characters.append(toon)
+    book.chapters[0].scenes[0].characters.append(toon)
+    session.commit()
+    linked = revisions(session, book)
+    assert linked[2] == scene_rev + 1
+
+    toon.name = "Alicia"
+    session.commit()
+    assert revisions(session, book)[2] == linked[2] + 1
+
+
+def test_conditional_fetches(app, app_book):
+    book_uid, (first_uid, second_uid) = app_book
+    api = BCAPI(app)
+    api.set_current_book(book_uid)
+
+    book = api.get_current_book()
+    first, second = api.chapter_fetch(first_uid), api.chapter_fetch(second_uid)
+    scene = api.fetch_scene(first["scenes"][0]["id"])
+    assert first["scenes"][0]["version"] == scene["version"]
+
+    assert api.get_current_book(version=book["version"])["type"] == "not_modified"
+    assert api.chapter_fetch(first_uid, version=first["version"]) == dict(
+        type="not_modified", version=first["version"]
+    )
+
+    app.write(api.update_scene, scene["id"], dict(content="Changed words"))
+
+    assert api.get_current_book(version=book["version"])["type"] == "book"
+    refreshed = api.chapter_fetch(first_uid, version=first["version"])
+    assert refreshed["scenes"][0]["content"] == "Changed words"
+    assert refreshed["version"] != first["version"]
+    assert api.fetch_scene(scene["id"], version=scene["version"])["type"] == "scene"
+
+    unchanged = api.chapter_fetch(second_uid, version=second["version"])
+    assert unchanged["type"] == "not_modified"
+
+
+def test_fetch_version_reads_only_the_counter(session, make_book):
+    book = make_book(session, scenes=1)
+    uid = book.uid
+    session.expunge_all()
+
+    token = models.fetch_version(session, models.Book, models.Book.uid == uid)
+    assert len(session.identity_map) == 0
+
+    book = session.execute(select(models.Book)).scalars().one()
+    assert token == book.asdict(fields=[])["version"]
+
+
+def test_linking_elsewhere_leaves_other_chapters_current(app, make_book):
+    def create():
+        with app.get_db() as session:
+            book = make_book(session, scenes=1)
+            toon = models.Character(name="Alice")
+            book.characters.append(toon)
+            book.chapters[0].scenes[0].characters.append(toon)
+            session.commit()
+            first, second = book.chapters
+            return book.uid, first.uid, second.scenes[0].uid, toon.uid
+
+    book_uid, first_uid, other_scene_uid, toon_uid = app.write(create)
+    api = BCAPI(app)
+
+    first = api.chapter_fetch(first_uid)
+    app.write(api.add_character_to_scene, other_scene_uid, toon_uid)
+
+    # Nothing in the first chapter's payload depends on the other chapter
+    assert "scene_count" not in first["scenes"][0]["characters"][0]
+    assert api.chapter_fetch(first_uid, version=first["version"]) == dict(
+        type="not_modified", version=first["version"]
+    )
+    references = api.fetch_book_references(book_uid)
+    assert references["characters"][toon_uid]["scene_count"] == 2
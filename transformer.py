@@ -17,7 +17,15 @@ template_body = """import {
     type common_setting_type, 
     type UniqueId, 
     type SceneStatus,    
-    type ImportedBook
+    type ImportedBook,
+    type Delta,
+    type OrderType,
+    type JobType,
+    type SyncReport,
+    type DocumentFile,
+    type CacheStats,
+    type NotModified,
+    type BookReferences
     } from '@src/types'
 
 interface Boundary {
@@ -166,33 +174,8 @@ def process_function(func_elm: ast.FunctionDef):
         func_type = "any"
         arg_def = func_elm
 
-        if isinstance(arg.annotation, ast.Name):
-            func_type = python2ts_types(arg.annotation.id)
-
-        elif isinstance(arg.annotation, ast.Subscript):
-            # fuck it
-            if (
-                hasattr(arg.annotation.value, "id")
-                and arg.annotation.value.id == "list"
-            ):
-                func_type = f"{arg.annotation.slice.id}[]"
-
-            elif (
-                isinstance(arg.annotation.value, ast.Attribute)
-                and arg.annotation.value.attr == "Optional"
-            ):
-                func_type = f"{python2ts_types(arg.annotation.slice.id)} | undefined"
-            elif (
-                isinstance(arg.annotation.value, ast.Name)
-                and arg.annotation.value.id == "list"
-            ):
-                func_type = f"{python2ts_types(arg.annotation.slice.id)}[]"
-
-            else:
-                func_type = "any"
-
-        elif arg.annotation is not None and hasattr(arg.annotation, "id"):
-            func_type = python2ts_types(arg.annotation.id)
+        if arg.annotation is not None:
+            func_type = annotation2ts(arg.annotation)
 
         arg_map[arg.arg] = f"{arg.arg}:{func_type}"
         if arg.arg in mapped_defaults and mapped_defaults[arg.arg] in (None, "None"):
@@ -210,6 +193,39 @@ def process_function(func_elm: ast.FunctionDef):
     return definition
 
 
+def annotation2ts(annotation: ast.expr) -> str:
+    """Best effort conversion of a python type annotation to its typescript twin"""
+    match annotation:
+        case ast.Name(id=name) | ast.Attribute(attr=name):
+            return python2ts_types(name)
+
+        case ast.Constant(value=None):
+            return "undefined"
+
+        case ast.BinOp(left=left, op=ast.BitOr(), right=right):
+            return f"{annotation2ts(left)} | {annotation2ts(right)}"
+
+        case ast.Subscript(value=ast.Name(id=container) | ast.Attribute(attr=container)):
+            inner = annotation.slice
+            members = inner.elts if isinstance(inner, ast.Tuple) else [inner]
+
+            match container:
+                case "list" | "List" | "Sequence":
+                    member = annotation2ts(inner)
+                    return f"({member})[]" if " " in member else f"{member}[]"
+                case "Optional":
+                    return f"{annotation2ts(inner)} | undefined"
+                case "Union":
+                    return " | ".join(annotation2ts(member) for member in members)
+                case "tuple" | "Tuple":
+                    return f"[{', '.join(annotation2ts(member) for member in members)}]"
+                case "dict" | "Dict":
+                    key, value = members
+                    return f"Record<{annotation2ts(key)}, {annotation2ts(value)}>"
+
+    return "any"
+
+
 def process_default_argument(defaultOp):
     if (
         isinstance(
@@ -251,26 +267,12 @@ def process_args(func_args: T.List[ast.arg]):
 
 
 def process_returntype(func_elm: ast.FunctionDef):
-    if isinstance(func_elm.returns, ast.Subscript):
-        if (
-            isinstance(func_elm.returns.value, ast.Name)
-            and func_elm.returns.value.id == "list"
-        ):
-            name_elm = func_elm.returns.value  # type: ast.Name
-            slice = func_elm.returns.slice  # type: ast.Name
-            if name_elm.id == "list" and isinstance(slice, ast.Name):
-                return f"{slice.id}[]"
-        elif isinstance(func_elm.returns.value, ast.Attribute):
-            if func_elm.returns.value.attr == "Optional":
-                if isinstance(func_elm.returns.slice, ast.Attribute):
-                    return f"{func_elm.returns.slice.attr} | undefined"
-                elif isinstance(func_elm.returns.slice, ast.Name):
-                    return f"{func_elm.returns.slice.id} | undefined "
-
-    if isinstance(func_elm.returns, ast.Name):
-        return python2ts_types(func_elm.returns.id)
-
-    return None
+    if func_elm.returns is None:
+        return None
+    elif isinstance(func_elm.returns, ast.Constant) and func_elm.returns.value is None:
+        return "void"
+
+    return annotation2ts(func_elm.returns)
 
 
 def transform(payload: T.Tuple[str, set[str]]):
@@ -0,0 +1,23 @@
+import type APIBridge from '@src/lib/remote'
+import { type JobType, type UniqueId } from '@src/types'
+
+const FINISHED: JobType['status'][] = ['done', 'failed', 'cancelled', 'interrupted']
+
+/*
+Imports and reimports run as background jobs and only hand back the job's id,
+poll until the job finishes.  Resolves with the job once done, rejects with
+its error otherwise.
+ */
+export const waitForJob = async (api: APIBridge, jobUid: UniqueId, interval = 500): Promise<JobType> => {
+    for (;;) {
+        const job = await api.job_status(jobUid)
+        if (FINISHED.includes(job.status)) {
+            if (job.status !== 'done') {
+                throw new Error(job.error ?? `job ${job.status}`)
+            }
+            return job
+        }
+
+        await new Promise((resolve) => setTimeout(resolve, interval))
+    }
+}
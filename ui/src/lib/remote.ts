@@ -7,7 +7,8 @@ import {
     type common_setting_type, 
     type UniqueId, 
     type SceneStatus,    
-    type ImportedBook
+    type ImportedBook,
+    type JobType
     } from '@src/types'
 
 interface Boundary {
@@ -239,14 +240,18 @@ TODO verify this cascades
         return this.boundary.remote('importer_list_files', filepath);
     }
 
-    async importer_process_batch(reporterId:string) {
+    async importer_process_batch(reporterId:string):Promise<UniqueId> {
         return this.boundary.remote('importer_process_batch', reporterId);
     }
 
-    async importer_reimport_chapter(chapterUid:UniqueId):Promise<boolean> {
+    async importer_reimport_chapter(chapterUid:UniqueId):Promise<UniqueId> {
         return this.boundary.remote('importer_reimport_chapter', chapterUid);
     }
 
+    async job_status(job_uid:UniqueId):Promise<JobType> {
+        return this.boundary.remote('job_status', job_uid);
+    }
+
     async debug_long_task(callbackId:string) {
         return this.boundary.remote('debug_long_task', callbackId);
     }
@@ -5,6 +5,7 @@ import { ShowInfo } from '@src/widget/ShowInfoNotification'
 import { useAppContext } from '@src/App.context'
 import { ShowError } from '@src/widget/ShowErrorNotification'
 import { AppModes } from '@src/types'
+import { waitForJob } from '@src/lib/jobs'
 
 interface ImportedMessage {
     action: 'show' | 'add_chapter'
@@ -44,6 +45,7 @@ export const Process = () => {
         const handlerId = switchBoard.generate(handleUpdates)
 
         api.importer_process_batch(handlerId)
+            .then((jobUid) => waitForJob(api, jobUid))
             .then(() => {
                 bookBroker.clearCache().then(() => {
                     setAppMode(AppModes.MANIFEST)
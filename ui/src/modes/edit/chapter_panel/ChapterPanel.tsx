@@ -3,6 +3,8 @@ import React from 'react'
 import { useEditorContext } from '@src/modes/edit/Editor.context'
 import { type Chapter } from '@src/types'
 import { useAppContext } from '@src/App.context'
+import { ShowError } from '@src/widget/ShowErrorNotification'
+import { waitForJob } from '@src/lib/jobs'
 
 interface ChapterPanelProps {
     chapter: Chapter
@@ -13,9 +15,12 @@ export const ChapterPanel: React.FC<ChapterPanelProps> = ({ chapter }) => {
     const { chapterBroker } = useEditorContext()
 
     const onClickReimport = () => {
-        api.importer_reimport_chapter(chapter.id).then(() =>
-            chapterBroker.clearChapterCache(chapter.book_id, chapter.id).then()
-        )
+        api.importer_reimport_chapter(chapter.id)
+            .then((jobUid) => waitForJob(api, jobUid))
+            .then(() => chapterBroker.clearChapterCache(chapter.book_id, chapter.id))
+            .catch((err: Error) => {
+                ShowError('Reimport failure', `Reimport failed with ${err.message}`)
+            })
     }
 
     return (
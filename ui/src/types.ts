@@ -165,3 +165,18 @@ export interface ImportedBook {
     dir_name: string
     documents: DocumentFile[]
 }
+
+export interface JobType {
+    id: UniqueId
+    kind: string
+    status: 'pending' | 'running' | 'done' | 'failed' | 'cancelled' | 'interrupted'
+    message: string
+    bytes_total: number
+    bytes_done: number
+    progress: number
+    eta?: number
+    result: unknown
+    error?: string
+    created_on: string
+    finished_on?: string
+}
@@ -77,7 +77,8 @@ export const SceneBroker = ({
         ) =>
             // eslint-disable-next-line react-hooks/rules-of-hooks
             useQuery<Scene, Error>({
-                queryFn: () => api.fetch_scene(scene_id as Scene['id']),
+                // Without a version it never answers not_modified
+                queryFn: () => api.fetch_scene(scene_id as Scene['id']) as Promise<Scene>,
                 queryKey: ['book', book_id, 'chapter', chapter_id, 'scene', scene_id],
                 enabled
             }),
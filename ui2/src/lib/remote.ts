@@ -7,7 +7,15 @@ import {
     type common_setting_type, 
     type UniqueId, 
     type SceneStatus,    
-    type ImportedBook
+    type ImportedBook,
+    type Delta,
+    type OrderType,
+    type JobType,
+    type SyncReport,
+    type DocumentFile,
+    type CacheStats,
+    type NotModified,
+    type BookReferences
     } from '@src/types'
 
 interface Boundary {
@@ -30,38 +38,46 @@ class APIBridge {
         return this.boundary.remote('alert', message);
     }
 
-    async list_books(stripped:boolean = true):Promise<Book[]> {
-        return this.boundary.remote('list_books', stripped);
+    async list_books(stripped:boolean = true, fields:string[] | undefined = undefined):Promise<Book[]> {
+        return this.boundary.remote('list_books', stripped, fields);
     }
-
-    async get_current_book(stripped:boolean = true):Promise<Book | undefined> {
-        return this.boundary.remote('get_current_book', stripped);
+/* Answers NotModified when `version` is still the book's version */
+    async get_current_book(stripped:boolean = true, fields:string[] | undefined = undefined, version:string | undefined = undefined):Promise<Book | NotModified | undefined> {
+        return this.boundary.remote('get_current_book', stripped, fields, version);
     }
 
     async set_current_book(book_uid:UniqueId):Promise<Book> {
         return this.boundary.remote('set_current_book', book_uid);
     }
 
-    async update_book(changed_book:Book):Promise<Book> {
-        return this.boundary.remote('update_book', changed_book);
+    async update_book(changed_book:Book, delta:boolean = false):Promise<Book | Delta> {
+        return this.boundary.remote('update_book', changed_book, delta);
+    }
+
+    async book_update(book_uid:UniqueId, changeset:Book, delta:boolean = false):Promise<Book | Delta> {
+        return this.boundary.remote('book_update', book_uid, changeset, delta);
     }
 
-    async book_update(book_uid:UniqueId, changeset:Book):Promise<Book> {
-        return this.boundary.remote('book_update', book_uid, changeset);
+    async book_change_title(book_uid:UniqueId, new_title:string, delta:boolean = false):Promise<Book | Delta> {
+        return this.boundary.remote('book_change_title', book_uid, new_title, delta);
     }
 
-    async book_change_title(book_uid:UniqueId, new_title:string):Promise<Book> {
-        return this.boundary.remote('book_change_title', book_uid, new_title);
+    async update_book_title(book_uid:UniqueId, new_title:string, delta:boolean = false):Promise<Book | Delta> {
+        return this.boundary.remote('update_book_title', book_uid, new_title, delta);
     }
 
-    async update_book_title(book_uid:UniqueId, new_title:string):Promise<Book> {
-        return this.boundary.remote('update_book_title', book_uid, new_title);
+    async book_simple_fetch(book_uid:UniqueId):Promise<Book> {
+        return this.boundary.remote('book_simple_fetch', book_uid);
     }
 
     async fetch_book_simple(book_uid:UniqueId):Promise<Book> {
         return this.boundary.remote('fetch_book_simple', book_uid);
     }
 
+    async book_create_managed(book_name:string):Promise<Book> {
+        return this.boundary.remote('book_create_managed', book_name);
+    }
+
     async create_managed_book(book_name:string):Promise<Book> {
         return this.boundary.remote('create_managed_book', book_name);
     }
@@ -78,9 +94,21 @@ class APIBridge {
         return this.boundary.remote('create_source', );
     }
 
+    async chapters_fetch(book_id:UniqueId):Promise<Chapter[]> {
+        return this.boundary.remote('chapters_fetch', book_id);
+    }
+
     async fetch_chapters():Promise<Chapter[]> {
         return this.boundary.remote('fetch_chapters', );
     }
+/* Answers NotModified when `version` is still the chapter's version */
+    async chapter_fetch(chapter_uid:UniqueId, stripped:boolean = false, fields:string[] | undefined = undefined, version:string | undefined = undefined):Promise<Chapter | NotModified> {
+        return this.boundary.remote('chapter_fetch', chapter_uid, stripped, fields, version);
+    }
+
+    async chapter_fetch_index(chapter_uid:UniqueId):Promise<Chapter> {
+        return this.boundary.remote('chapter_fetch_index', chapter_uid);
+    }
 
     async fetch_chapter(chapter_id:UniqueId, stripped:boolean = false):Promise<Chapter> {
         return this.boundary.remote('fetch_chapter', chapter_id, stripped);
@@ -90,28 +118,28 @@ class APIBridge {
         return this.boundary.remote('fetch_chapter_index', chapter_id);
     }
 
-    async update_chapter(chapter_id:UniqueId, chapter_data:Chapter):Promise<Chapter> {
-        return this.boundary.remote('update_chapter', chapter_id, chapter_data);
+    async update_chapter(chapter_id:UniqueId, chapter_data:Chapter, delta:boolean = false):Promise<Chapter | Delta> {
+        return this.boundary.remote('update_chapter', chapter_id, chapter_data, delta);
     }
 
-    async reorder_chapter(book_uid:UniqueId, from_pos:number, to_pos:number):Promise<boolean> {
+    async reorder_chapter(book_uid:UniqueId, from_pos:number, to_pos:number):Promise<OrderType[]> {
         return this.boundary.remote('reorder_chapter', book_uid, from_pos, to_pos);
     }
 
-    async fetch_stripped_chapters(book_uid:UniqueId):Promise<Chapter[]> {
-        return this.boundary.remote('fetch_stripped_chapters', book_uid);
+    async fetch_stripped_chapters(book_uid:UniqueId, fields:string[] | undefined = undefined):Promise<Chapter[]> {
+        return this.boundary.remote('fetch_stripped_chapters', book_uid, fields);
     }
 
-    async chapter_create(book_uid:UniqueId, new_chapter:Chapter):Promise<Chapter | undefined > {
+    async chapter_create(book_uid:UniqueId, new_chapter:Chapter):Promise<Chapter | undefined> {
         return this.boundary.remote('chapter_create', book_uid, new_chapter);
     }
 
-    async create_chapter(book_id:UniqueId, new_chapter:Chapter):Promise<Chapter | undefined > {
+    async create_chapter(book_id:UniqueId, new_chapter:Chapter):Promise<Chapter | undefined> {
         return this.boundary.remote('create_chapter', book_id, new_chapter);
     }
-
-    async fetch_scene(scene_uid:UniqueId):Promise<Scene> {
-        return this.boundary.remote('fetch_scene', scene_uid);
+/* Answers NotModified when `version` is still the scene's version */
+    async fetch_scene(scene_uid:UniqueId, fields:string[] | undefined = undefined, version:string | undefined = undefined):Promise<Scene | NotModified> {
+        return this.boundary.remote('fetch_scene', scene_uid, fields, version);
     }
 
     async fetch_scene_markedup(scene_uid:UniqueId):Promise<string> {
@@ -126,33 +154,41 @@ class APIBridge {
         return this.boundary.remote('scene_handle_markdown', scene_uid, raw_text);
     }
 
-    async update_scene(scene_uid:UniqueId, new_data:Scene) {
-        return this.boundary.remote('update_scene', scene_uid, new_data);
+    async update_scene(scene_uid:UniqueId, new_data:Scene, delta:boolean = false):Promise<[Scene, Chapter] | Delta> {
+        return this.boundary.remote('update_scene', scene_uid, new_data, delta);
     }
 
-    async create_scene(chapter_id:UniqueId, title:string, position:number = -1) {
-        return this.boundary.remote('create_scene', chapter_id, title, position);
+    async create_scene(chapter_id:UniqueId, title:string, position:number = -1, delta:boolean = false):Promise<[Scene, Chapter] | Delta> {
+        return this.boundary.remote('create_scene', chapter_id, title, position, delta);
     }
 
-    async delete_scene(chapter_uid:UniqueId, scene_uid:UniqueId):Promise<boolean> {
-        return this.boundary.remote('delete_scene', chapter_uid, scene_uid);
+    async delete_scene(chapter_uid:UniqueId, scene_uid:UniqueId, delta:boolean = false):Promise<boolean | Delta> {
+        return this.boundary.remote('delete_scene', chapter_uid, scene_uid, delta);
     }
 
-    async reorder_scene(chapterId:string, from_pos:number, to_pos:number) {
+    async reorder_scene(chapterId:string, from_pos:number, to_pos:number):Promise<OrderType[]> {
         return this.boundary.remote('reorder_scene', chapterId, from_pos, to_pos);
     }
 
-    async reorder_scenes(new_order:Scene[]):Promise<Chapter> {
+    async reorder_scenes(new_order:Scene[]):Promise<OrderType[]> {
         return this.boundary.remote('reorder_scenes', new_order);
     }
 
-    async attach_scene_status2scene(scene_uid:UniqueId, status_uid:UniqueId):Promise<boolean> {
-        return this.boundary.remote('attach_scene_status2scene', scene_uid, status_uid);
+    async attach_scene_status2scene(scene_uid:UniqueId, status_uid:UniqueId, delta:boolean = false):Promise<boolean | Delta> {
+        return this.boundary.remote('attach_scene_status2scene', scene_uid, status_uid, delta);
     }
 
     async list_all_characters(book_uid:UniqueId):Promise<Character[]> {
         return this.boundary.remote('list_all_characters', book_uid);
     }
+/* The book's scene statuses and characters by id
+
+Scene payloads refer to these through `status_id` and `character_ids`,
+ask for those fields instead of `status` and `characters` to get each
+one once per book rather than once per scene. */
+    async fetch_book_references(book_uid:UniqueId):Promise<BookReferences> {
+        return this.boundary.remote('fetch_book_references', book_uid);
+    }
 
     async list_characters_by_scene(scene_uid:UniqueId):Promise<Character[]> {
         return this.boundary.remote('list_characters_by_scene', scene_uid);
@@ -162,16 +198,16 @@ class APIBridge {
         return this.boundary.remote('search_characters', query);
     }
 
-    async add_character_to_scene(scene_uid:UniqueId, toon_uid:UniqueId):Promise<Scene> {
-        return this.boundary.remote('add_character_to_scene', scene_uid, toon_uid);
+    async add_character_to_scene(scene_uid:UniqueId, toon_uid:UniqueId, delta:boolean = false):Promise<Scene | Delta> {
+        return this.boundary.remote('add_character_to_scene', scene_uid, toon_uid, delta);
     }
 
-    async remove_character_from_scene(character_uid:UniqueId, scene_uid:UniqueId):Promise<boolean> {
-        return this.boundary.remote('remove_character_from_scene', character_uid, scene_uid);
+    async remove_character_from_scene(character_uid:UniqueId, scene_uid:UniqueId, delta:boolean = false):Promise<boolean | Delta> {
+        return this.boundary.remote('remove_character_from_scene', character_uid, scene_uid, delta);
     }
 
-    async create_new_character_to_scene(book_uid:UniqueId, scene_uid:UniqueId, new_name:string):Promise<Scene> {
-        return this.boundary.remote('create_new_character_to_scene', book_uid, scene_uid, new_name);
+    async create_new_character_to_scene(book_uid:UniqueId, scene_uid:UniqueId, new_name:string, delta:boolean = false):Promise<Scene | Delta> {
+        return this.boundary.remote('create_new_character_to_scene', book_uid, scene_uid, new_name, delta);
     }
 
     async fetch_character(book_uid:UniqueId, character_uid:UniqueId):Promise<Character> {
@@ -198,7 +234,7 @@ class APIBridge {
         return this.boundary.remote('setSetting', name, value);
     }
 
-    async bulk_update_settings(changeset:any) {
+    async bulk_update_settings(changeset:Record<string, Setting>) {
         return this.boundary.remote('bulk_update_settings', changeset);
     }
 
@@ -231,7 +267,7 @@ TODO verify this cascades
 
 :param status_uid:
 :return: */
-    async delete_scene_status(status_uid:UniqueId) {
+    async delete_scene_status(status_uid:UniqueId):Promise<void> {
         return this.boundary.remote('delete_scene_status', status_uid);
     }
 
@@ -250,18 +286,72 @@ TODO verify this cascades
     async importer_find_source(optional_dir:string | undefined):Promise<string> {
         return this.boundary.remote('importer_find_source', optional_dir);
     }
+/* The documents in `filepath`, straight from the directory listing
 
+Word counts are left out, see `importer_preview_files`. */
     async importer_list_files(filepath:string):Promise<ImportedBook> {
         return this.boundary.remote('importer_list_files', filepath);
     }
-
-    async importer_process_batch(reporterId:string) {
+/* Count the words in each document, reported one at a time to `reporterId` */
+    async importer_preview_files(documents:DocumentFile[], reporterId:string):Promise<UniqueId> {
+        return this.boundary.remote('importer_preview_files', documents, reporterId);
+    }
+/* Start importing the current batch, returns the job's id */
+    async importer_process_batch(reporterId:string):Promise<UniqueId> {
         return this.boundary.remote('importer_process_batch', reporterId);
     }
 
-    async importer_reimport_chapter(chapterUid:UniqueId):Promise<boolean> {
+    async importer_reimport_chapter(chapterUid:UniqueId):Promise<UniqueId> {
         return this.boundary.remote('importer_reimport_chapter', chapterUid);
     }
+/* Forget every cached parse, returns how many were dropped */
+    async importer_purge_cache():Promise<number> {
+        return this.boundary.remote('importer_purge_cache', );
+    }
+/* What changed in the book's source directory, without touching anything */
+    async importer_scan_book(bookUid:UniqueId):Promise<SyncReport> {
+        return this.boundary.remote('importer_scan_book', bookUid);
+    }
+/* Scan and start reimport jobs for the modified chapters */
+    async importer_sync_book(bookUid:UniqueId):Promise<SyncReport> {
+        return this.boundary.remote('importer_sync_book', bookUid);
+    }
+/* Keep syncing the book, each change is reported to `reporterId` */
+    async importer_watch_book(bookUid:UniqueId, reporterId:string):Promise<boolean> {
+        return this.boundary.remote('importer_watch_book', bookUid, reporterId);
+    }
+
+    async importer_unwatch_book(bookUid:UniqueId):Promise<boolean> {
+        return this.boundary.remote('importer_unwatch_book', bookUid);
+    }
+
+    async job_status(job_uid:UniqueId):Promise<JobType> {
+        return this.boundary.remote('job_status', job_uid);
+    }
+
+    async job_list(active_only:boolean = false):Promise<JobType[]> {
+        return this.boundary.remote('job_list', active_only);
+    }
+
+    async job_cancel(job_uid:UniqueId):Promise<boolean> {
+        return this.boundary.remote('job_cancel', job_uid);
+    }
+
+    async job_resume(job_uid:UniqueId):Promise<UniqueId> {
+        return this.boundary.remote('job_resume', job_uid);
+    }
+
+    async job_cleanup(job_uid:UniqueId):Promise<boolean> {
+        return this.boundary.remote('job_cleanup', job_uid);
+    }
+
+    async database_optimize():Promise<UniqueId> {
+        return this.boundary.remote('database_optimize', );
+    }
+
+    async response_cache_stats():Promise<CacheStats> {
+        return this.boundary.remote('response_cache_stats', );
+    }
 
     async debug_long_task(callbackId:string) {
         return this.boundary.remote('debug_long_task', callbackId);
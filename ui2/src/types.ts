@@ -16,6 +16,7 @@ export interface Setting {
 
 export interface Base {
     id: UniqueId
+    version?: string
     created_on?: string
     updated_on?: string
 }
@@ -41,6 +42,7 @@ export interface SceneIndex extends Base {
     order: number
     words: number
     status: SceneStatus
+    status_id?: UniqueId | null
 }
 
 export interface Scene extends SceneIndex {
@@ -50,6 +52,7 @@ export interface Scene extends SceneIndex {
     notes: string
     location: string
     characters: Character[]
+    character_ids?: UniqueId[]
 }
 
 export interface ChapterIndex extends Base {
@@ -174,3 +177,79 @@ export interface SceneFormValues {
     characters: Character[]
     location: string
 }
+
+export interface OrderType {
+    id: UniqueId
+    order: number
+}
+
+export interface NotModified {
+    type: 'not_modified'
+    version: string
+}
+
+export interface Delta {
+    book?: Partial<Book>
+    chapter?: Partial<Chapter>
+    scene?: Partial<Scene>
+    orders?: OrderType[]
+}
+
+export interface JobType {
+    id: UniqueId
+    kind: string
+    status: 'pending' | 'running' | 'done' | 'failed' | 'cancelled' | 'interrupted'
+    message: string
+    bytes_total: number
+    bytes_done: number
+    progress: number
+    eta?: number
+    result: unknown
+    error?: string
+    created_on: string
+    finished_on?: string
+}
+
+export interface ReimportChangeset {
+    chapter_id: UniqueId
+    added: UniqueId[]
+    updated: UniqueId[]
+    removed: UniqueId[]
+    moved: UniqueId[]
+    unchanged: number
+}
+
+export interface SyncReport {
+    book_id: UniqueId
+    import_dir: string
+    new: string[]
+    removed: UniqueId[]
+    modified: UniqueId[]
+    unchanged: number
+    jobs: UniqueId[]
+}
+
+export interface DocumentPreview {
+    action: 'preview'
+    name: string
+    path: string
+    words: number
+    paragraphs: number
+    pages?: number
+    source: 'metadata' | 'scan'
+}
+
+export interface CacheStats {
+    entries: number
+    max_entries: number
+    hits: number
+    misses: number
+    evictions: number
+    invalidations: number
+}
+
+export interface BookReferences {
+    book_id: UniqueId
+    statuses: Record<UniqueId, SceneStatus>
+    characters: Record<UniqueId, Character>
+}